@@ -0,0 +1,292 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Agendador de E/S com limites de taxa e classes de prioridade.
+
+Varreduras completas em servidores de produção competem pelos discos com os serviços
+da máquina. O agendador limita operações por segundo e bytes por segundo com baldes
+de tokens e atende primeiro as ações interativas da interface: elas nunca esperam,
+mas consomem o orçamento, de modo que as classes inferiores recuam enquanto houver
+demanda interativa.
+
+Inclui:
+- `Prioridade`: INTERATIVA > NORMAL > SEGUNDO_PLANO.
+- `BaldeTokens`: balde de tokens com taxa ajustável.
+- `AgendadorIO`: controle de admissão, modo adaptativo pela latência de `stat` e
+  adaptadores para varreduras (`limitar`) e cópias (`como_progresso`).
+
+Usado por `varrer_paralelo` (cada processo recebe uma fração dos limites, via
+`configuracao()`), `processar_lote`, `buscar_conteudo` e pelo `ScanDaemon`.
+"""
+
+from contextlib import contextmanager
+from enum import IntEnum
+import os
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+# Mesmo formato de `path_transfer.Progresso`: (destino, bytes copiados, total).
+Progresso = Callable[[str, int, int], None]
+
+# Fatores do modo adaptativo (aumento aditivo, redução multiplicativa).
+FATOR_REDUCAO = 0.5
+FRACAO_AUMENTO = 0.05
+PESO_MEDIA = 0.2
+INTERVALO_AJUSTE = 0.1
+
+
+class Prioridade(IntEnum):
+    """
+    Classes de prioridade do agendador (menor valor = maior prioridade).
+
+    Valores possíveis:
+        - INTERATIVA: Leituras disparadas pela interface; nunca aguardam.
+        - NORMAL: Operações explícitas do usuário (cópias, movimentações).
+        - SEGUNDO_PLANO: Varreduras, hashing e pré-carregamento.
+    """
+
+    INTERATIVA = 0
+    NORMAL = 1
+    SEGUNDO_PLANO = 2
+
+
+class BaldeTokens:
+    """
+    Balde de tokens: acumula `taxa` tokens por segundo até `capacidade`.
+
+    O saldo pode ficar negativo (consumo forçado), e o débito é pago pelas próximas
+    reservas.
+
+    Atributos:
+        taxa (float): Tokens repostos por segundo.
+        capacidade (float): Saldo máximo acumulado (rajada).
+    """
+
+    def __init__(
+        self,
+        taxa: float,
+        capacidade: Optional[float] = None,
+        relogio: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if taxa <= 0:
+            raise ValueError("A taxa deve ser positiva")
+        self.taxa = taxa
+        self.capacidade = capacidade if capacidade is not None else taxa
+        self._relogio = relogio
+        self._saldo = self.capacidade
+        self._atualizado = relogio()
+
+    def _repor(self) -> None:
+        agora = self._relogio()
+        self._saldo = min(self.capacidade, self._saldo + (agora - self._atualizado) * self.taxa)
+        self._atualizado = agora
+
+    def espera(self, quantidade: float) -> float:
+        """Segundos até haver saldo para `quantidade` tokens (0 se já houver)."""
+        self._repor()
+        # Pedidos maiores que a capacidade são atendidos com o balde cheio.
+        necessario = min(quantidade, self.capacidade)
+        return max(0.0, (necessario - self._saldo) / self.taxa)
+
+    def consumir(self, quantidade: float) -> None:
+        self._repor()
+        self._saldo -= quantidade
+
+
+class AgendadorIO:
+    """
+    Controle de admissão de operações de E/S por prioridade.
+
+    Sem limites configurados, o agendador apenas mede latências e não bloqueia.
+
+    Atributos:
+        ops_por_segundo (float | None): Limite configurado de operações por segundo.
+        bytes_por_segundo (float | None): Limite de bytes por segundo.
+        adaptativo (bool): Reduz o limite de operações quando a latência de `stat` sobe.
+        latencia_alvo (float): Latência média (segundos) acima da qual o modo
+            adaptativo recua.
+        latencia_media (float): Média móvel exponencial das latências observadas.
+        intervalo_ajuste (float): Segundos mínimos entre dois ajustes do modo adaptativo.
+    """
+
+    def __init__(
+        self,
+        ops_por_segundo: Optional[float] = None,
+        bytes_por_segundo: Optional[float] = None,
+        adaptativo: bool = False,
+        latencia_alvo: float = 0.005,
+        ops_minimas: float = 10.0,
+        intervalo_ajuste: float = INTERVALO_AJUSTE,
+        relogio: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ops_por_segundo = ops_por_segundo
+        self.bytes_por_segundo = bytes_por_segundo
+        self.adaptativo = adaptativo
+        self.latencia_alvo = latencia_alvo
+        self.latencia_media = 0.0
+        self.intervalo_ajuste = intervalo_ajuste
+        self._ops_minimas = ops_minimas
+        self._relogio = relogio
+        self._ultimo_ajuste = relogio()
+        self._ops = BaldeTokens(ops_por_segundo, relogio=relogio) if ops_por_segundo else None
+        self._bytes = (
+            BaldeTokens(bytes_por_segundo, relogio=relogio) if bytes_por_segundo else None
+        )
+        self._condicao = threading.Condition()
+        self._aguardando = [0] * len(Prioridade)
+
+    @property
+    def taxa_ops(self) -> Optional[float]:
+        """Taxa de operações em vigor (pode estar reduzida pelo modo adaptativo)."""
+        return self._ops.taxa if self._ops else None
+
+    def configuracao(self, partes: int = 1) -> dict[str, Any]:
+        """
+        Parâmetros para recriar o agendador em outro processo.
+
+        Os limites são divididos entre `partes` agendadores (ex.: um por processo de
+        varredura), de modo que a soma respeite o orçamento deste.
+        """
+        return {
+            "ops_por_segundo": self.taxa_ops / partes if self.taxa_ops else None,
+            "bytes_por_segundo": (
+                self.bytes_por_segundo / partes if self.bytes_por_segundo else None
+            ),
+            "adaptativo": self.adaptativo,
+            "latencia_alvo": self.latencia_alvo,
+            "ops_minimas": self._ops_minimas / partes,
+            "intervalo_ajuste": self.intervalo_ajuste,
+        }
+
+    # === ADMISSÃO ===
+
+    def _espera(self, prioridade: Prioridade, operacoes: int, tamanho: int) -> float:
+        if any(self._aguardando[: prioridade.value]):
+            return 0.05  # Cede a vez às classes de maior prioridade.
+        espera = 0.0
+        if self._ops and operacoes:
+            espera = max(espera, self._ops.espera(operacoes))
+        if self._bytes and tamanho:
+            espera = max(espera, self._bytes.espera(tamanho))
+        return espera
+
+    def adquirir(
+        self, prioridade: Prioridade = Prioridade.NORMAL, operacoes: int = 1, tamanho: int = 0
+    ) -> None:
+        """
+        Bloqueia até a operação caber no orçamento da sua classe.
+
+        Args:
+            prioridade (Prioridade): Classe da operação.
+            operacoes (int): Quantidade de operações (syscalls) consumidas.
+            tamanho (int): Bytes transferidos pela operação.
+        """
+        with self._condicao:
+            if prioridade != Prioridade.INTERATIVA:
+                self._aguardando[prioridade.value] += 1
+                try:
+                    while (espera := self._espera(prioridade, operacoes, tamanho)) > 0:
+                        self._condicao.wait(espera)
+                finally:
+                    self._aguardando[prioridade.value] -= 1
+            if self._ops and operacoes:
+                self._ops.consumir(operacoes)
+            if self._bytes and tamanho:
+                self._bytes.consumir(tamanho)
+            self._condicao.notify_all()
+
+    @contextmanager
+    def operacao(
+        self, prioridade: Prioridade = Prioridade.NORMAL, tamanho: int = 0
+    ) -> Iterator[None]:
+        """Admite uma operação e registra sua latência ao final."""
+        self.adquirir(prioridade, 1, tamanho)
+        inicio = time.perf_counter()
+        yield
+        self.registrar_latencia(time.perf_counter() - inicio)
+
+    # === MODO ADAPTATIVO ===
+
+    def registrar_latencia(self, segundos: float) -> None:
+        """
+        Atualiza a média de latência e, no modo adaptativo, ajusta a taxa de operações.
+
+        A média é atualizada a cada amostra, mas a taxa é ajustada no máximo uma vez
+        por `intervalo_ajuste`: acima de `latencia_alvo` ela cai pela metade (até
+        `ops_minimas`); abaixo dela, volta a crescer aos poucos até o limite configurado.
+        """
+        with self._condicao:
+            self.latencia_media += PESO_MEDIA * (segundos - self.latencia_media)
+            if not (self.adaptativo and self._ops and self.ops_por_segundo):
+                return
+            agora = self._relogio()
+            if agora - self._ultimo_ajuste < self.intervalo_ajuste:
+                return
+            self._ultimo_ajuste = agora
+            if self.latencia_media > self.latencia_alvo:
+                taxa = max(self._ops_minimas, self._ops.taxa * FATOR_REDUCAO)
+            else:
+                taxa = min(
+                    self.ops_por_segundo,
+                    self._ops.taxa + self.ops_por_segundo * FRACAO_AUMENTO,
+                )
+            self._ops.taxa = taxa
+            self._ops.capacidade = taxa
+
+    # === ADAPTADORES ===
+
+    def stat(
+        self, caminho: Union[str, os.PathLike], prioridade: Prioridade = Prioridade.NORMAL
+    ) -> os.stat_result:
+        """`os.stat` admitido pelo agendador; sua latência alimenta o modo adaptativo."""
+        with self.operacao(prioridade):
+            return os.stat(caminho)
+
+    def limitar(
+        self, itens: Iterable[T], prioridade: Prioridade = Prioridade.SEGUNDO_PLANO
+    ) -> Iterator[T]:
+        """
+        Limita o ritmo de um gerador de varredura (uma operação por item).
+
+        Cada item é admitido antes de ser consumido. A latência do modo adaptativo
+        deve ser medida onde as chamadas de sistema acontecem, pois o gerador pode
+        fazê-las em lote (um diretório inteiro no primeiro item).
+
+        Ex.: `agendador.limitar(varrer_registros(raiz, medir=agendador.registrar_latencia))`.
+        """
+        for item in itens:
+            self.adquirir(prioridade)
+            yield item
+
+    def como_progresso(
+        self,
+        prioridade: Prioridade = Prioridade.NORMAL,
+        progresso: Optional[Progresso] = None,
+    ) -> Progresso:
+        """
+        Cria um callback de progresso que limita os bytes/s de `copiar_arquivo` e
+        `processar_lote`, repassando as chamadas para `progresso`.
+
+        A primeira chamada de cada destino informa apenas o ponto de partida (o
+        deslocamento de uma cópia retomada) e não é cobrada; as seguintes cobram só
+        os bytes copiados desde a chamada anterior.
+        """
+        copiados: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def limitar_copia(destino: str, posicao: int, total: int) -> None:
+            with lock:
+                anterior = copiados.get(destino, posicao)
+                if posicao >= total:
+                    copiados.pop(destino, None)
+                else:
+                    copiados[destino] = posicao
+            if posicao > anterior:
+                self.adquirir(prioridade, 0, posicao - anterior)
+            if progresso:
+                progresso(destino, posicao, total)
+
+        return limitar_copia
@@ -0,0 +1,365 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Arquivos zip e tar como diretórios virtuais navegáveis.
+
+Um arquivo compactado deixa de ser um `PathType.FILE` opaco: seus membros são expostos
+como `CaminhoModel` com caminhos virtuais (`/dados/pacote.zip/pasta/arquivo.txt`), e um
+membro pode ser lido em streaming sem extrair o restante.
+
+- Zip: apenas o diretório central (no fim do arquivo) é lido para montar o índice.
+- Tar: o arquivo é percorrido uma única vez; o índice guarda os `TarInfo` com os
+  deslocamentos dos dados e fica em cache por (dispositivo, inode, mtime).
+
+Inclui:
+- `ArquivoVirtual`: índice de um arquivo com `listar()`, `info()`, `abrir()`, `ler()`
+  e `extrair_membro()`.
+- `abrir_arquivo_virtual()`: obtém o índice do cache ou o constrói.
+- `dividir_caminho_virtual()` / `listar_caminho_virtual()`: navegação por caminhos
+  que atravessam um arquivo compactado.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+import datetime
+import os
+from pathlib import Path
+import posixpath
+import shutil
+import tarfile
+import threading
+from typing import IO, Iterator, Optional, Union
+import zipfile
+
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import (
+    PathNotFoundError,
+    PathOperationError,
+    PathStatus,
+    PathType,
+)
+from tools.path_resolver import resolver_caminho
+
+MAX_INDICES = 16
+
+
+@dataclass
+class _Membro:
+    tipo: PathType
+    tamanho: int
+    modificado: float
+    referencia: Union[zipfile.ZipInfo, tarfile.TarInfo, None] = None
+
+
+def _normalizar(nome: str) -> Optional[str]:
+    """Normaliza o nome de um membro; descarta nomes que escapam da raiz do arquivo."""
+    normalizado = posixpath.normpath("/" + nome.replace("\\", "/")).lstrip("/")
+    if normalizado in ("", "."):
+        return None
+    return normalizado
+
+
+class ArquivoVirtual:
+    """
+    Índice navegável de um arquivo zip ou tar.
+
+    Atributos:
+        caminho (str): Caminho do arquivo compactado no disco.
+        formato (str): "zip" ou "tar".
+    """
+
+    def __init__(self, caminho: Union[str, Path]) -> None:
+        self.caminho = str(resolver_caminho(caminho))
+        self._membros: dict[str, _Membro] = {}
+        self._filhos: dict[str, dict[str, None]] = {"": {}}
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._lock = threading.Lock()
+
+        try:
+            if zipfile.is_zipfile(self.caminho):
+                self.formato = "zip"
+                self._indexar_zip()
+            elif tarfile.is_tarfile(self.caminho):
+                self.formato = "tar"
+                self._indexar_tar()
+            else:
+                raise PathOperationError(self.caminho, "Formato de arquivo não suportado")
+        except FileNotFoundError as e:
+            raise PathNotFoundError(self.caminho) from e
+        except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+            raise PathOperationError(self.caminho, f"Erro ao indexar arquivo: {e}") from e
+
+    # === INDEXAÇÃO ===
+
+    def _registrar(self, nome: str, membro: _Membro) -> None:
+        self._membros[nome] = membro
+        filho = nome
+        pai = posixpath.dirname(filho)
+        while True:
+            irmaos = self._filhos.setdefault(pai, {})
+            if filho in irmaos:
+                break
+            irmaos[filho] = None
+            if pai == "":
+                break
+            # Diretórios implícitos (ausentes do arquivo, mas presentes nos caminhos).
+            if pai not in self._membros:
+                self._membros[pai] = _Membro(PathType.DIRECTORY, 0, membro.modificado)
+            filho, pai = pai, posixpath.dirname(pai)
+        if membro.tipo == PathType.DIRECTORY:
+            self._filhos.setdefault(nome, {})
+
+    def _indexar_zip(self) -> None:
+        # `ZipFile` lê somente o diretório central; o handle fica aberto para as leituras.
+        self._zip = zipfile.ZipFile(self.caminho)  # pylint: disable=consider-using-with
+        for info in self._zip.infolist():
+            nome = _normalizar(info.filename)
+            if nome is None:
+                continue
+            tipo = PathType.DIRECTORY if info.is_dir() else PathType.FILE
+            # Links simbólicos criados no Unix guardam S_IFLNK nos atributos externos.
+            modo = info.external_attr >> 16
+            if modo and PathType.from_mode(modo) == PathType.SYMLINK:
+                tipo = PathType.SYMLINK
+            try:
+                modificado = datetime.datetime(*info.date_time).timestamp()
+            except ValueError:
+                # Data DOS zerada (mês/dia 0), comum em zips gerados por ferramentas.
+                modificado = 0.0
+            self._registrar(nome, _Membro(tipo, info.file_size, modificado, info))
+
+    def _indexar_tar(self) -> None:
+        with tarfile.open(self.caminho) as tar:
+            for info in tar:
+                nome = _normalizar(info.name)
+                if nome is None:
+                    continue
+                if info.isdir():
+                    tipo = PathType.DIRECTORY
+                elif info.issym():
+                    tipo = PathType.SYMLINK
+                elif info.isfile() or info.islnk():
+                    tipo = PathType.FILE
+                else:
+                    tipo = PathType.UNKNOWN
+                self._registrar(nome, _Membro(tipo, info.size, float(info.mtime), info))
+
+    # === CONSULTA ===
+
+    def _membro(self, nome: str) -> tuple[str, _Membro]:
+        normalizado = _normalizar(nome) or ""
+        if normalizado == "":
+            return "", _Membro(PathType.DIRECTORY, 0, os.path.getmtime(self.caminho))
+        membro = self._membros.get(normalizado)
+        if membro is None:
+            raise PathNotFoundError(os.path.join(self.caminho, normalizado))
+        return normalizado, membro
+
+    def _modelo(self, nome: str, membro: _Membro) -> CaminhoModel:
+        return CaminhoModel(
+            nome=posixpath.basename(nome),
+            tipo=membro.tipo,
+            caminho=os.path.join(self.caminho, *nome.split("/")),
+            status=PathStatus.EXISTS,
+            tamanho=membro.tamanho,
+            modificado=membro.modificado,
+        )
+
+    def info(self, membro: str) -> CaminhoModel:
+        nome, dados = self._membro(membro)
+        if nome == "":
+            return CaminhoModel.from_path(self.caminho)
+        return self._modelo(nome, dados)
+
+    def listar(self, diretorio: str = "") -> list[CaminhoModel]:
+        """
+        Lista os filhos diretos de um diretório do arquivo.
+
+        Raises:
+            PathNotFoundError: Se o diretório não existir no arquivo.
+            PathOperationError: Se o membro não for um diretório.
+        """
+        nome, membro = self._membro(diretorio)
+        if membro.tipo != PathType.DIRECTORY:
+            raise PathOperationError(
+                os.path.join(self.caminho, nome), "Membro não é um diretório"
+            )
+        return [self._modelo(filho, self._membros[filho]) for filho in self._filhos.get(nome, {})]
+
+    def __len__(self) -> int:
+        return len(self._membros)
+
+    def __iter__(self) -> Iterator[CaminhoModel]:
+        for nome, membro in self._membros.items():
+            yield self._modelo(nome, membro)
+
+    # === LEITURA ===
+
+    def _alvo(self, nome: str, membro: _Membro) -> _Membro:
+        """Resolve links de tar (simbólicos e físicos) para o membro com os dados."""
+        for _ in range(32):
+            info = membro.referencia
+            if not isinstance(info, tarfile.TarInfo) or not (info.issym() or info.islnk()):
+                return membro
+            base = posixpath.dirname(nome) if info.issym() else ""
+            nome = _normalizar(posixpath.join(base, info.linkname)) or ""
+            encontrado = self._membros.get(nome)
+            if encontrado is None:
+                raise PathNotFoundError(os.path.join(self.caminho, nome))
+            membro = encontrado
+        raise PathOperationError(self.caminho, "Links em ciclo no arquivo")
+
+    @contextmanager
+    def abrir(self, membro: str) -> Iterator[IO[bytes]]:
+        """
+        Abre um membro para leitura em streaming, sem extrair o restante do arquivo.
+
+        Em zips, o handle fechado por `fechar()` (ex.: índice descartado do cache) é
+        reaberto aqui; membros já abertos continuam legíveis.
+
+        Raises:
+            PathNotFoundError: Se o membro não existir.
+            PathOperationError: Se o membro não for um arquivo.
+        """
+        nome, dados = self._membro(membro)
+        dados = self._alvo(nome, dados)
+        if dados.tipo != PathType.FILE or dados.referencia is None:
+            raise PathOperationError(os.path.join(self.caminho, nome), "Membro não é um arquivo")
+
+        if isinstance(dados.referencia, zipfile.ZipInfo):
+            try:
+                with self._lock:
+                    if self._zip is None:
+                        self._zip = zipfile.ZipFile(  # pylint: disable=consider-using-with
+                            self.caminho
+                        )
+                    arquivo = self._zip.open(dados.referencia)
+            except (OSError, ValueError, zipfile.BadZipFile) as e:
+                raise PathOperationError(
+                    os.path.join(self.caminho, nome), f"Erro ao abrir membro: {e}"
+                ) from e
+            with arquivo:
+                yield arquivo
+            return
+
+        # Um `TarFile` novo por leitura: abrir lê só o primeiro cabeçalho, e o `TarInfo`
+        # indexado já aponta para o deslocamento dos dados.
+        with tarfile.open(self.caminho) as tar:
+            extraido = tar.extractfile(dados.referencia)
+            if extraido is None:
+                raise PathOperationError(os.path.join(self.caminho, nome), "Membro sem dados")
+            with extraido:
+                yield extraido
+
+    def ler(self, membro: str, tamanho: int = -1) -> bytes:
+        """Lê um membro (ou apenas os primeiros `tamanho` bytes, para pré-visualização)."""
+        with self.abrir(membro) as arquivo:
+            return arquivo.read(tamanho)
+
+    def extrair_membro(self, membro: str, destino: Union[str, Path]) -> CaminhoModel:
+        """Copia um único membro para `destino` em blocos."""
+        caminho_destino = resolver_caminho(destino)
+        try:
+            with self.abrir(membro) as origem, open(caminho_destino, "wb") as saida:
+                shutil.copyfileobj(origem, saida)
+        except OSError as e:
+            raise PathOperationError(str(caminho_destino), f"Erro ao extrair membro: {e}") from e
+        modelo = CaminhoModel.from_path(caminho_destino)
+        modelo.status = PathStatus.CREATED
+        return modelo
+
+    def fechar(self) -> None:
+        """Libera o handle do zip; `abrir()` o reabre se o índice voltar a ser usado."""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
+
+# === CACHE DE ÍNDICES ===
+
+_indices: "OrderedDict[tuple[int, int, int], ArquivoVirtual]" = OrderedDict()
+_lock_indices = threading.Lock()
+
+
+def abrir_arquivo_virtual(caminho: Union[str, Path]) -> ArquivoVirtual:
+    """
+    Retorna o índice do arquivo, reaproveitando-o enquanto inode e mtime não mudarem.
+
+    Raises:
+        PathNotFoundError: Se o arquivo não existir.
+        PathOperationError: Se não for um zip/tar válido.
+    """
+    try:
+        info = os.stat(resolver_caminho(caminho))
+    except OSError as e:
+        raise PathNotFoundError(str(caminho)) from e
+    chave = (info.st_dev, info.st_ino, info.st_mtime_ns)
+    with _lock_indices:
+        indice = _indices.get(chave)
+        if indice is not None:
+            _indices.move_to_end(chave)
+            return indice
+    indice = ArquivoVirtual(caminho)
+    descartados = []
+    with _lock_indices:
+        existente = _indices.get(chave)
+        if existente is not None:
+            # Outra thread indexou o mesmo arquivo enquanto este índice era montado.
+            descartados.append(indice)
+            indice = existente
+        else:
+            _indices[chave] = indice
+        while len(_indices) > MAX_INDICES:
+            descartados.append(_indices.popitem(last=False)[1])
+    # Índices de zip mantêm o arquivo aberto: fechados ao sair do cache.
+    for descartado in descartados:
+        descartado.fechar()
+    return indice
+
+
+def eh_arquivo_compactado(caminho: Union[str, Path]) -> bool:
+    """Indica se `caminho` é um arquivo zip ou tar navegável."""
+    try:
+        return os.path.isfile(caminho) and (
+            zipfile.is_zipfile(caminho) or tarfile.is_tarfile(caminho)
+        )
+    except OSError:
+        return False
+
+
+def dividir_caminho_virtual(caminho: Union[str, Path]) -> Optional[tuple[str, str]]:
+    """
+    Separa um caminho virtual em (arquivo compactado, membro).
+
+    Ex.: "/dados/pacote.zip/pasta/a.txt" -> ("/dados/pacote.zip", "pasta/a.txt").
+
+    Returns:
+        tuple[str, str] | None: None se nenhum ancestral for um arquivo compactado.
+    """
+    atual = resolver_caminho(caminho)
+    partes: list[str] = []
+    while True:
+        if atual.is_file():
+            if not eh_arquivo_compactado(atual):
+                return None
+            return str(atual), "/".join(reversed(partes))
+        if atual.exists() or atual.parent == atual:
+            return None
+        partes.append(atual.name)
+        atual = atual.parent
+
+
+def listar_caminho_virtual(caminho: Union[str, Path]) -> list[CaminhoModel]:
+    """
+    Lista um arquivo compactado (ou um diretório dentro dele) como diretório.
+
+    Raises:
+        PathNotFoundError: Se o caminho não atravessar um arquivo compactado.
+    """
+    dividido = dividir_caminho_virtual(caminho)
+    if dividido is None:
+        raise PathNotFoundError(str(caminho))
+    arquivo, membro = dividido
+    return abrir_arquivo_virtual(arquivo).listar(membro)
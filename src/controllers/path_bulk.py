@@ -0,0 +1,291 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Operações em massa sobre diretórios: criação de vários caminhos e remoção de árvores.
+
+Inclui:
+- `criar_diretorios()`: cria vários diretórios criando cada pai compartilhado uma única vez.
+- `remover_arvore()`: remove uma árvore em paralelo (fila de diretórios compartilhada),
+  de baixo para cima, com operações relativas a descritores de diretório (`dir_fd`),
+  sem resolver caminhos novamente.
+- `marcar_removidos()`: atualiza um cache de `CaminhoModel` em uma única passada.
+"""
+
+import logging
+import os
+from pathlib import Path
+import queue
+import threading
+from typing import Iterable, MutableMapping, Optional, Union
+
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import (
+    PathNotFoundError,
+    PathOperationError,
+    PathStatus,
+    PathType,
+)
+from tools.path_resolver import resolver_caminho, resolver_padrao
+
+_FLAGS_DIRETORIO = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+
+# Remoção relativa a descritores exige suporte a dir_fd em open/unlink/rmdir e scandir(fd).
+_SUPORTA_DIR_FD = (
+    {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd and os.scandir in os.supports_fd
+)
+
+
+# === CRIAÇÃO EM MASSA ===
+
+
+def criar_diretorios(caminhos: Iterable[Union[str, Path]]) -> list[CaminhoModel]:
+    """
+    Cria vários diretórios, incluindo os pais ausentes.
+
+    Cada diretório-pai compartilhado é verificado e criado uma única vez, mesmo que
+    apareça na cadeia de vários caminhos pedidos.
+
+    Args:
+        caminhos (Iterable[str | Path]): Diretórios a serem criados.
+
+    Returns:
+        list[CaminhoModel]: Um modelo por caminho pedido, com status CREATED,
+        EXISTS (já existia) ou ERROR.
+    """
+    existentes: set[str] = set()
+    resultados: list[CaminhoModel] = []
+
+    for entrada in caminhos:
+        caminho = str(resolver_caminho(entrada))
+        status = PathStatus.EXISTS
+        try:
+            faltantes: list[str] = []
+            atual = caminho
+            while atual not in existentes and not os.path.isdir(atual):
+                faltantes.append(atual)
+                pai = os.path.dirname(atual)
+                if pai == atual:
+                    break
+                atual = pai
+            existentes.add(atual)
+
+            for diretorio in reversed(faltantes):
+                try:
+                    os.mkdir(diretorio)
+                except FileExistsError:
+                    if not os.path.isdir(diretorio):
+                        raise
+                existentes.add(diretorio)
+            if faltantes:
+                status = PathStatus.CREATED
+        except OSError as e:
+            logging.error(" Erro ao criar diretório -> %s (%s)", caminho, e)
+            status = PathStatus.ERROR
+
+        resultados.append(
+            CaminhoModel(
+                nome=os.path.basename(caminho),
+                tipo=PathType.ERROR if status == PathStatus.ERROR else PathType.DIRECTORY,
+                caminho=caminho,
+                status=status,
+            )
+        )
+    return resultados
+
+
+# === REMOÇÃO EM MASSA ===
+
+
+def _limpar_arquivos(fd: int) -> tuple[int, list[str]]:
+    """Remove as entradas que não são diretórios e retorna os subdiretórios encontrados."""
+    removidos = 0
+    subdiretorios: list[str] = []
+    with os.scandir(fd) as entradas:
+        for entrada in entradas:
+            if entrada.is_dir(follow_symlinks=False):
+                subdiretorios.append(entrada.name)
+            else:
+                os.unlink(entrada.name, dir_fd=fd)
+                removidos += 1
+    return removidos, subdiretorios
+
+
+class _Diretorio:
+    """Diretório na fila de remoção; `pendentes` conta os subdiretórios ainda não removidos."""
+
+    __slots__ = ("nome", "pai", "fd", "pendentes")
+
+    def __init__(self, nome: str, pai: Optional["_Diretorio"]) -> None:
+        self.nome = nome
+        self.pai = pai
+        self.fd = -1
+        self.pendentes = 0
+
+
+class _RemocaoParalela:
+    """
+    Remove uma árvore com uma fila de diretórios compartilhada pelos workers.
+
+    Cada worker abre um diretório (relativo ao descritor do pai), remove seus arquivos e
+    enfileira os subdiretórios. Quando o último filho de um diretório é removido, o
+    próprio diretório é removido, subindo até a raiz. A fila é LIFO (percurso em
+    profundidade), o que limita a quantidade de descritores abertos ao mesmo tempo.
+    """
+
+    def __init__(self, raiz: str, max_workers: int) -> None:
+        self.raiz = raiz
+        self.max_workers = max_workers
+        self.removidos = 0
+        self.erro: Optional[OSError] = None
+        self._fila: "queue.LifoQueue[Optional[_Diretorio]]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._abertos: set[int] = set()
+        self._encerrado = False
+
+    def executar(self) -> int:
+        self._fila.put(_Diretorio(self.raiz, None))
+        workers = [
+            threading.Thread(target=self._trabalhar, daemon=True) for _ in range(self.max_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        for fd in self._abertos:
+            os.close(fd)
+        if self.erro is not None:
+            raise self.erro
+        return self.removidos
+
+    def _encerrar(self, erro: Optional[OSError] = None) -> None:
+        with self._lock:
+            if self._encerrado:
+                return
+            self._encerrado = True
+            self.erro = erro
+        for _ in range(self.max_workers):
+            self._fila.put(None)
+
+    def _trabalhar(self) -> None:
+        while (diretorio := self._fila.get()) is not None:
+            if self._encerrado:
+                continue
+            try:
+                self._processar(diretorio)
+            except OSError as e:
+                self._encerrar(e)
+
+    def _processar(self, diretorio: _Diretorio) -> None:
+        if diretorio.pai is None:
+            diretorio.fd = os.open(diretorio.nome, _FLAGS_DIRETORIO)
+        else:
+            diretorio.fd = os.open(diretorio.nome, _FLAGS_DIRETORIO, dir_fd=diretorio.pai.fd)
+        with self._lock:
+            self._abertos.add(diretorio.fd)
+        removidos, subdiretorios = _limpar_arquivos(diretorio.fd)
+        with self._lock:
+            self.removidos += removidos
+            diretorio.pendentes = len(subdiretorios)
+        if not subdiretorios:
+            self._finalizar(diretorio)
+            return
+        for nome in subdiretorios:
+            self._fila.put(_Diretorio(nome, diretorio))
+
+    def _finalizar(self, diretorio: _Diretorio) -> None:
+        atual: Optional[_Diretorio] = diretorio
+        while atual is not None:
+            with self._lock:
+                self._abertos.discard(atual.fd)
+            os.close(atual.fd)
+            pai = atual.pai
+            if pai is None:
+                # A raiz é removida pelo chamador, pelo caminho.
+                self._encerrar()
+                return
+            os.rmdir(atual.nome, dir_fd=pai.fd)
+            with self._lock:
+                self.removidos += 1
+                pai.pendentes -= 1
+                concluido = pai.pendentes == 0
+            atual = pai if concluido else None
+
+
+def _remover_portavel(raiz: str) -> int:
+    removidos = 0
+    for atual, diretorios, arquivos in os.walk(raiz, topdown=False):
+        for nome in arquivos:
+            os.unlink(os.path.join(atual, nome))
+            removidos += 1
+        for nome in diretorios:
+            caminho = os.path.join(atual, nome)
+            if os.path.islink(caminho):
+                os.unlink(caminho)
+            else:
+                os.rmdir(caminho)
+            removidos += 1
+    os.rmdir(raiz)
+    return removidos + 1
+
+
+def remover_arvore(caminho: Union[str, Path], max_workers: int = 8) -> int:
+    """
+    Remove um arquivo ou uma árvore de diretórios inteira do disco.
+
+    Os diretórios de toda a árvore (não só os de primeiro nível) são distribuídos
+    entre os workers por uma fila compartilhada, de modo que uma única subárvore
+    grande também é removida em paralelo. A remoção é de baixo para cima com
+    `os.scandir(fd)`, `unlink`/`rmdir` relativos ao descritor do diretório e
+    `O_NOFOLLOW`, sem resolver o caminho completo de cada entrada.
+
+    Args:
+        caminho (str | Path): Arquivo ou diretório a remover.
+        max_workers (int): Quantidade de threads do pool.
+
+    Raises:
+        PathNotFoundError: Se o caminho não existir.
+        PathOperationError: Se ocorrer erro durante a remoção.
+
+    Returns:
+        int: Quantidade de entradas removidas (incluindo a raiz).
+    """
+    # Sem resolver o componente final: um link simbólico é removido, não o seu destino.
+    raiz = os.path.abspath(os.path.expanduser(os.fspath(caminho)))
+    if not os.path.lexists(raiz):
+        raise PathNotFoundError(str(caminho))
+
+    try:
+        if not os.path.isdir(raiz) or os.path.islink(raiz):
+            os.unlink(raiz)
+            return 1
+        if not _SUPORTA_DIR_FD:
+            return _remover_portavel(raiz)
+
+        removidos = _RemocaoParalela(raiz, max_workers).executar()
+        os.rmdir(raiz)
+        return removidos + 1
+    except OSError as e:
+        raise PathOperationError(str(caminho), f"Erro ao remover árvore: {e}") from e
+    finally:
+        resolver_padrao.invalidar(raiz)
+
+
+def marcar_removidos(cache: MutableMapping[str, CaminhoModel], raiz: Union[str, Path]) -> int:
+    """
+    Marca como DELETED, em uma única passada, todas as entradas do cache sob `raiz`.
+
+    Args:
+        cache (MutableMapping[str, CaminhoModel]): Cache indexado pelo caminho absoluto.
+        raiz (str | Path): Raiz removida.
+
+    Returns:
+        int: Quantidade de entradas atualizadas.
+    """
+    base = str(resolver_caminho(raiz))
+    prefixo = base.rstrip(os.sep) + os.sep
+    atualizados = 0
+    for chave, modelo in cache.items():
+        if chave == base or chave.startswith(prefixo):
+            modelo.status = PathStatus.DELETED
+            atualizados += 1
+    return atualizados
@@ -0,0 +1,277 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Classificação do conteúdo de arquivos por assinatura (magic bytes).
+
+O tipo da entrada (arquivo, diretório, link, FIFO, socket, dispositivo) vem do
+`st_mode` via `PathType.from_mode`. Para arquivos regulares, o primeiro bloco é
+comparado com uma tabela de assinaturas conhecidas e o tipo MIME resultante é
+gravado em `CaminhoModel.tipo_conteudo`.
+
+Inclui:
+- `detectar_tipo_conteudo()`: detecção a partir dos primeiros bytes.
+- `CacheTipoConteudo`: cache por (dispositivo, inode, mtime), nunca recalcula
+  arquivos inalterados.
+- `ClassificadorConteudo`: classificação em segundo plano com pool de threads.
+- `IndiceTipoConteudo`: índice tipo MIME -> caminhos, filtrável por prefixo.
+"""
+
+import codecs
+from collections import defaultdict, deque
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Callable, Iterable, Iterator, Optional
+
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathType
+
+TAMANHO_AMOSTRA = 4096
+
+TIPO_VAZIO = "application/x-empty"
+TIPO_BINARIO = "application/octet-stream"
+TIPO_TEXTO = "text/plain"
+
+# (deslocamento, assinatura, tipo MIME) — verificadas na ordem.
+ASSINATURAS: list[tuple[int, bytes, str]] = [
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (0, b"PK\x03\x04", "application/zip"),
+    (0, b"PK\x05\x06", "application/zip"),
+    (0, b"\x1f\x8b", "application/gzip"),
+    (0, b"BZh", "application/x-bzip2"),
+    (0, b"\xfd7zXZ\x00", "application/x-xz"),
+    (0, b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (257, b"ustar", "application/x-tar"),
+    (0, b"\x7fELF", "application/x-executable"),
+    (0, b"MZ", "application/x-msdownload"),
+    (0, b"SQLite format 3\x00", "application/vnd.sqlite3"),
+    (0, b"ID3", "audio/mpeg"),
+    (0, b"OggS", "audio/ogg"),
+    (0, b"fLaC", "audio/flac"),
+    (0, b"\x00\x00\x01\x00", "image/x-icon"),
+]
+
+# Contêiner RIFF: o subtipo fica nos bytes 8..12.
+_SUBTIPOS_RIFF = {b"WEBP": "image/webp", b"WAVE": "audio/wav", b"AVI ": "video/x-msvideo"}
+_MARCAS_TEXTO = (
+    (b"<!DOCTYPE NETSCAPE-Bookmark", "text/html"),
+    (b"<!doctype html", "text/html"),
+    (b"<html", "text/html"),
+    (b"<?xml", "application/xml"),
+    (b"{", "application/json"),
+    (b"[", "application/json"),
+)
+
+
+def detectar_tipo_conteudo(amostra: bytes) -> str:
+    """
+    Detecta o tipo MIME a partir dos primeiros bytes de um arquivo.
+
+    Args:
+        amostra (bytes): Primeiro bloco do arquivo (até `TAMANHO_AMOSTRA` bytes).
+
+    Returns:
+        str: Tipo MIME detectado; `text/plain` para texto sem assinatura conhecida
+        e `application/octet-stream` para binários não reconhecidos.
+    """
+    if not amostra:
+        return TIPO_VAZIO
+    for deslocamento, assinatura, tipo in ASSINATURAS:
+        if amostra.startswith(assinatura, deslocamento):
+            return tipo
+    if amostra.startswith(b"RIFF") and amostra[8:12] in _SUBTIPOS_RIFF:
+        return _SUBTIPOS_RIFF[amostra[8:12]]
+    if b"\0" in amostra:
+        return TIPO_BINARIO
+
+    try:
+        # Decodificação incremental: tolera um caractere multibyte cortado no fim da amostra.
+        codecs.getincrementaldecoder("utf-8")().decode(amostra, final=False)
+    except UnicodeDecodeError:
+        return TIPO_BINARIO
+
+    inicio = amostra.lstrip(b"\xef\xbb\xbf \t\r\n")[:64].lower()
+    for marca, tipo in _MARCAS_TEXTO:
+        if inicio.startswith(marca.lower()):
+            return tipo
+    return TIPO_TEXTO
+
+
+class CacheTipoConteudo:
+    """
+    Cache thread-safe de tipos de conteúdo indexado por (st_dev, st_ino, st_mtime_ns).
+
+    Um arquivo só é lido novamente quando seu inode ou sua data de modificação mudam.
+    """
+
+    def __init__(self) -> None:
+        self._tipos: dict[tuple[int, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def tipo_de(self, caminho: str) -> str:
+        """
+        Retorna o tipo de conteúdo de `caminho`, lendo o arquivo apenas se necessário.
+
+        Raises:
+            OSError: Se o arquivo não puder ser acessado.
+        """
+        info = os.stat(caminho)
+        chave = (info.st_dev, info.st_ino, info.st_mtime_ns)
+        with self._lock:
+            tipo = self._tipos.get(chave)
+        if tipo is None:
+            with open(caminho, "rb") as arquivo:
+                tipo = detectar_tipo_conteudo(arquivo.read(TAMANHO_AMOSTRA))
+            with self._lock:
+                self._tipos[chave] = tipo
+        return tipo
+
+    def __len__(self) -> int:
+        return len(self._tipos)
+
+
+class IndiceTipoConteudo:
+    """
+    Índice tipo MIME -> caminhos, usado como coluna filtrável na listagem.
+    """
+
+    def __init__(self) -> None:
+        self._caminhos: dict[str, set[str]] = defaultdict(set)
+        self._tipo_por_caminho: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def adicionar(self, modelo: CaminhoModel) -> None:
+        """Indexa (ou reindexa) o modelo pelo seu `tipo_conteudo`."""
+        if modelo.tipo_conteudo is None:
+            return
+        with self._lock:
+            anterior = self._tipo_por_caminho.get(modelo.caminho)
+            if anterior is not None:
+                self._caminhos[anterior].discard(modelo.caminho)
+            self._caminhos[modelo.tipo_conteudo].add(modelo.caminho)
+            self._tipo_por_caminho[modelo.caminho] = modelo.tipo_conteudo
+
+    def filtrar(self, tipo: str) -> set[str]:
+        """
+        Retorna os caminhos do tipo informado.
+
+        Args:
+            tipo (str): Tipo MIME exato ("image/png") ou prefixo terminado em "/" ("image/").
+        """
+        with self._lock:
+            if tipo.endswith("/"):
+                return {
+                    caminho
+                    for nome, caminhos in self._caminhos.items()
+                    if nome.startswith(tipo)
+                    for caminho in caminhos
+                }
+            return set(self._caminhos.get(tipo, set()))
+
+    def tipos(self) -> dict[str, int]:
+        """Retorna a contagem de caminhos por tipo MIME."""
+        with self._lock:
+            return {t: len(c) for t, c in self._caminhos.items() if c}
+
+
+class ClassificadorConteudo:
+    """
+    Classifica o conteúdo de modelos em segundo plano.
+
+    Atributos:
+        cache (CacheTipoConteudo): Cache compartilhado de tipos por inode/mtime.
+        indice (IndiceTipoConteudo): Índice atualizado a cada classificação.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        cache: Optional[CacheTipoConteudo] = None,
+        indice: Optional[IndiceTipoConteudo] = None,
+    ) -> None:
+        self.cache = cache if cache is not None else CacheTipoConteudo()
+        self.indice = indice if indice is not None else IndiceTipoConteudo()
+        self._max_workers = max_workers
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    def _classificar_um(self, modelo: CaminhoModel) -> CaminhoModel:
+        if modelo.tipo == PathType.FILE:
+            try:
+                modelo.tipo_conteudo = self.cache.tipo_de(modelo.caminho)
+                self.indice.adicionar(modelo)
+            except OSError as e:
+                logging.warning(" Falha ao classificar conteúdo -> %s (%s)", modelo.caminho, e)
+        return modelo
+
+    def classificar(self, modelos: Iterable[CaminhoModel]) -> Iterator[CaminhoModel]:
+        """
+        Preenche `tipo_conteudo` dos arquivos regulares, preservando a ordem de entrada.
+
+        No máximo `2 * max_workers` classificações ficam pendentes ao mesmo tempo: a
+        entrada é consumida conforme os resultados são entregues, e encerrar o gerador
+        cancela as pendentes.
+
+        Args:
+            modelos (Iterable[CaminhoModel]): Modelos a classificar.
+
+        Yields:
+            CaminhoModel: Os mesmos modelos, com `tipo_conteudo` preenchido.
+        """
+        limite = 2 * self._max_workers
+        pendentes: deque[concurrent.futures.Future[CaminhoModel]] = deque()
+        try:
+            for modelo in modelos:
+                pendentes.append(self._pool.submit(self._classificar_um, modelo))
+                if len(pendentes) >= limite:
+                    yield pendentes.popleft().result()
+            while pendentes:
+                yield pendentes.popleft().result()
+        finally:
+            for futuro in pendentes:
+                futuro.cancel()
+
+    def classificar_em_segundo_plano(
+        self,
+        modelos: Iterable[CaminhoModel],
+        ao_concluir: Optional[Callable[[CaminhoModel], None]] = None,
+    ) -> concurrent.futures.Future[int]:
+        """
+        Classifica os modelos em uma thread própria, sem bloquear o chamador.
+
+        A entrada é consumida por `classificar`, com no máximo `2 * max_workers`
+        classificações pendentes no pool; `modelos` pode ser um gerador longo.
+
+        Args:
+            modelos (Iterable[CaminhoModel]): Modelos a classificar.
+            ao_concluir (Callable | None): Chamado para cada modelo, na ordem de entrada.
+
+        Returns:
+            Future[int]: Concluído com a quantidade de modelos classificados, ou com o
+            erro que interrompeu a entrada.
+        """
+        concluido: concurrent.futures.Future[int] = concurrent.futures.Future()
+
+        def alimentar() -> None:
+            if not concluido.set_running_or_notify_cancel():
+                return
+            total = 0
+            try:
+                for modelo in self.classificar(modelos):
+                    if ao_concluir is not None:
+                        ao_concluir(modelo)
+                    total += 1
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                concluido.set_exception(e)
+            else:
+                concluido.set_result(total)
+
+        threading.Thread(target=alimentar, daemon=True).start()
+        return concluido
+
+    def encerrar(self) -> None:
+        self._pool.shutdown(wait=True)
@@ -17,6 +17,7 @@
 #     PathOperationError,
 #     PathStatus,
 # )
+# from tools.path_resolver import resolver_caminho
 
 
 # class PathController:
@@ -63,7 +64,7 @@
 #             raise PathNotFoundError(caminho)
 
 #         try:
-#             caminho_path = Path(caminho).expanduser().resolve()
+#             caminho_path = resolver_caminho(caminho)
 #             return caminho_path.read_text(encoding="utf-8")
 #         except OSError as e:
 #             self._update_cache(caminho, PathStatus.ERROR)
@@ -80,7 +81,7 @@
 #             status = PathStatus.UPDATED
 
 #         try:
-#             caminho_path = Path(caminho).expanduser().resolve()
+#             caminho_path = resolver_caminho(caminho)
 #             caminho_path.parent.mkdir(parents=True, exist_ok=True)
 #             caminho_path.write_text(conteudo, encoding="utf-8")
 #             self._update_cache(caminho, status)
@@ -101,7 +102,7 @@
 #             raise PathNotFoundError(caminho)
 
 #         try:
-#             dir_path = Path(caminho).expanduser().resolve()
+#             dir_path = resolver_caminho(caminho)
 #             # Garante que cada dict tem todas as chaves do BasePathData
 #             return [
 #                 CaminhoModel.from_path(str(item)).to_dict()
@@ -119,7 +120,7 @@
 #             raise PathAlreadyExistsError(caminho)
 
 #         try:
-#             caminho_path = Path(caminho).expanduser().resolve()
+#             caminho_path = resolver_caminho(caminho)
 #             caminho_path.mkdir(parents=True, exist_ok=False)
 #             self._update_cache(caminho, PathStatus.CREATED)
 #             return str(caminho_path)
@@ -0,0 +1,228 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Carregamento da seleção com debounce, descarte de pedidos obsoletos e pré-carregamento.
+
+Hoje `_on_tree_select` chama `controller.ler_caminho` de forma síncrona a cada
+`<<TreeviewSelect>>`; segurar uma seta do teclado enfileira uma leitura bloqueante por
+linha percorrida. Aqui a seleção só é carregada depois de `atraso_ms` sem mudanças, os
+resultados de seleções que deixaram de ser atuais nunca são exibidos e as linhas
+vizinhas são carregadas em segundo plano para um cache limitado.
+
+O módulo não depende do Tkinter: o agendamento é injetado (`widget.after` e
+`widget.after_cancel`), e todas as entregas acontecem em callbacks agendados, ou seja,
+na thread da interface. Os carregamentos rodam em um pool de threads.
+
+Inclui:
+- `SelecaoPrefetch`: `selecionar()`, `invalidar()` e `encerrar()`.
+"""
+
+from collections import OrderedDict
+import concurrent.futures
+import logging
+import queue
+import threading
+from typing import Any, Callable, Generic, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+ATRASO_MS = 80
+INTERVALO_POLL_MS = 15
+
+
+class SelecaoPrefetch(Generic[T]):
+    """
+    Gerencia o carregamento dos detalhes da linha selecionada.
+
+    Args:
+        carregar (Callable[[str], T]): Carrega os dados de uma chave (ex.: `ler_caminho`);
+            executado no pool de threads.
+        entregar (Callable[[str, T], None]): Exibe os dados da seleção atual (thread da UI).
+        agendar (Callable[[int, Callable[[], None]], Any]): Agenda um callback após N ms
+            na thread da UI (ex.: `widget.after`).
+        cancelar_agendamento (Callable[[Any], None]): Cancela um agendamento
+            (ex.: `widget.after_cancel`).
+        ao_erro (Callable[[str, BaseException], None] | None): Chamado quando a carga da
+            seleção atual falha.
+        atraso_ms (int): Tempo sem mudanças de seleção antes de carregar.
+        vizinhos (int): Linhas pré-carregadas de cada lado da seleção.
+        tamanho_cache (int): Quantidade máxima de resultados mantidos em cache.
+        max_workers (int): Threads do pool de carregamento.
+    """
+
+    def __init__(
+        self,
+        carregar: Callable[[str], T],
+        entregar: Callable[[str, T], None],
+        agendar: Callable[[int, Callable[[], None]], Any],
+        cancelar_agendamento: Callable[[Any], None],
+        ao_erro: Optional[Callable[[str, BaseException], None]] = None,
+        atraso_ms: int = ATRASO_MS,
+        vizinhos: int = 2,
+        tamanho_cache: int = 128,
+        max_workers: int = 2,
+    ) -> None:
+        self._carregar = carregar
+        self._entregar = entregar
+        self._agendar = agendar
+        self._cancelar_agendamento = cancelar_agendamento
+        self._ao_erro = ao_erro
+        self.atraso_ms = atraso_ms
+        self.vizinhos = vizinhos
+        self.tamanho_cache = tamanho_cache
+
+        self.atual: Optional[str] = None
+        self._cache: OrderedDict[str, T] = OrderedDict()
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._em_andamento: dict[str, concurrent.futures.Future[T]] = {}
+        self._concluidos: "queue.Queue[tuple[str, concurrent.futures.Future[T]]]" = (
+            queue.Queue()
+        )
+        self._vizinhos_atuais: list[str] = []
+        self._debounce: Any = None
+        self._poll: Any = None
+        self._lock = threading.Lock()
+
+    # === CACHE ===
+
+    def em_cache(self, chave: str) -> Optional[T]:
+        with self._lock:
+            if chave in self._cache:
+                self._cache.move_to_end(chave)
+                return self._cache[chave]
+        return None
+
+    def _guardar(self, chave: str, valor: T) -> None:
+        with self._lock:
+            self._cache[chave] = valor
+            self._cache.move_to_end(chave)
+            while len(self._cache) > self.tamanho_cache:
+                self._cache.popitem(last=False)
+
+    def invalidar(self, chave: Optional[str] = None) -> None:
+        """Descarta uma entrada do cache, ou todas (ex.: após recarregar o diretório)."""
+        with self._lock:
+            if chave is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(chave, None)
+
+    # === SELEÇÃO ===
+
+    def selecionar(
+        self,
+        chave: str,
+        linhas: Sequence[str] = (),
+        posicao: int = -1,
+        vizinhos: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        Registra uma nova seleção.
+
+        Se os dados já estiverem em cache, são entregues imediatamente; caso contrário
+        a carga é adiada por `atraso_ms`, e seleções intermediárias são descartadas.
+
+        Args:
+            chave (str): Identificador da linha selecionada (ex.: iid da Treeview).
+            linhas (Sequence[str]): Linhas visíveis, na ordem exibida, para o
+                pré-carregamento dos vizinhos.
+            posicao (int): Posição de `chave` em `linhas` (procurada se -1).
+            vizinhos (Sequence[str] | None): Vizinhos já calculados, mais próximos
+                primeiro (ex.: via `tree.next()`/`tree.prev()`); dispensa `linhas`.
+        """
+        self.atual = chave
+        if vizinhos is not None:
+            self._vizinhos_atuais = list(vizinhos)
+        else:
+            if linhas and posicao < 0:
+                posicao = linhas.index(chave) if chave in linhas else -1
+            self._vizinhos_atuais = self._calcular_vizinhos(linhas, posicao)
+
+        if self._debounce is not None:
+            self._cancelar_agendamento(self._debounce)
+            self._debounce = None
+
+        valor = self.em_cache(chave)
+        if valor is not None:
+            self._entregar(chave, valor)
+            self._debounce = self._agendar(self.atraso_ms, self._pre_carregar)
+        else:
+            self._debounce = self._agendar(self.atraso_ms, self._carregar_atual)
+
+    def _calcular_vizinhos(self, linhas: Sequence[str], posicao: int) -> list[str]:
+        if posicao < 0:
+            return []
+        # Ordem: mais próximos primeiro, alternando abaixo e acima.
+        vizinhos = []
+        for distancia in range(1, self.vizinhos + 1):
+            for indice in (posicao + distancia, posicao - distancia):
+                if 0 <= indice < len(linhas):
+                    vizinhos.append(linhas[indice])
+        return vizinhos
+
+    def _carregar_atual(self) -> None:
+        self._debounce = None
+        if self.atual is None:
+            return
+        self._descartar_obsoletos()
+        self._submeter(self.atual)
+        self._pre_carregar()
+
+    def _pre_carregar(self) -> None:
+        self._debounce = None
+        self._descartar_obsoletos()
+        for vizinho in self._vizinhos_atuais:
+            if self.em_cache(vizinho) is None:
+                self._submeter(vizinho)
+
+    def _descartar_obsoletos(self) -> None:
+        """Cancela cargas ainda não iniciadas que não são da seleção atual nem vizinhas."""
+        relevantes = {self.atual, *self._vizinhos_atuais}
+        for chave, futuro in list(self._em_andamento.items()):
+            if chave not in relevantes and futuro.cancel():
+                del self._em_andamento[chave]
+
+    def _submeter(self, chave: str) -> None:
+        if chave in self._em_andamento:
+            return
+        futuro = self._pool.submit(self._carregar, chave)
+        self._em_andamento[chave] = futuro
+        futuro.add_done_callback(lambda f: self._concluidos.put((chave, f)))
+        if self._poll is None:
+            self._poll = self._agendar(INTERVALO_POLL_MS, self._processar_concluidos)
+
+    # === ENTREGA (THREAD DA UI) ===
+
+    def _processar_concluidos(self) -> None:
+        self._poll = None
+        while True:
+            try:
+                chave, futuro = self._concluidos.get_nowait()
+            except queue.Empty:
+                break
+            if self._em_andamento.get(chave) is futuro:
+                del self._em_andamento[chave]
+            if futuro.cancelled():
+                continue
+            erro = futuro.exception()
+            if erro is not None:
+                if chave == self.atual and self._ao_erro is not None:
+                    self._ao_erro(chave, erro)
+                else:
+                    logging.warning(" Falha no pré-carregamento -> %s (%s)", chave, erro)
+                continue
+            valor = futuro.result()
+            self._guardar(chave, valor)
+            # Resultados de seleções obsoletas ficam apenas no cache.
+            if chave == self.atual:
+                self._entregar(chave, valor)
+
+        if self._em_andamento:
+            self._poll = self._agendar(INTERVALO_POLL_MS, self._processar_concluidos)
+
+    def encerrar(self) -> None:
+        for agendamento in (self._debounce, self._poll):
+            if agendamento is not None:
+                self._cancelar_agendamento(agendamento)
+        self._debounce = self._poll = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,351 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Varredura paralela de árvores grandes, distribuída entre processos.
+
+Montar um `CaminhoModel` por entrada é trabalho em Python puro; com threads, a
+varredura fica limitada a um núcleo assim que o sistema de arquivos deixa de ser o
+gargalo. Aqui as raízes são divididas em subárvores (shards) e cada shard é varrido
+em um processo separado. Os workers enviam lotes em formato colunar (nomes separados
+por NUL e arrays de modo, inode, tamanho e mtime) por uma fila assim que cada lote
+fica pronto; o processo principal só reconstrói os arrays (em C) e monta registros ou
+modelos quando eles são acessados.
+
+As chamadas de sistema acontecem nos workers, fora do alcance de um `AgendadorIO` do
+processo principal; por isso cada worker recria o agendador com uma fração
+(1/processos) dos limites e limita a própria varredura.
+
+Inclui:
+- `LoteVarredura`: lote colunar com acesso preguiçoso a registros e modelos.
+- `varrer_registros_paralelo()`: lotes por raiz, à medida que os workers os produzem.
+- `varrer_paralelo()`: o mesmo fluxo convertido em `CaminhoModel`.
+- `mesclar_no_cache()`: incorpora o resultado ao cache e aos índices do controller.
+"""
+
+from array import array
+import concurrent.futures
+from itertools import islice
+import multiprocessing
+import os
+from pathlib import Path
+import queue
+import threading
+from typing import Any, Iterable, Iterator, MutableMapping, Optional, Sequence, Union
+
+from controllers.io_scheduler import AgendadorIO, Prioridade
+from models.path_snapshot import (
+    RegistroSnapshot,
+    listar_nivel,
+    registro_para_modelo,
+    varrer_registros,
+)
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathInvalidError, PathType
+from tools.path_resolver import resolver_caminho
+
+TAMANHO_LOTE = 10_000
+PROFUNDIDADE_MAXIMA_SHARD = 3
+
+# Colunas numéricas do lote: (nome, código do array).
+_COLUNAS = (("modos", "I"), ("inodes", "Q"), ("tamanhos", "Q"), ("modificados_ns", "q"))
+
+# Lote serializado: índice da raiz, nomes separados por NUL e os bytes de cada coluna.
+_LoteBruto = tuple[int, bytes, bytes, bytes, bytes, bytes]
+
+
+# === LOTES COLUNARES ===
+
+
+def _codificar_lote(indice_raiz: int, registros: Sequence[RegistroSnapshot]) -> _LoteBruto:
+    colunas = [array(codigo) for _, codigo in _COLUNAS]
+    for registro in registros:
+        colunas[0].append(registro.modo)
+        colunas[1].append(registro.inode)
+        colunas[2].append(registro.tamanho)
+        colunas[3].append(registro.modificado_ns)
+    nomes = b"\0".join(os.fsencode(r.caminho) for r in registros)
+    return (indice_raiz, nomes, *(coluna.tobytes() for coluna in colunas))  # type: ignore
+
+
+class LoteVarredura:
+    """
+    Lote de entradas em formato colunar, relativo a uma raiz.
+
+    Os arrays numéricos são reconstruídos a partir dos bytes recebidos sem laço em
+    Python; caminhos, registros e modelos só são montados quando acessados.
+
+    Atributos:
+        raiz (str): Raiz à qual os caminhos são relativos.
+        modos (array): Campo `st_mode` de cada entrada.
+        inodes (array): Inodes.
+        tamanhos (array): Tamanhos em bytes.
+        modificados_ns (array): Datas de modificação em nanossegundos.
+    """
+
+    def __init__(self, raiz: str, nomes: bytes, *colunas: bytes) -> None:
+        self.raiz = raiz
+        self._nomes = nomes
+        self._caminhos: Optional[list[str]] = None
+        for (nome, codigo), dados in zip(_COLUNAS, colunas):
+            coluna = array(codigo)
+            coluna.frombytes(dados)
+            setattr(self, nome, coluna)
+
+    @classmethod
+    def from_registros(cls, raiz: str, registros: Sequence[RegistroSnapshot]) -> "LoteVarredura":
+        _, nomes, *colunas = _codificar_lote(0, registros)
+        return cls(raiz, nomes, *colunas)
+
+    def __len__(self) -> int:
+        return len(self.modos)  # type: ignore[attr-defined]
+
+    @property
+    def caminhos(self) -> list[str]:
+        """Caminhos relativos à raiz (decodificados no primeiro acesso)."""
+        if self._caminhos is None:
+            self._caminhos = (
+                [os.fsdecode(n) for n in self._nomes.split(b"\0")] if len(self) else []
+            )
+        return self._caminhos
+
+    def registro(self, indice: int) -> RegistroSnapshot:
+        return RegistroSnapshot(
+            self.caminhos[indice],
+            self.modos[indice],  # type: ignore[attr-defined]
+            self.inodes[indice],  # type: ignore[attr-defined]
+            self.tamanhos[indice],  # type: ignore[attr-defined]
+            self.modificados_ns[indice],  # type: ignore[attr-defined]
+        )
+
+    def __iter__(self) -> Iterator[RegistroSnapshot]:
+        for indice in range(len(self)):
+            yield self.registro(indice)
+
+    def modelos(self) -> Iterator[CaminhoModel]:
+        for indice in range(len(self)):
+            yield registro_para_modelo(self.raiz, self.registro(indice))
+
+
+# === WORKERS ===
+
+_fila_worker: Any = None
+_parar_worker: Any = None
+_agendador_worker: Optional[AgendadorIO] = None
+
+
+def _inicializar_worker(fila: Any, parar: Any, limites: Optional[dict[str, Any]]) -> None:
+    global _fila_worker, _parar_worker, _agendador_worker  # pylint: disable=global-statement
+    _fila_worker = fila
+    _parar_worker = parar
+    _agendador_worker = AgendadorIO(**limites) if limites is not None else None
+
+
+def _enviar(item: Optional[_LoteBruto]) -> bool:
+    """Coloca `item` na fila; desiste (retornando False) se a varredura for encerrada."""
+    while not _parar_worker.is_set():
+        try:
+            _fila_worker.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    # Sem consumidor: o processo não deve esperar a fila esvaziar ao terminar.
+    _fila_worker.cancel_join_thread()
+    return False
+
+
+def _varrer_shard(indice_raiz: int, raiz: str, subdiretorio: str) -> int:
+    """
+    Executado no processo worker: envia cada lote à fila assim que fica pronto.
+
+    Ao final (mesmo em caso de erro) envia None, sinalizando o fim do shard. Para
+    entre lotes se o processo principal sinalizar o encerramento.
+    """
+    total = 0
+    try:
+        registros: Iterator[RegistroSnapshot]
+        if _agendador_worker is None:
+            registros = varrer_registros(raiz, subdiretorio)
+        else:
+            registros = _agendador_worker.limitar(
+                varrer_registros(raiz, subdiretorio, _agendador_worker.registrar_latencia)
+            )
+        while not _parar_worker.is_set() and (lote := list(islice(registros, TAMANHO_LOTE))):
+            if not _enviar(_codificar_lote(indice_raiz, lote)):
+                break
+            total += len(lote)
+    finally:
+        _enviar(None)
+    return total
+
+
+def _gerar_shards(raiz: str, minimo: int) -> tuple[list[RegistroSnapshot], list[str]]:
+    """
+    Expande os primeiros níveis da árvore até obter ao menos `minimo` subárvores.
+
+    Retorna as entradas já visitadas pelo processo principal e os shards restantes.
+    """
+    visitados, shards = listar_nivel(raiz, "")
+    profundidade = 1
+    while shards and len(shards) < minimo and profundidade < PROFUNDIDADE_MAXIMA_SHARD:
+        proximos: list[str] = []
+        for relativo in shards:
+            registros, subdiretorios = listar_nivel(raiz, relativo)
+            visitados.extend(registros)
+            proximos.extend(subdiretorios)
+        shards = proximos
+        profundidade += 1
+    return visitados, shards
+
+
+def _encerrar_pool(
+    pool: concurrent.futures.ProcessPoolExecutor, fila: Any, parar: Any
+) -> None:
+    """
+    Encerra os workers mesmo que o consumidor tenha parado no meio da varredura.
+
+    Workers bloqueados em `put` só terminam se alguém ler a fila: ela é esvaziada em
+    segundo plano até o pool encerrar.
+    """
+    parar.set()
+    encerrado = threading.Event()
+
+    def esvaziar() -> None:
+        while not encerrado.is_set():
+            try:
+                fila.get(timeout=0.05)
+            except queue.Empty:
+                pass
+
+    leitor = threading.Thread(target=esvaziar, daemon=True)
+    leitor.start()
+    try:
+        pool.shutdown(wait=True, cancel_futures=True)
+    finally:
+        encerrado.set()
+        leitor.join()
+
+
+def varrer_registros_paralelo(
+    raizes: Iterable[Union[str, Path]],
+    processos: Optional[int] = None,
+    agendador: Optional[AgendadorIO] = None,
+) -> Iterator[tuple[str, LoteVarredura]]:
+    """
+    Varre várias raízes distribuindo as subárvores entre processos.
+
+    Args:
+        raizes (Iterable[str | Path]): Diretórios a varrer.
+        processos (int | None): Tamanho do pool (padrão: `os.cpu_count()`).
+        agendador (AgendadorIO | None): Orçamento de E/S da varredura, repartido
+            igualmente entre os processos (prioridade SEGUNDO_PLANO).
+
+    Raises:
+        PathInvalidError: Se alguma raiz não for um diretório.
+
+    Yields:
+        tuple[str, LoteVarredura]: Raiz resolvida e um lote de entradas relativas a
+        ela, na ordem em que os workers os produzem (sem esperar o shard terminar).
+        Encerrar o gerador antes do fim interrompe os workers.
+    """
+    processos = processos or os.cpu_count() or 1
+    resolvidas = [str(resolver_caminho(raiz)) for raiz in raizes]
+    for raiz in resolvidas:
+        if not os.path.isdir(raiz):
+            raise PathInvalidError(raiz)
+
+    contexto = multiprocessing.get_context()
+    # Fila limitada: workers mais rápidos que o consumidor aguardam, sem acumular lotes.
+    fila = contexto.Queue(maxsize=4 * processos)
+    parar = contexto.Event()
+    pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=processos,
+        mp_context=contexto,
+        initializer=_inicializar_worker,
+        initargs=(
+            fila,
+            parar,
+            agendador.configuracao(processos) if agendador is not None else None,
+        ),
+    )
+    try:
+        futuros: list[concurrent.futures.Future[int]] = []
+        for indice, raiz in enumerate(resolvidas):
+            visitados, shards = _gerar_shards(raiz, 4 * processos)
+            if agendador is not None and visitados:
+                # Expansão feita no processo principal: cobrada do agendador original.
+                agendador.adquirir(Prioridade.SEGUNDO_PLANO, len(visitados))
+            futuros.extend(pool.submit(_varrer_shard, indice, raiz, s) for s in shards)
+            if visitados:
+                yield raiz, LoteVarredura.from_registros(raiz, visitados)
+
+        pendentes = len(futuros)
+        while pendentes:
+            try:
+                item = fila.get(timeout=0.5)
+            except queue.Empty:
+                # Um worker encerrado abruptamente não envia o fim do shard.
+                for futuro in futuros:
+                    if futuro.done() and futuro.exception() is not None:
+                        raise futuro.exception()  # type: ignore[misc]
+                continue
+            if item is None:
+                pendentes -= 1
+                continue
+            indice, nomes, *colunas = item
+            yield resolvidas[indice], LoteVarredura(resolvidas[indice], nomes, *colunas)
+
+        for futuro in futuros:
+            futuro.result()
+    finally:
+        _encerrar_pool(pool, fila, parar)
+
+
+def varrer_paralelo(
+    raizes: Iterable[Union[str, Path]],
+    processos: Optional[int] = None,
+    agendador: Optional[AgendadorIO] = None,
+) -> Iterator[CaminhoModel]:
+    """
+    Varre várias raízes em paralelo e produz um `CaminhoModel` por entrada.
+
+    Os modelos são montados no processo principal à medida que são consumidos; para
+    agregações sobre milhões de entradas, prefira os arrays de `varrer_registros_paralelo`.
+
+    Args:
+        raizes (Iterable[str | Path]): Diretórios a varrer.
+        processos (int | None): Tamanho do pool (padrão: `os.cpu_count()`).
+        agendador (AgendadorIO | None): Orçamento de E/S repartido entre os processos.
+
+    Yields:
+        CaminhoModel: Entradas com status EXISTS, tamanho e data de modificação.
+    """
+    for _, lote in varrer_registros_paralelo(raizes, processos, agendador):
+        yield from lote.modelos()
+
+
+def mesclar_no_cache(
+    cache: MutableMapping[str, CaminhoModel],
+    modelos: Iterable[CaminhoModel],
+    indice_tipo: Optional[MutableMapping[PathType, set[str]]] = None,
+) -> int:
+    """
+    Incorpora modelos ao cache do controller (indexado pelo caminho) e ao índice por tipo.
+
+    Args:
+        cache (MutableMapping[str, CaminhoModel]): Cache a atualizar.
+        modelos (Iterable[CaminhoModel]): Modelos produzidos pela varredura.
+        indice_tipo (MutableMapping[PathType, set[str]] | None): Índice tipo -> caminhos.
+
+    Returns:
+        int: Quantidade de modelos incorporados.
+    """
+    total = 0
+    for modelo in modelos:
+        anterior = cache.get(modelo.caminho)
+        if indice_tipo is not None:
+            if anterior is not None and anterior.tipo != modelo.tipo:
+                indice_tipo.get(anterior.tipo, set()).discard(modelo.caminho)
+            indice_tipo.setdefault(modelo.tipo, set()).add(modelo.caminho)
+        cache[modelo.caminho] = modelo
+        total += 1
+    return total
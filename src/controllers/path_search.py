@@ -0,0 +1,255 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Busca de conteúdo (estilo grep) sobre os arquivos de uma varredura.
+
+Cada arquivo é lido em blocos de `BLOCO_LEITURA` bytes (cortados em fim de linha) e
+pesquisado por um worker do pool; as ocorrências são colocadas em uma fila limitada e
+entregues pelo gerador assim que são encontradas, para que a view possa exibi-las
+durante a busca.
+
+A leitura com `read()` libera o GIL enquanto espera o disco, então as esperas de E/S
+de vários arquivos se sobrepõem; a comparação em si (`bytes.find` e `re`) mantém o
+GIL e roda em um núcleo por vez. Com `mmap`, as faltas de página aconteceriam dentro
+da comparação, com o GIL retido, e nada se sobreporia.
+
+Inclui:
+- `Ocorrencia`: caminho, linha, deslocamento em bytes e trecho da linha.
+- `buscar_conteudo()`: busca literal ou por expressão regular, com filtros de
+  extensão e tamanho baseados nos metadados do `CaminhoModel`.
+"""
+
+import concurrent.futures
+from dataclasses import dataclass
+import logging
+import os
+import queue
+import re
+import threading
+from typing import BinaryIO, Generator, Iterable, Iterator, Optional, Union
+
+from controllers.io_scheduler import AgendadorIO, Prioridade
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathType
+
+# Bytes iniciais inspecionados para detectar arquivos binários (presença de NUL).
+AMOSTRA_BINARIO = 8192
+TAMANHO_TRECHO = 200
+BLOCO_LEITURA = 1 << 20
+
+
+@dataclass
+class Ocorrencia:
+    """
+    Ocorrência de uma busca de conteúdo.
+
+    Atributos:
+        caminho (str): Arquivo onde a ocorrência foi encontrada.
+        linha (int): Número da linha (a partir de 1).
+        offset (int): Deslocamento em bytes do início da ocorrência.
+        trecho (str): Conteúdo da linha (truncado em `TAMANHO_TRECHO` caracteres).
+    """
+
+    caminho: str
+    linha: int
+    offset: int
+    trecho: str
+
+
+def _compilar(padrao: str, regex: bool, ignorar_maiusculas: bool) -> Union[bytes, re.Pattern]:
+    if not regex and not ignorar_maiusculas:
+        return padrao.encode("utf-8")
+    expressao = padrao.encode("utf-8") if regex else re.escape(padrao.encode("utf-8"))
+    # MULTILINE: `^` e `$` valem em cada linha, como no grep.
+    return re.compile(expressao, re.MULTILINE | (re.IGNORECASE if ignorar_maiusculas else 0))
+
+
+def _aceito(
+    modelo: CaminhoModel,
+    extensoes: Optional[set[str]],
+    tamanho_maximo: Optional[int],
+) -> bool:
+    if modelo.tipo != PathType.FILE:
+        return False
+    if extensoes is not None and os.path.splitext(modelo.nome)[1].lower() not in extensoes:
+        return False
+    return not (
+        tamanho_maximo is not None
+        and modelo.tamanho is not None
+        and modelo.tamanho > tamanho_maximo
+    )
+
+
+def _blocos_de_linhas(
+    arquivo: BinaryIO,
+    agendador: Optional[AgendadorIO] = None,
+    prioridade: Prioridade = Prioridade.NORMAL,
+    cancelado: Optional[threading.Event] = None,
+) -> Iterator[tuple[int, bytes]]:
+    """
+    Lê o arquivo em blocos que terminam em fim de linha.
+
+    Uma linha maior que `BLOCO_LEITURA` é acumulada em lista e unida uma única vez.
+    Com `agendador`, cada leitura consome o orçamento de operações e bytes. Com
+    `cancelado`, a leitura para antes do próximo bloco assim que o evento é sinalizado.
+
+    Yields:
+        tuple[int, bytes]: Deslocamento do bloco no arquivo e o bloco.
+    """
+    offset = 0
+    pendentes: list[bytes] = []
+    while bloco := arquivo.read(BLOCO_LEITURA):
+        if agendador is not None:
+            # Cobra os bytes lidos; a espera adia a próxima leitura.
+            agendador.adquirir(prioridade, 1, len(bloco))
+        if cancelado is not None and cancelado.is_set():
+            return
+        corte = bloco.rfind(b"\n") + 1
+        if not corte:
+            pendentes.append(bloco)
+            continue
+        pendentes.append(bloco[:corte])
+        completo = b"".join(pendentes) if len(pendentes) > 1 else pendentes[0]
+        pendentes = [bloco[corte:]] if corte < len(bloco) else []
+        yield offset, completo
+        offset += len(completo)
+    if pendentes:
+        yield offset, b"".join(pendentes)
+
+
+def _buscar_em_blocos(
+    caminho: str, blocos: Iterable[tuple[int, bytes]], padrao: Union[bytes, re.Pattern]
+) -> Iterator[Ocorrencia]:
+    linha = 1
+    for offset, bloco in blocos:
+        contado_ate, posicao, tamanho = 0, 0, len(bloco)
+        while posicao < tamanho:
+            if isinstance(padrao, bytes):
+                inicio = bloco.find(padrao, posicao)
+            else:
+                encontrado = padrao.search(bloco, posicao)
+                inicio = encontrado.start() if encontrado else -1
+            if inicio < 0:
+                break
+
+            linha += bloco.count(b"\n", contado_ate, inicio)
+            contado_ate = inicio
+            inicio_linha = bloco.rfind(b"\n", 0, inicio) + 1
+            fim_linha = bloco.find(b"\n", inicio)
+            fim_linha = tamanho if fim_linha < 0 else fim_linha
+            trecho = bloco[inicio_linha : min(fim_linha, inicio_linha + 4 * TAMANHO_TRECHO)]
+            yield Ocorrencia(
+                caminho, linha, offset + inicio, trecho.decode("utf-8", "replace")[:TAMANHO_TRECHO]
+            )
+            # Uma ocorrência por linha, como no grep.
+            posicao = fim_linha + 1
+        linha += bloco.count(b"\n", contado_ate)
+
+
+def _buscar_arquivo(
+    caminho: str,
+    padrao: Union[bytes, re.Pattern],
+    saida: "queue.Queue[Union[Ocorrencia, BaseException, None]]",
+    cancelado: threading.Event,
+    agendador: Optional[AgendadorIO] = None,
+    prioridade: Prioridade = Prioridade.NORMAL,
+) -> None:
+    try:
+        if agendador is not None:
+            agendador.adquirir(prioridade)
+        # Sem buffer do Python: cada `read()` vai direto ao sistema, fora do GIL.
+        with open(caminho, "rb", buffering=0) as arquivo:
+            if b"\0" in arquivo.read(AMOSTRA_BINARIO):
+                return
+            arquivo.seek(0)
+            blocos = _blocos_de_linhas(arquivo, agendador, prioridade, cancelado)
+            for ocorrencia in _buscar_em_blocos(caminho, blocos, padrao):
+                if cancelado.is_set():
+                    return
+                saida.put(ocorrencia)
+    except (OSError, ValueError) as e:
+        logging.warning(" Arquivo ignorado na busca -> %s (%s)", caminho, e)
+
+
+def buscar_conteudo(
+    arquivos: Iterable[CaminhoModel],
+    padrao: str,
+    regex: bool = False,
+    ignorar_maiusculas: bool = False,
+    extensoes: Optional[Iterable[str]] = None,
+    tamanho_maximo: Optional[int] = None,
+    max_workers: int = 4,
+    agendador: Optional[AgendadorIO] = None,
+    prioridade: Prioridade = Prioridade.NORMAL,
+) -> Generator[Ocorrencia, None, None]:
+    """
+    Pesquisa `padrao` no conteúdo dos arquivos informados.
+
+    Arquivos binários (NUL nos primeiros `AMOSTRA_BINARIO` bytes) são ignorados. Os
+    filtros usam os metadados do modelo (`nome` e `tamanho`), sem chamadas extras ao
+    sistema de arquivos. Encerrar o gerador cancela a busca em andamento.
+
+    Args:
+        arquivos (Iterable[CaminhoModel]): Entradas da varredura (diretórios são ignorados).
+        padrao (str): Texto literal ou expressão regular.
+        regex (bool): Interpreta `padrao` como expressão regular.
+        ignorar_maiusculas (bool): Busca sem diferenciar maiúsculas de minúsculas.
+        extensoes (Iterable[str] | None): Extensões aceitas (ex.: [".py", ".txt"]).
+        tamanho_maximo (int | None): Ignora arquivos maiores que este tamanho em bytes.
+        max_workers (int): Quantidade de threads do pool.
+        agendador (AgendadorIO | None): Limita aberturas e bytes lidos por segundo.
+        prioridade (Prioridade): Classe das leituras no agendador.
+
+    Raises:
+        Exception: Erros ao percorrer `arquivos` são repassados ao consumidor.
+
+    Yields:
+        Ocorrencia: Ocorrências na ordem em que são encontradas.
+    """
+    compilado = _compilar(padrao, regex, ignorar_maiusculas)
+    filtro_extensoes = {e.lower() for e in extensoes} if extensoes is not None else None
+    # O último item é None (fim da busca) ou a exceção que interrompeu o produtor.
+    saida: "queue.Queue[Union[Ocorrencia, BaseException, None]]" = queue.Queue(maxsize=1024)
+    cancelado = threading.Event()
+    vagas = threading.BoundedSemaphore(4 * max_workers)
+
+    def produzir() -> None:
+        erro: Optional[BaseException] = None
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for modelo in arquivos:
+                    if cancelado.is_set():
+                        break
+                    if not _aceito(modelo, filtro_extensoes, tamanho_maximo):
+                        continue
+                    vagas.acquire()
+                    futuro = pool.submit(
+                        _buscar_arquivo,
+                        modelo.caminho,
+                        compilado,
+                        saida,
+                        cancelado,
+                        agendador,
+                        prioridade,
+                    )
+                    futuro.add_done_callback(lambda _: vagas.release())
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            erro = e
+        finally:
+            saida.put(erro)
+
+    produtor = threading.Thread(target=produzir, daemon=True)
+    produtor.start()
+    try:
+        while isinstance(item := saida.get(), Ocorrencia):
+            yield item
+        if item is not None:
+            raise item
+    finally:
+        cancelado.set()
+        # Esvazia a fila para liberar workers bloqueados em `put`.
+        while produtor.is_alive():
+            try:
+                saida.get(timeout=0.05)
+            except queue.Empty:
+                pass
@@ -0,0 +1,261 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Ordenação e filtragem de listagens sobre os dados do modelo, nunca sobre a Treeview.
+
+Ordenar movendo linhas com `tree.move` custa segundos em Tcl para 100k entradas. Aqui a
+listagem é uma sequência de `CaminhoModel` e a ordem é uma lista de índices: as chaves
+de cada coluna (colação e ordem natural para nomes) são calculadas uma única vez por
+listagem, as permutações de cada ordenação ficam em cache e a view só renderiza a
+janela visível (`janela()`).
+
+Inclui:
+- `chave_natural()`: "arquivo2" antes de "arquivo10", sem diferenciar maiúsculas.
+- `FiltroListagem`: filtros por tipo, status, extensão, tamanho e texto do nome.
+- `MotorOrdenacao`: ordenação por múltiplas colunas, filtros e fatiamento da janela.
+"""
+
+from dataclasses import dataclass
+import locale
+import math
+import os
+import re
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
+
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathStatus, PathType
+
+_NUMEROS = re.compile(r"(\d+)")
+
+COLUNAS = ("nome", "tipo", "tamanho", "modificado", "status", "extensao", "tipo_conteudo")
+
+# Coluna e se a ordem é decrescente; uma string sozinha indica ordem crescente.
+Criterio = Union[str, tuple[str, bool]]
+
+
+def chave_natural(texto: str, colacao: Callable[[str], Any] = str.casefold) -> tuple:
+    """
+    Chave de ordenação natural: trechos numéricos comparados como números.
+
+    Args:
+        texto (str): Texto a ordenar (ex.: nome do arquivo).
+        colacao (Callable[[str], Any]): Transforma os trechos de texto
+            (padrão: `str.casefold`; use `locale.strxfrm` para a colação do sistema).
+
+    Returns:
+        tuple: Trechos de texto e números alternados, sempre começando por texto.
+    """
+    partes = _NUMEROS.split(texto)
+    return tuple(int(p) if i % 2 else colacao(p) for i, p in enumerate(partes))
+
+
+def _colacao_local(texto: str) -> str:
+    return locale.strxfrm(texto.casefold())
+
+
+@dataclass
+class FiltroListagem:
+    """
+    Filtros aplicados à listagem (campos None não filtram).
+
+    Atributos:
+        tipos (set[PathType] | None): Tipos aceitos.
+        status (set[PathStatus] | None): Status aceitos.
+        extensoes (set[str] | None): Extensões aceitas, com ponto (".py"), sem
+            diferenciar maiúsculas.
+        tamanho_minimo (int | None): Tamanho mínimo em bytes.
+        tamanho_maximo (int | None): Tamanho máximo em bytes.
+        texto (str | None): Trecho que deve aparecer no nome.
+    """
+
+    tipos: Optional[set[PathType]] = None
+    status: Optional[set[PathStatus]] = None
+    extensoes: Optional[set[str]] = None
+    tamanho_minimo: Optional[int] = None
+    tamanho_maximo: Optional[int] = None
+    texto: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.extensoes is not None:
+            self.extensoes = {e.lower() for e in self.extensoes}
+        if self.texto is not None:
+            self.texto = self.texto.casefold()
+
+    def aceita(self, modelo: CaminhoModel) -> bool:
+        if self.tipos is not None and modelo.tipo not in self.tipos:
+            return False
+        if self.status is not None and modelo.status not in self.status:
+            return False
+        if self.extensoes is not None:
+            extensao = os.path.splitext(modelo.nome)[1].lower()
+            if extensao not in self.extensoes:
+                return False
+        if self.tamanho_minimo is not None or self.tamanho_maximo is not None:
+            if modelo.tamanho is None:
+                return False
+            if self.tamanho_minimo is not None and modelo.tamanho < self.tamanho_minimo:
+                return False
+            if self.tamanho_maximo is not None and modelo.tamanho > self.tamanho_maximo:
+                return False
+        return self.texto is None or self.texto in modelo.nome.casefold()
+
+
+class MotorOrdenacao:
+    """
+    Mantém a ordem e o filtro de uma listagem como índices sobre os modelos.
+
+    Atributos:
+        modelos (Sequence[CaminhoModel]): Listagem original (não é modificada).
+        criterios (list[tuple[str, bool]]): Ordenação em vigor.
+        pastas_primeiro (bool): Diretórios antes dos demais, em qualquer ordenação.
+    """
+
+    def __init__(
+        self,
+        modelos: Sequence[CaminhoModel],
+        colacao_local: bool = False,
+        pastas_primeiro: bool = True,
+    ) -> None:
+        self._colacao = _colacao_local if colacao_local else str.casefold
+        self.pastas_primeiro = pastas_primeiro
+        self.atualizar(modelos)
+
+    def atualizar(self, modelos: Sequence[CaminhoModel]) -> None:
+        """Troca a listagem, descartando chaves e permutações calculadas."""
+        self.modelos = modelos
+        self.criterios: list[tuple[str, bool]] = []
+        self.filtro: Optional[FiltroListagem] = None
+        self._chaves: dict[str, list[Any]] = {}
+        self._permutacoes: dict[tuple[tuple[str, bool], ...], list[int]] = {}
+        self._aceitos: Optional[bytearray] = None
+        self._ordem: list[int] = list(range(len(modelos)))
+        self._visiveis: list[int] = self._ordem
+
+    # === CHAVES ===
+
+    def _chave_modelo(self, coluna: str, modelo: CaminhoModel) -> Any:
+        if coluna == "nome":
+            return chave_natural(modelo.nome, self._colacao)
+        if coluna == "tamanho":
+            return -1 if modelo.tamanho is None else modelo.tamanho
+        if coluna == "modificado":
+            return -math.inf if modelo.modificado is None else modelo.modificado
+        if coluna == "extensao":
+            return os.path.splitext(modelo.nome)[1].lower()
+        if coluna in ("tipo", "status"):
+            return getattr(modelo, coluna).value
+        if coluna == "tipo_conteudo":
+            return modelo.tipo_conteudo or ""
+        raise ValueError(f"Coluna desconhecida: {coluna}")
+
+    def chaves(self, coluna: str) -> list[Any]:
+        """Chaves de uma coluna, calculadas uma única vez por listagem."""
+        if coluna not in self._chaves:
+            self._chaves[coluna] = [self._chave_modelo(coluna, m) for m in self.modelos]
+        return self._chaves[coluna]
+
+    # === ORDENAÇÃO ===
+
+    def ordenar(self, *criterios: Criterio) -> None:
+        """
+        Ordena por uma ou mais colunas (a primeira é a principal).
+
+        Cada ordenação é estável e o resultado fica em cache: voltar a uma ordenação
+        já usada não recalcula nada.
+
+        Args:
+            *criterios (str | tuple[str, bool]): Coluna ou (coluna, decrescente).
+
+        Raises:
+            ValueError: Se uma coluna não existir.
+        """
+        normalizados = [
+            (c, False) if isinstance(c, str) else (c[0], bool(c[1])) for c in criterios
+        ]
+        for coluna, _ in normalizados:
+            if coluna not in COLUNAS:
+                raise ValueError(f"Coluna desconhecida: {coluna}")
+        self.criterios = normalizados
+        self._ordem = self._permutacao(tuple(normalizados))
+        self._aplicar_filtro()
+
+    def _permutacao(self, criterios: tuple[tuple[str, bool], ...]) -> list[int]:
+        em_cache = self._permutacoes.get(criterios)
+        if em_cache is not None:
+            return em_cache
+
+        if not criterios:
+            ordem = list(range(len(self.modelos)))
+        else:
+            # Ordenações estáveis sucessivas, da coluna menos para a mais significativa;
+            # a base reaproveita a permutação em cache dos critérios secundários.
+            coluna, decrescente = criterios[0]
+            chaves = self.chaves(coluna)
+            if len(criterios) > 1:
+                ordem = list(self._permutacao(criterios[1:]))
+                ordem.sort(key=chaves.__getitem__, reverse=decrescente)
+            else:
+                ordem = sorted(range(len(chaves)), key=chaves.__getitem__, reverse=decrescente)
+
+        self._permutacoes[criterios] = ordem
+        return ordem
+
+    def _ordem_exibida(self) -> list[int]:
+        if not self.pastas_primeiro:
+            return self._ordem
+        pasta = PathType.DIRECTORY
+        modelos = self.modelos
+        pastas = [i for i in self._ordem if modelos[i].tipo == pasta]
+        if not pastas:
+            return self._ordem
+        return pastas + [i for i in self._ordem if modelos[i].tipo != pasta]
+
+    # === FILTROS ===
+
+    def filtrar(self, filtro: Optional[FiltroListagem]) -> None:
+        """Aplica (ou remove, com None) um filtro, preservando a ordenação em vigor."""
+        self.filtro = filtro
+        if filtro is None:
+            self._aceitos = None
+        else:
+            self._aceitos = bytearray(filtro.aceita(m) for m in self.modelos)
+        self._aplicar_filtro()
+
+    def _aplicar_filtro(self) -> None:
+        ordem = self._ordem_exibida()
+        aceitos = self._aceitos
+        self._visiveis = ordem if aceitos is None else [i for i in ordem if aceitos[i]]
+
+    # === JANELA VISÍVEL ===
+
+    def __len__(self) -> int:
+        """Quantidade de linhas após o filtro."""
+        return len(self._visiveis)
+
+    def indices(self) -> list[int]:
+        """Índices (em `modelos`) das linhas visíveis, na ordem exibida."""
+        return self._visiveis
+
+    def janela(self, inicio: int, quantidade: int) -> list[CaminhoModel]:
+        """
+        Modelos das linhas `inicio` a `inicio + quantidade` da listagem exibida.
+
+        A view insere apenas essas linhas na Treeview e pede uma nova janela ao rolar.
+        """
+        return [self.modelos[i] for i in self._visiveis[max(inicio, 0) : inicio + quantidade]]
+
+    def posicao(self, caminho: str) -> Optional[int]:
+        """Posição de um caminho na listagem exibida (ex.: manter a seleção ao reordenar)."""
+        for posicao, indice in enumerate(self._visiveis):
+            if self.modelos[indice].caminho == caminho:
+                return posicao
+        return None
+
+
+def ordenar_modelos(
+    modelos: Iterable[CaminhoModel], *criterios: Criterio, pastas_primeiro: bool = True
+) -> list[CaminhoModel]:
+    """Atalho: ordena uma listagem e retorna os modelos na ordem exibida."""
+    motor = MotorOrdenacao(list(modelos), pastas_primeiro=pastas_primeiro)
+    motor.ordenar(*criterios)
+    return motor.janela(0, len(motor))
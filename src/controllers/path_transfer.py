@@ -0,0 +1,419 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Motor de cópia e movimentação de arquivos para processamento em lote.
+
+Diferente de `ler_arquivo`/`escrever_arquivo`, que decodificam o conteúdo como texto,
+este módulo copia bytes diretamente entre descritores, priorizando os caminhos
+"zero-copy" do kernel (`os.copy_file_range` e `os.sendfile`) e recorrendo a leitura
+em blocos quando não estão disponíveis.
+
+Inclui:
+- `copiar_arquivo()` / `mover_arquivo()`: operações unitárias com retomada.
+- `processar_lote()`: execução paralela com pool de workers limitado.
+- `ResultadoTransferencia`: par de `CaminhoModel` (origem e destino) com status atualizados.
+
+A retomada usa um arquivo parcial `<destino>.part`: se a operação for interrompida,
+a próxima chamada continua a partir do tamanho já gravado. A identidade da origem
+(tamanho, mtime, dispositivo e inode) fica em `<destino>.part.origem`; se a origem
+mudou desde a interrupção, o parcial é descartado e a cópia recomeça do zero.
+"""
+
+import concurrent.futures
+from dataclasses import dataclass
+import errno
+import logging
+import os
+from pathlib import Path
+import shutil
+import stat
+import struct
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from controllers.io_scheduler import AgendadorIO, Prioridade
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import (
+    PathNotFoundError,
+    PathOperationError,
+    PathStatus,
+    PathType,
+)
+from tools.path_resolver import resolver_caminho
+
+# Callback de progresso: (caminho de destino, bytes copiados, total de bytes). A primeira
+# chamada de cada cópia informa o deslocamento inicial (não nulo ao retomar um parcial).
+Progresso = Callable[[str, int, int], None]
+
+SUFIXO_PARCIAL = ".part"
+SUFIXO_IDENTIDADE = ".origem"
+
+# Tamanho, mtime em ns, dispositivo e inode da origem do parcial.
+_IDENTIDADE = struct.Struct("<QqQQ")
+TAMANHO_BLOCO = 8 * 1024 * 1024
+
+# Erros que indicam que o método zero-copy não é suportado para o par de arquivos
+# (ENOTSOCK: plataformas em que `sendfile` exige um socket como destino).
+_ERROS_SEM_SUPORTE = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.ENOTSOCK,
+}
+
+
+@dataclass
+class ResultadoTransferencia:
+    """
+    Resultado de uma cópia ou movimentação.
+
+    Atributos:
+        origem (CaminhoModel): Origem (EXISTS na cópia, DELETED na movimentação).
+        destino (CaminhoModel): Destino (CREATED, UPDATED ou ERROR).
+    """
+
+    origem: CaminhoModel
+    destino: CaminhoModel
+
+
+# === CÓPIA DE CONTEÚDO ===
+
+
+def _copiar_copy_file_range(fd_in: int, fd_out: int, inicio: int, total: int) -> Iterator[int]:
+    posicao = inicio
+    while posicao < total:
+        copiados = os.copy_file_range(
+            fd_in, fd_out, min(TAMANHO_BLOCO, total - posicao), posicao, posicao
+        )
+        if copiados == 0:
+            break
+        posicao += copiados
+        yield posicao
+
+
+def _copiar_sendfile(fd_in: int, fd_out: int, inicio: int, total: int) -> Iterator[int]:
+    posicao = inicio
+    os.lseek(fd_out, posicao, os.SEEK_SET)
+    while posicao < total:
+        copiados = os.sendfile(fd_out, fd_in, posicao, min(TAMANHO_BLOCO, total - posicao))
+        if copiados == 0:
+            break
+        posicao += copiados
+        yield posicao
+
+
+def _copiar_em_blocos(fd_in: int, fd_out: int, inicio: int, total: int) -> Iterator[int]:
+    posicao = inicio
+    os.lseek(fd_in, posicao, os.SEEK_SET)
+    os.lseek(fd_out, posicao, os.SEEK_SET)
+    while posicao < total:
+        dados = os.read(fd_in, min(TAMANHO_BLOCO, total - posicao))
+        if not dados:
+            break
+        visao = memoryview(dados)
+        while visao:
+            visao = visao[os.write(fd_out, visao) :]
+        posicao += len(dados)
+        yield posicao
+
+
+def _metodos_copia() -> list[Callable[[int, int, int, int], Iterator[int]]]:
+    metodos: list[Callable[[int, int, int, int], Iterator[int]]] = []
+    if hasattr(os, "copy_file_range"):
+        metodos.append(_copiar_copy_file_range)
+    if hasattr(os, "sendfile"):
+        metodos.append(_copiar_sendfile)
+    metodos.append(_copiar_em_blocos)
+    return metodos
+
+
+def _copiar_conteudo(
+    origem: Path,
+    parcial: Path,
+    inicio: int,
+    progresso: Optional[Progresso],
+    nome_destino: str,
+) -> None:
+    fd_in = os.open(origem, os.O_RDONLY)
+    try:
+        fd_out = os.open(parcial, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            total = os.fstat(fd_in).st_size
+            posicao = inicio
+            if progresso:
+                progresso(nome_destino, posicao, total)
+            for metodo in _metodos_copia():
+                try:
+                    for posicao in metodo(fd_in, fd_out, posicao, total):
+                        if progresso:
+                            progresso(nome_destino, posicao, total)
+                    break
+                except OSError as e:
+                    if e.errno not in _ERROS_SEM_SUPORTE:
+                        raise
+            os.ftruncate(fd_out, posicao)
+        finally:
+            os.close(fd_out)
+    finally:
+        os.close(fd_in)
+
+
+def _identidade(caminho: Path) -> bytes:
+    info = caminho.stat()
+    return _IDENTIDADE.pack(info.st_size, info.st_mtime_ns, info.st_dev, info.st_ino)
+
+
+def _preparar_parcial(origem: Path, parcial: Path, retomar: bool) -> int:
+    """
+    Decide de onde a cópia continua e registra a identidade da origem.
+
+    Returns:
+        int: Deslocamento inicial (0 se o parcial não existir ou for de outra origem).
+    """
+    arquivo_identidade = parcial.with_name(parcial.name + SUFIXO_IDENTIDADE)
+    identidade = _identidade(origem)
+    if retomar and parcial.exists():
+        try:
+            registrada = arquivo_identidade.read_bytes()
+        except FileNotFoundError:
+            registrada = b""
+        tamanho = parcial.stat().st_size
+        if registrada == identidade and tamanho <= origem.stat().st_size:
+            return tamanho
+    if parcial.exists():
+        parcial.unlink()
+    arquivo_identidade.write_bytes(identidade)
+    return 0
+
+
+# === OPERAÇÕES UNITÁRIAS ===
+
+
+def _resolver_sem_ultimo_link(caminho: Union[str, Path]) -> Path:
+    """Resolve apenas o diretório-pai: um link simbólico no último componente é mantido."""
+    bruto = Path(os.path.expanduser(os.fspath(caminho)))
+    if bruto.name in ("", ".", ".."):
+        return resolver_caminho(bruto)
+    return resolver_caminho(bruto.parent) / bruto.name
+
+
+def _validar_origem(origem: Union[str, Path], seguir_links: bool = True) -> Path:
+    """
+    Valida a origem de uma transferência.
+
+    Com `seguir_links=False`, um link simbólico é aceito como o próprio arquivo (é o
+    link que será movido, não o alvo).
+    """
+    if seguir_links:
+        caminho = resolver_caminho(origem)
+    else:
+        caminho = _resolver_sem_ultimo_link(origem)
+    try:
+        modo = (os.stat(caminho) if seguir_links else os.lstat(caminho)).st_mode
+    except FileNotFoundError as e:
+        raise PathNotFoundError(str(origem)) from e
+    except OSError as e:
+        raise PathOperationError(str(origem), f"Erro ao acessar origem: {e}") from e
+    if not (stat.S_ISREG(modo) or stat.S_ISLNK(modo)):
+        raise PathOperationError(str(origem), "Caminho não é um arquivo")
+    return caminho
+
+
+def _mover_link_entre_dispositivos(origem: Path, destino: Path) -> None:
+    # Recria o link no destino (apontando para o mesmo alvo) e remove o original.
+    temporario = destino.with_name(destino.name + SUFIXO_PARCIAL)
+    temporario.unlink(missing_ok=True)
+    os.symlink(os.readlink(origem), temporario)
+    os.replace(temporario, destino)
+    origem.unlink()
+
+
+def _modelo(caminho: Path, status: PathStatus, eh_link: bool = False) -> CaminhoModel:
+    if eh_link:
+        # `from_path` seguiria o link e descreveria o alvo.
+        info = caminho.lstat()
+        return CaminhoModel(
+            caminho.name, PathType.SYMLINK, str(caminho), status, info.st_size, info.st_mtime
+        )
+    modelo = CaminhoModel.from_path(caminho)
+    modelo.status = status
+    return modelo
+
+
+def copiar_arquivo(
+    origem: Union[str, Path],
+    destino: Union[str, Path],
+    retomar: bool = True,
+    progresso: Optional[Progresso] = None,
+) -> ResultadoTransferencia:
+    """
+    Copia um arquivo preservando permissões e datas.
+
+    Args:
+        origem (str | Path): Arquivo de origem.
+        destino (str | Path): Caminho de destino (o diretório-pai é criado se preciso).
+        retomar (bool): Continua a partir de `<destino>.part`, se existir e tiver sido
+            gravado a partir da mesma origem (inalterada).
+        progresso (Progresso | None): Callback chamado a cada bloco copiado.
+
+    Raises:
+        PathNotFoundError: Se a origem não existir.
+        PathOperationError: Se a origem não for arquivo ou ocorrer erro de E/S.
+
+    Returns:
+        ResultadoTransferencia: Origem (EXISTS) e destino (CREATED ou UPDATED).
+    """
+    caminho_origem = _validar_origem(origem)
+    caminho_destino = resolver_caminho(destino)
+    parcial = caminho_destino.with_name(caminho_destino.name + SUFIXO_PARCIAL)
+    status = PathStatus.UPDATED if caminho_destino.exists() else PathStatus.CREATED
+
+    try:
+        caminho_destino.parent.mkdir(parents=True, exist_ok=True)
+        inicio = _preparar_parcial(caminho_origem, parcial, retomar)
+        _copiar_conteudo(caminho_origem, parcial, inicio, progresso, str(caminho_destino))
+        shutil.copystat(caminho_origem, parcial)
+        os.replace(parcial, caminho_destino)
+        parcial.with_name(parcial.name + SUFIXO_IDENTIDADE).unlink(missing_ok=True)
+    except OSError as e:
+        raise PathOperationError(str(destino), f"Erro ao copiar arquivo: {e}") from e
+
+    return ResultadoTransferencia(
+        origem=_modelo(caminho_origem, PathStatus.EXISTS),
+        destino=_modelo(caminho_destino, status),
+    )
+
+
+def mover_arquivo(
+    origem: Union[str, Path],
+    destino: Union[str, Path],
+    retomar: bool = True,
+    progresso: Optional[Progresso] = None,
+) -> ResultadoTransferencia:
+    """
+    Move um arquivo; entre sistemas de arquivos diferentes, copia e remove a origem.
+
+    Links simbólicos são movidos como links: o alvo não é alterado.
+
+    Args:
+        origem (str | Path): Arquivo de origem.
+        destino (str | Path): Caminho de destino.
+        retomar (bool): Repassado para a cópia entre dispositivos.
+        progresso (Progresso | None): Callback de progresso da cópia.
+
+    Raises:
+        PathNotFoundError: Se a origem não existir.
+        PathOperationError: Se a origem não for arquivo ou ocorrer erro de E/S.
+
+    Returns:
+        ResultadoTransferencia: Origem (DELETED) e destino (CREATED ou UPDATED).
+    """
+    caminho_origem = _validar_origem(origem, seguir_links=False)
+    caminho_destino = _resolver_sem_ultimo_link(destino)
+    eh_link = caminho_origem.is_symlink()
+    status = PathStatus.UPDATED if os.path.lexists(caminho_destino) else PathStatus.CREATED
+
+    try:
+        caminho_destino.parent.mkdir(parents=True, exist_ok=True)
+        os.rename(caminho_origem, caminho_destino)
+        tamanho = caminho_destino.lstat().st_size
+        if progresso:
+            progresso(str(caminho_destino), tamanho, tamanho)
+        destino_modelo = _modelo(caminho_destino, status, eh_link)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise PathOperationError(str(origem), f"Erro ao mover arquivo: {e}") from e
+        if eh_link:
+            try:
+                _mover_link_entre_dispositivos(caminho_origem, caminho_destino)
+            except OSError as erro:
+                raise PathOperationError(str(origem), f"Erro ao mover link: {erro}") from erro
+            destino_modelo = _modelo(caminho_destino, status, eh_link=True)
+        else:
+            destino_modelo = copiar_arquivo(
+                caminho_origem, caminho_destino, retomar, progresso
+            ).destino
+            try:
+                caminho_origem.unlink()
+            except OSError as erro:
+                raise PathOperationError(str(origem), f"Erro ao remover origem: {erro}") from erro
+
+    origem_modelo = CaminhoModel(
+        nome=caminho_origem.name,
+        tipo=PathType.SYMLINK if eh_link else PathType.FILE,
+        caminho=str(caminho_origem),
+        status=PathStatus.DELETED,
+    )
+    return ResultadoTransferencia(origem=origem_modelo, destino=destino_modelo)
+
+
+# === LOTE ===
+
+
+def _resultado_erro(origem: Union[str, Path], destino: Union[str, Path]) -> ResultadoTransferencia:
+    modelos = []
+    for caminho in (origem, destino):
+        modelo = CaminhoModel.from_path(caminho)
+        modelo.status = PathStatus.ERROR
+        modelos.append(modelo)
+    return ResultadoTransferencia(origem=modelos[0], destino=modelos[1])
+
+
+def processar_lote(
+    pares: Iterable[tuple[Union[str, Path], Union[str, Path]]],
+    mover: bool = False,
+    max_workers: int = 4,
+    retomar: bool = True,
+    progresso: Optional[Progresso] = None,
+    agendador: Optional[AgendadorIO] = None,
+) -> Iterator[ResultadoTransferencia]:
+    """
+    Copia ou move vários arquivos em paralelo.
+
+    No máximo `2 * max_workers` operações ficam pendentes ao mesmo tempo, de modo que
+    listas muito grandes de pares são consumidas sob demanda. Falhas individuais não
+    interrompem o lote: o par correspondente é retornado com status ERROR.
+
+    Args:
+        pares (Iterable[tuple]): Pares (origem, destino).
+        mover (bool): Move em vez de copiar.
+        max_workers (int): Quantidade de threads do pool.
+        retomar (bool): Retoma cópias interrompidas.
+        progresso (Progresso | None): Callback de progresso (chamado pelas threads do pool).
+        agendador (AgendadorIO | None): Limita operações e bytes por segundo, com
+            prioridade NORMAL.
+
+    Yields:
+        ResultadoTransferencia: Resultados na ordem de conclusão.
+    """
+    operacao = mover_arquivo if mover else copiar_arquivo
+    if agendador is not None:
+        progresso = agendador.como_progresso(Prioridade.NORMAL, progresso)
+    limite = 2 * max_workers
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pendentes: dict[concurrent.futures.Future[ResultadoTransferencia], tuple] = {}
+
+        def coletar(
+            concluidos: Iterable[concurrent.futures.Future[ResultadoTransferencia]],
+        ) -> Iterator[ResultadoTransferencia]:
+            for futuro in concluidos:
+                origem, destino = pendentes.pop(futuro)
+                try:
+                    yield futuro.result()
+                except PathOperationError as e:
+                    logging.error(" Falha na transferência -> %s", e)
+                    yield _resultado_erro(origem, destino)
+
+        for origem, destino in pares:
+            if len(pendentes) >= limite:
+                concluidos, _ = concurrent.futures.wait(
+                    pendentes, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                yield from coletar(concluidos)
+            if agendador is not None:
+                agendador.adquirir(Prioridade.NORMAL)
+            futuro = pool.submit(operacao, origem, destino, retomar, progresso)
+            pendentes[futuro] = (origem, destino)
+
+        yield from coletar(concurrent.futures.as_completed(list(pendentes)))
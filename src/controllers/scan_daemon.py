@@ -0,0 +1,446 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Daemon local de varredura compartilhado pela GUI e pelo terminal.
+
+Cada `PathView` ou execução no terminal monta o próprio `PathController`, com um cache
+que se perde ao final do processo. O daemon concentra varredura, cache e índices em um
+único processo de longa duração e atende vários clientes por um socket Unix.
+
+Protocolo: cada mensagem é um quadro `!BI` (código da operação ou do status, tamanho
+do corpo) seguido do corpo em JSON compacto. Conexões são persistentes: um cliente
+pode enviar várias requisições na mesma conexão.
+
+Inclui:
+- `ScanDaemon`: servidor com cache de listagens validado pelo mtime do diretório e
+  pelo `lstat` de cada entrada.
+- `ClienteDaemon`: cliente fino com `listar`, `stat`, `buscar` e `ler`.
+- `main()`: inicia o daemon em primeiro plano.
+"""
+
+from collections import OrderedDict
+from dataclasses import asdict
+import json
+import logging
+import os
+from pathlib import Path
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+from typing import Any, Optional, Union
+
+from controllers.io_scheduler import AgendadorIO, Prioridade
+from controllers.path_scanner import mesclar_no_cache
+from controllers.path_search import buscar_conteudo
+from models.path_snapshot import (
+    RegistroSnapshot,
+    listar_nivel,
+    registro_para_modelo,
+    varrer_registros,
+)
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import (
+    PathAlreadyExistsError,
+    PathInvalidError,
+    PathNotFoundError,
+    PathOperationError,
+    PathStatus,
+    PathType,
+)
+from tools.path_resolver import resolver_caminho
+from tools.text_reader import LeitorTexto
+
+_QUADRO = struct.Struct("!BI")
+
+OP_LISTAR = 1
+OP_STAT = 2
+OP_BUSCAR = 3
+OP_LER = 4
+
+STATUS_OK = 0
+STATUS_ERRO = 1
+
+MAX_LEITORES = 64
+
+# Identidade de uma entrada listada: (mtime em ns, tamanho).
+_Identidade = tuple[int, int]
+
+
+def caminho_socket_padrao() -> str:
+    """Caminho padrão do socket: `$XDG_RUNTIME_DIR` ou o diretório temporário."""
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, "tkinter-mvc-app.sock")
+
+
+# === SERIALIZAÇÃO ===
+
+
+def _modelo_para_dict(modelo: CaminhoModel) -> dict[str, Any]:
+    dados: dict[str, Any] = dict(modelo.to_dict())
+    dados.update(
+        tamanho=modelo.tamanho,
+        modificado=modelo.modificado,
+        tipo_conteudo=modelo.tipo_conteudo,
+    )
+    return dados
+
+
+def _dict_para_modelo(dados: dict[str, Any]) -> CaminhoModel:
+    return CaminhoModel(
+        nome=dados["nome"],
+        tipo=PathType.from_str(dados["tipo"]),
+        caminho=dados["caminho"],
+        status=PathStatus.from_str(dados["status"]),
+        tamanho=dados.get("tamanho"),
+        modificado=dados.get("modificado"),
+        tipo_conteudo=dados.get("tipo_conteudo"),
+    )
+
+
+def _enviar(conexao: socket.socket, codigo: int, corpo: Any) -> None:
+    dados = json.dumps(corpo, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    conexao.sendall(_QUADRO.pack(codigo, len(dados)) + dados)
+
+
+def _receber_exato(conexao: socket.socket, tamanho: int) -> Optional[bytes]:
+    partes = bytearray()
+    while len(partes) < tamanho:
+        parte = conexao.recv(tamanho - len(partes))
+        if not parte:
+            return None
+        partes += parte
+    return bytes(partes)
+
+
+def _receber(conexao: socket.socket) -> Optional[tuple[int, Any]]:
+    cabecalho = _receber_exato(conexao, _QUADRO.size)
+    if cabecalho is None:
+        return None
+    codigo, tamanho = _QUADRO.unpack(cabecalho)
+    corpo = _receber_exato(conexao, tamanho)
+    if corpo is None:
+        return None
+    return codigo, json.loads(corpo.decode("utf-8"))
+
+
+# === SERVIDOR ===
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "ScanDaemon"
+
+    def handle(self) -> None:
+        while (mensagem := _receber(self.request)) is not None:
+            operacao, parametros = mensagem
+            try:
+                resposta = self.server.executar(operacao, parametros)
+            except PathOperationError as e:
+                self._responder_erro(e)
+            except (KeyError, TypeError, ValueError) as e:
+                self._responder_erro(PathOperationError("", f"Requisição inválida: {e}"))
+            else:
+                _enviar(self.request, STATUS_OK, resposta)
+
+    def _responder_erro(self, erro: PathOperationError) -> None:
+        corpo = {"erro": erro.__class__.__name__, "mensagem": erro.message, "caminho": erro.path}
+        _enviar(self.request, STATUS_ERRO, corpo)
+
+
+class ScanDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Servidor que mantém cache e índices quentes para vários clientes.
+
+    O lock global protege apenas as estruturas em memória; E/S de disco (listagens,
+    `lstat` das entradas e leitura de arquivos) acontece fora dele. Toda E/S passa
+    pelo `agendador`: `listar`, `stat` e `ler` como INTERATIVA, `buscar` como NORMAL.
+
+    Raises:
+        PathAlreadyExistsError: Se outro daemon já estiver escutando no socket, ou se o
+            caminho existir e não for um socket.
+
+    Atributos:
+        cache (dict[str, CaminhoModel]): Modelos conhecidos, indexados pelo caminho.
+        indice_tipo (dict[PathType, set[str]]): Índice tipo -> caminhos.
+        agendador (AgendadorIO): Agendador de E/S (sem limites, por padrão).
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, caminho_socket: Optional[str] = None, agendador: Optional[AgendadorIO] = None
+    ) -> None:
+        self.caminho_socket = caminho_socket or caminho_socket_padrao()
+        self.agendador = agendador if agendador is not None else AgendadorIO()
+        self._remover_socket_orfao()
+        # O socket já nasce com permissão 0600: não há janela entre o bind e um chmod.
+        umask = os.umask(0o177)
+        try:
+            super().__init__(self.caminho_socket, _Handler)
+        finally:
+            os.umask(umask)
+
+        self.cache: dict[str, CaminhoModel] = {}
+        self.indice_tipo: dict[PathType, set[str]] = {}
+        self._listagens: dict[str, tuple[int, dict[str, _Identidade]]] = {}
+        self._leitores: OrderedDict[str, tuple[int, LeitorTexto, threading.Lock]] = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def _remover_socket_orfao(self) -> None:
+        """Remove o socket de um daemon encerrado; recusa se ainda houver um escutando."""
+        try:
+            info = os.lstat(self.caminho_socket)
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(info.st_mode):
+            raise PathAlreadyExistsError(self.caminho_socket)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sonda:
+            try:
+                sonda.connect(self.caminho_socket)
+            except (ConnectionRefusedError, FileNotFoundError):
+                pass
+            else:
+                raise PathAlreadyExistsError(self.caminho_socket)
+        os.unlink(self.caminho_socket)
+
+    # === OPERAÇÕES ===
+
+    def executar(self, operacao: int, parametros: dict[str, Any]) -> Any:
+        if operacao == OP_LISTAR:
+            return [_modelo_para_dict(m) for m in self.listar(parametros["caminho"])]
+        if operacao == OP_STAT:
+            return _modelo_para_dict(self.stat(parametros["caminho"]))
+        if operacao == OP_BUSCAR:
+            return [
+                asdict(ocorrencia)
+                for ocorrencia in self.buscar(
+                    parametros["raiz"],
+                    parametros["padrao"],
+                    bool(parametros.get("regex", False)),
+                    int(parametros.get("limite", 1000)),
+                )
+            ]
+        if operacao == OP_LER:
+            return self.ler(
+                parametros["caminho"],
+                int(parametros.get("inicio", 0)),
+                int(parametros.get("quantidade", 100)),
+            )
+        raise PathOperationError(str(operacao), "Operação desconhecida")
+
+    def listar(self, caminho: str) -> list[CaminhoModel]:
+        """
+        Lista um diretório, reaproveitando o cache enquanto o mtime não mudar.
+
+        O mtime do diretório só muda quando entradas são criadas, removidas ou
+        renomeadas; alterações de conteúdo são detectadas pelo `lstat` de cada entrada,
+        que atualiza `tamanho` e `modificado` sem reler o diretório.
+        """
+        diretorio = str(resolver_caminho(caminho))
+        try:
+            mtime = self.agendador.stat(diretorio, Prioridade.INTERATIVA).st_mtime_ns
+        except FileNotFoundError as e:
+            raise PathNotFoundError(caminho) from e
+        except OSError as e:
+            raise PathOperationError(caminho, f"Erro ao listar diretório: {e}") from e
+        if not os.path.isdir(diretorio):
+            raise PathOperationError(caminho, "Caminho não é um diretório")
+
+        with self._lock:
+            em_cache = self._listagens.get(diretorio)
+            entradas = dict(em_cache[1]) if em_cache is not None and em_cache[0] == mtime else None
+        if entradas is not None:
+            modelos = self._revalidar(diretorio, mtime, entradas)
+            if modelos is not None:
+                return modelos
+
+        registros, _ = listar_nivel(diretorio)
+        self.agendador.adquirir(Prioridade.INTERATIVA, len(registros))
+        modelos = [registro_para_modelo(diretorio, r) for r in registros]
+        identidades = {
+            m.caminho: (r.modificado_ns, r.tamanho) for m, r in zip(modelos, registros)
+        }
+        with self._lock:
+            mesclar_no_cache(self.cache, modelos, self.indice_tipo)
+            self._listagens[diretorio] = (mtime, identidades)
+        return modelos
+
+    def _revalidar(
+        self, diretorio: str, mtime: int, entradas: dict[str, _Identidade]
+    ) -> Optional[list[CaminhoModel]]:
+        """Confere cada entrada em cache com `lstat`; None se a listagem precisar ser refeita."""
+        modelos: list[CaminhoModel] = []
+        alterados: list[CaminhoModel] = []
+        self.agendador.adquirir(Prioridade.INTERATIVA, len(entradas))
+        for caminho, identidade in entradas.items():
+            try:
+                info = os.lstat(caminho)
+            except OSError:
+                return None
+            with self._lock:
+                modelo = self.cache.get(caminho)
+            if modelo is None or (info.st_mtime_ns, info.st_size) != identidade:
+                registro = RegistroSnapshot(
+                    os.path.basename(caminho),
+                    info.st_mode,
+                    info.st_ino,
+                    info.st_size,
+                    info.st_mtime_ns,
+                )
+                modelo = registro_para_modelo(diretorio, registro)
+                entradas[caminho] = (info.st_mtime_ns, info.st_size)
+                alterados.append(modelo)
+            modelos.append(modelo)
+        if alterados:
+            with self._lock:
+                mesclar_no_cache(self.cache, alterados, self.indice_tipo)
+                self._listagens[diretorio] = (mtime, entradas)
+        return modelos
+
+    def stat(self, caminho: str) -> CaminhoModel:
+        modelo = CaminhoModel.from_path(caminho)
+        if modelo.status == PathStatus.EXISTS:
+            info = self.agendador.stat(modelo.caminho, Prioridade.INTERATIVA)
+            modelo.tamanho, modelo.modificado = info.st_size, info.st_mtime
+            with self._lock:
+                mesclar_no_cache(self.cache, [modelo], self.indice_tipo)
+        return modelo
+
+    def buscar(self, raiz: str, padrao: str, regex: bool, limite: int) -> list[Any]:
+        base = resolver_caminho(raiz)
+        if not base.is_dir():
+            raise PathInvalidError(raiz)
+        registros = varrer_registros(base, medir=self.agendador.registrar_latencia)
+        arquivos = (
+            registro_para_modelo(str(base), r)
+            for r in self.agendador.limitar(registros, Prioridade.NORMAL)
+            if PathType.from_mode(r.modo) == PathType.FILE
+        )
+        resultados = []
+        busca = buscar_conteudo(
+            arquivos, padrao, regex=regex, agendador=self.agendador, prioridade=Prioridade.NORMAL
+        )
+        try:
+            for ocorrencia in busca:
+                resultados.append(ocorrencia)
+                if len(resultados) >= limite:
+                    break
+        finally:
+            busca.close()
+        return resultados
+
+    def ler(self, caminho: str, inicio: int, quantidade: int) -> list[str]:
+        """Lê um intervalo de linhas, mantendo o índice de linhas do arquivo em cache."""
+        arquivo = str(resolver_caminho(caminho))
+        try:
+            mtime = self.agendador.stat(arquivo, Prioridade.INTERATIVA).st_mtime_ns
+        except OSError as e:
+            raise PathNotFoundError(caminho) from e
+        with self._lock:
+            em_cache = self._leitores.get(arquivo)
+        if em_cache is None or em_cache[0] != mtime:
+            # Abrir o leitor detecta a codificação (lê o arquivo): fora do lock global.
+            novo = (mtime, LeitorTexto(arquivo), threading.Lock())
+            with self._lock:
+                em_cache = self._leitores.get(arquivo)
+                if em_cache is None or em_cache[0] != mtime:
+                    em_cache = self._leitores[arquivo] = novo
+        with self._lock:
+            if arquivo in self._leitores:
+                self._leitores.move_to_end(arquivo)
+            while len(self._leitores) > MAX_LEITORES:
+                self._leitores.popitem(last=False)
+        # O índice de linhas do leitor não é thread-safe: um lock por arquivo.
+        with em_cache[2]:
+            self.agendador.adquirir(Prioridade.INTERATIVA)
+            return em_cache[1].intervalo(inicio, quantidade)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.caminho_socket):
+            os.unlink(self.caminho_socket)
+
+
+def iniciar_em_thread(
+    caminho_socket: Optional[str] = None, agendador: Optional[AgendadorIO] = None
+) -> ScanDaemon:
+    """Inicia o daemon em uma thread de fundo (uso embutido e testes)."""
+    servidor = ScanDaemon(caminho_socket, agendador)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+
+# === CLIENTE ===
+
+
+class ClienteDaemon:
+    """
+    Cliente fino do daemon; mantém uma conexão persistente.
+
+    Raises:
+        PathOperationError: Repassado a partir dos erros informados pelo daemon.
+    """
+
+    def __init__(self, caminho_socket: Optional[str] = None) -> None:
+        self._conexao = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._conexao.connect(caminho_socket or caminho_socket_padrao())
+        self._lock = threading.Lock()
+
+    def _requisitar(self, operacao: int, parametros: dict[str, Any]) -> Any:
+        with self._lock:
+            _enviar(self._conexao, operacao, parametros)
+            resposta = _receber(self._conexao)
+        if resposta is None:
+            raise PathOperationError("", "Conexão com o daemon encerrada")
+        status, corpo = resposta
+        if status != STATUS_OK:
+            erros = {"PathNotFoundError": PathNotFoundError, "PathInvalidError": PathInvalidError}
+            if corpo["erro"] in erros:
+                raise erros[corpo["erro"]](corpo["caminho"])
+            raise PathOperationError(corpo["caminho"], corpo["mensagem"])
+        return corpo
+
+    def listar(self, caminho: Union[str, Path]) -> list[CaminhoModel]:
+        dados = self._requisitar(OP_LISTAR, {"caminho": str(caminho)})
+        return [_dict_para_modelo(d) for d in dados]
+
+    def stat(self, caminho: Union[str, Path]) -> CaminhoModel:
+        return _dict_para_modelo(self._requisitar(OP_STAT, {"caminho": str(caminho)}))
+
+    def buscar(
+        self, raiz: Union[str, Path], padrao: str, regex: bool = False, limite: int = 1000
+    ) -> list[dict[str, Any]]:
+        parametros = {"raiz": str(raiz), "padrao": padrao, "regex": regex, "limite": limite}
+        return list(self._requisitar(OP_BUSCAR, parametros))
+
+    def ler(self, caminho: Union[str, Path], inicio: int = 0, quantidade: int = 100) -> list[str]:
+        parametros = {"caminho": str(caminho), "inicio": inicio, "quantidade": quantidade}
+        return list(self._requisitar(OP_LER, parametros))
+
+    def fechar(self) -> None:
+        self._conexao.close()
+
+    def __enter__(self) -> "ClienteDaemon":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.fechar()
+
+
+def main() -> None:
+    """Inicia o daemon em primeiro plano no socket padrão."""
+    logging.basicConfig(level=logging.INFO)
+    with ScanDaemon() as servidor:
+        logging.info(" Daemon de varredura escutando em %s", servidor.caminho_socket)
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
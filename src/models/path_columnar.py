@@ -0,0 +1,426 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Formato colunar compacto para exportar e recarregar varreduras inteiras.
+
+Diferente de `to_dict()`, que gera um dicionário de strings por linha, o arquivo
+guarda cada campo em uma coluna de largura fixa. Diretórios e tipos de conteúdo, que
+se repetem, vão para uma tabela de strings sem repetição; os nomes, quase sempre
+únicos, são gravados em sequência, sem deduplicação. A gravação é feita em streaming,
+e a leitura mapeia o arquivo com `mmap`: abrir um scan de 10M de entradas não
+percorre as linhas, e cada `CaminhoModel` só é montado quando acessado.
+
+Layout (little-endian em qualquer plataforma, seções alinhadas em 8 bytes):
+- Cabeçalho: `MAGIC`, contagens e deslocamento de cada seção.
+- Colunas: diretório (u32), fim do nome (u64), tipo de conteúdo (u32), tipo (u8),
+  status (u8), tamanho (i64, -1 = desconhecido), modificado (f64, NaN = desconhecido).
+- Nomes: bytes UTF-8 concatenados; o nome da linha `i` vai do fim da linha `i - 1`
+  (ou 0) ao fim da linha `i`.
+- Tabela de strings: deslocamentos (u64) e bytes UTF-8. As primeiras strings são os
+  valores de `PathType` e `PathStatus`; os códigos de tipo e status são posições
+  nessa lista, o que mantém o arquivo legível se os enums mudarem de ordem.
+
+Inclui:
+- `EscritorColunar` / `gravar_colunar()`: gravação em streaming.
+- `ScanColunar`: leitura via `mmap` com acesso aleatório e filtros por coluna.
+- `exportar_csv()` / `exportar_jsonl()`: exportadores em streaming.
+"""
+
+from array import array
+import csv
+import json
+import math
+import mmap
+import os
+from pathlib import Path
+import re
+import struct
+import sys
+import tempfile
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
+
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathInvalidError, PathOperationError, PathStatus, PathType
+
+MAGIC = b"PCOLS\x02"
+
+# Linhas, strings, quantidade de tipos e de status, deslocamentos das 10 seções.
+_CABECALHO = struct.Struct("<QQII10Q")
+_SEM_STRING = 0xFFFFFFFF
+_LOTE = 65536
+
+# (nome da seção, código do array)
+_COLUNAS = (
+    ("diretorio", "I"),
+    ("nome", "Q"),
+    ("conteudo", "I"),
+    ("tipo", "B"),
+    ("status", "B"),
+    ("tamanho", "q"),
+    ("modificado", "d"),
+)
+
+CAMPOS_EXPORTACAO = ("nome", "tipo", "caminho", "status", "tamanho", "modificado", "tipo_conteudo")
+
+
+# `array` grava na ordem nativa: em máquinas big-endian as colunas são invertidas.
+_INVERTER_BYTES = sys.byteorder == "big"
+_CODIGO_POR_LARGURA = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+
+def _gravar_array(coluna: "array[Any]", saida: BinaryIO) -> None:
+    if _INVERTER_BYTES:
+        coluna = array(coluna.typecode, coluna)
+        coluna.byteswap()
+    coluna.tofile(saida)
+
+
+def _bytes_nativos(dados: memoryview, largura: int) -> memoryview:
+    """Bytes de uma coluna little-endian na ordem nativa (cópia só em big-endian)."""
+    if not _INVERTER_BYTES or largura == 1:
+        return dados
+    coluna = array(_CODIGO_POR_LARGURA[largura])
+    coluna.frombytes(dados)
+    coluna.byteswap()
+    return memoryview(coluna).cast("B")
+
+
+def _alinhar(saida: BinaryIO) -> int:
+    posicao = saida.tell()
+    if posicao % 8:
+        saida.write(b"\0" * (8 - posicao % 8))
+    return saida.tell()
+
+
+class EscritorColunar:
+    """
+    Grava modelos no formato colunar, em streaming.
+
+    Cada coluna é acumulada em lotes e despejada em um arquivo temporário; ao fechar,
+    as colunas, os nomes e a tabela de strings são concatenados no destino. A memória
+    usada cresce apenas com a quantidade de diretórios e tipos de conteúdo distintos.
+    Se o bloco `with` terminar com exceção, os temporários são descartados e o destino
+    não é gravado.
+
+    Uso:
+        with EscritorColunar(destino) as escritor:
+            for modelo in modelos:
+                escritor.adicionar(modelo)
+    """
+
+    def __init__(self, destino: Union[str, Path]) -> None:
+        self.destino = Path(destino)
+        self.linhas = 0
+        self._temporario = tempfile.TemporaryDirectory(dir=self.destino.parent)
+        self._arquivos = {
+            nome: open(  # pylint: disable=consider-using-with
+                os.path.join(self._temporario.name, nome), "wb"
+            )
+            for nome, _ in _COLUNAS
+        }
+        self._lotes: dict[str, "array[Any]"] = {nome: array(codigo) for nome, codigo in _COLUNAS}
+        self._nomes = open(  # pylint: disable=consider-using-with
+            os.path.join(self._temporario.name, "nomes"), "wb"
+        )
+        self._fim_nomes = 0
+        self._strings: dict[str, int] = {}
+        self._offsets_strings = array("Q", [0])
+        self._dados_strings = open(  # pylint: disable=consider-using-with
+            os.path.join(self._temporario.name, "strings"), "wb"
+        )
+        # Vocabulário dos enums, sem deduplicação: o código é a posição no enum.
+        for valor in (*PathType, *PathStatus):
+            self._gravar_string(valor.value)
+        self._codigos_tipo = {tipo: i for i, tipo in enumerate(PathType)}
+        self._codigos_status = {status: i for i, status in enumerate(PathStatus)}
+
+    def _gravar_string(self, texto: str) -> int:
+        dados = texto.encode("utf-8", "surrogateescape")
+        self._dados_strings.write(dados)
+        self._offsets_strings.append(self._offsets_strings[-1] + len(dados))
+        return len(self._offsets_strings) - 2
+
+    def _string(self, texto: str) -> int:
+        indice = self._strings.get(texto)
+        if indice is None:
+            indice = self._strings[texto] = self._gravar_string(texto)
+        return indice
+
+    def adicionar(self, modelo: CaminhoModel) -> None:
+        diretorio, nome = os.path.split(modelo.caminho)
+        lotes = self._lotes
+        lotes["diretorio"].append(self._string(diretorio))
+        dados_nome = (modelo.nome or nome).encode("utf-8", "surrogateescape")
+        self._fim_nomes += self._nomes.write(dados_nome)
+        lotes["nome"].append(self._fim_nomes)
+        lotes["conteudo"].append(
+            _SEM_STRING if modelo.tipo_conteudo is None else self._string(modelo.tipo_conteudo)
+        )
+        lotes["tipo"].append(self._codigos_tipo[modelo.tipo])
+        lotes["status"].append(self._codigos_status[modelo.status])
+        lotes["tamanho"].append(-1 if modelo.tamanho is None else modelo.tamanho)
+        lotes["modificado"].append(math.nan if modelo.modificado is None else modelo.modificado)
+        self.linhas += 1
+        if len(lotes["tipo"]) >= _LOTE:
+            self._despejar()
+
+    def _despejar(self) -> None:
+        for nome, lote in self._lotes.items():
+            _gravar_array(lote, self._arquivos[nome])
+            del lote[:]
+
+    def _fechar_temporarios(self) -> None:
+        for arquivo in (*self._arquivos.values(), self._nomes, self._dados_strings):
+            arquivo.close()
+
+    def descartar(self) -> None:
+        """Remove os temporários sem gravar o destino (ex.: varredura interrompida)."""
+        self._fechar_temporarios()
+        self._temporario.cleanup()
+
+    def fechar(self) -> Path:
+        """Finaliza o arquivo de destino e remove os temporários."""
+        self._despejar()
+        self._fechar_temporarios()
+        try:
+            with open(self.destino, "wb") as saida:
+                saida.write(b"\0" * (len(MAGIC) + _CABECALHO.size))
+                deslocamentos = []
+                for nome, _ in _COLUNAS:
+                    deslocamentos.append(_alinhar(saida))
+                    with open(self._arquivos[nome].name, "rb") as coluna:
+                        while bloco := coluna.read(1 << 20):
+                            saida.write(bloco)
+                deslocamentos.append(_alinhar(saida))
+                with open(self._nomes.name, "rb") as nomes:
+                    while bloco := nomes.read(1 << 20):
+                        saida.write(bloco)
+                deslocamentos.append(_alinhar(saida))
+                _gravar_array(self._offsets_strings, saida)
+                deslocamentos.append(_alinhar(saida))
+                with open(self._dados_strings.name, "rb") as strings:
+                    while bloco := strings.read(1 << 20):
+                        saida.write(bloco)
+
+                saida.seek(0)
+                saida.write(MAGIC)
+                saida.write(
+                    _CABECALHO.pack(
+                        self.linhas,
+                        len(self._offsets_strings) - 1,
+                        len(PathType),
+                        len(PathStatus),
+                        *deslocamentos,
+                    )
+                )
+        except OSError as e:
+            raise PathOperationError(str(self.destino), f"Erro ao gravar scan: {e}") from e
+        finally:
+            self._temporario.cleanup()
+        return self.destino
+
+    def __enter__(self) -> "EscritorColunar":
+        return self
+
+    def __exit__(self, tipo_excecao: Optional[type], *_: object) -> None:
+        if tipo_excecao is not None:
+            self.descartar()
+        else:
+            self.fechar()
+
+
+def gravar_colunar(modelos: Iterable[CaminhoModel], destino: Union[str, Path]) -> Path:
+    """
+    Grava uma varredura inteira no formato colunar.
+
+    Args:
+        modelos (Iterable[CaminhoModel]): Modelos da varredura (consumidos em streaming).
+        destino (str | Path): Arquivo de saída.
+
+    Returns:
+        Path: Caminho do arquivo gravado.
+    """
+    with EscritorColunar(destino) as escritor:
+        for modelo in modelos:
+            escritor.adicionar(modelo)
+    return escritor.destino
+
+
+class ScanColunar:
+    """
+    Scan colunar aberto via `mmap`; as linhas são decodificadas apenas quando acessadas.
+
+    Atributos:
+        arquivo (Path): Arquivo gravado por `gravar_colunar()`.
+        tipos (memoryview): Coluna de códigos de tipo (u8).
+        status (memoryview): Coluna de códigos de status (u8).
+        tamanhos (memoryview): Coluna de tamanhos (i64).
+        modificados (memoryview): Coluna de datas de modificação (f64).
+    """
+
+    def __init__(self, arquivo: Union[str, Path]) -> None:
+        self.arquivo = Path(arquivo)
+        with open(self.arquivo, "rb") as entrada:
+            try:
+                self._mapa = mmap.mmap(entrada.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise PathInvalidError(str(arquivo)) from e
+        if self._mapa[: len(MAGIC)] != MAGIC:
+            self._mapa.close()
+            raise PathInvalidError(str(arquivo))
+
+        linhas, strings, n_tipos, n_status, *secoes = _CABECALHO.unpack_from(
+            self._mapa, len(MAGIC)
+        )
+        self._linhas: int = linhas
+        visao = memoryview(self._mapa)
+        colunas = {}
+        for (nome, codigo), inicio in zip(_COLUNAS, secoes):
+            largura = struct.calcsize(codigo)
+            colunas[nome] = _bytes_nativos(visao[inicio : inicio + linhas * largura], largura)
+        self._diretorios = colunas["diretorio"].cast("I")
+        self._fim_nomes = colunas["nome"].cast("Q")
+        self._inicio_nomes = secoes[7]
+        self._conteudos = colunas["conteudo"].cast("I")
+        self.tipos = colunas["tipo"].cast("B")
+        self.status = colunas["status"].cast("B")
+        self.tamanhos = colunas["tamanho"].cast("q")
+        self.modificados = colunas["modificado"].cast("d")
+        self._offsets_strings = _bytes_nativos(
+            visao[secoes[8] : secoes[8] + (strings + 1) * 8], 8
+        ).cast("Q")
+        self._inicio_strings = secoes[9]
+        self._cache_strings: dict[int, str] = {}
+
+        # Códigos gravados -> enums atuais (os valores ficam no início da tabela).
+        self._tipos = [PathType.from_str(self._string(i)) for i in range(n_tipos)]
+        self._status = [
+            PathStatus.from_str(self._string(n_tipos + i)) for i in range(n_status)
+        ]
+
+    def _string(self, indice: int) -> str:
+        texto = self._cache_strings.get(indice)
+        if texto is None:
+            inicio = self._inicio_strings + self._offsets_strings[indice]
+            fim = self._inicio_strings + self._offsets_strings[indice + 1]
+            texto = self._mapa[inicio:fim].decode("utf-8", "surrogateescape")
+            if len(self._cache_strings) < 65536:
+                self._cache_strings[indice] = texto
+        return texto
+
+    def __len__(self) -> int:
+        return self._linhas
+
+    def nome(self, linha: int) -> str:
+        inicio = self._inicio_nomes + (self._fim_nomes[linha - 1] if linha else 0)
+        fim = self._inicio_nomes + self._fim_nomes[linha]
+        return self._mapa[inicio:fim].decode("utf-8", "surrogateescape")
+
+    def caminho(self, linha: int) -> str:
+        return os.path.join(self._string(self._diretorios[linha]), self.nome(linha))
+
+    def __getitem__(self, linha: int) -> CaminhoModel:
+        if linha < 0:
+            linha += self._linhas
+        if not 0 <= linha < self._linhas:
+            raise IndexError(linha)
+        tamanho = self.tamanhos[linha]
+        modificado = self.modificados[linha]
+        conteudo = self._conteudos[linha]
+        nome = self.nome(linha)
+        return CaminhoModel(
+            nome=nome,
+            tipo=self._tipos[self.tipos[linha]],
+            caminho=os.path.join(self._string(self._diretorios[linha]), nome),
+            status=self._status[self.status[linha]],
+            tamanho=None if tamanho < 0 else tamanho,
+            modificado=None if math.isnan(modificado) else modificado,
+            tipo_conteudo=None if conteudo == _SEM_STRING else self._string(conteudo),
+        )
+
+    def __iter__(self) -> Iterator[CaminhoModel]:
+        for linha in range(self._linhas):
+            yield self[linha]
+
+    def filtrar_tipo(self, tipo: PathType) -> Iterator[int]:
+        """Índices das linhas do tipo informado (busca em C sobre a coluna de bytes)."""
+        if tipo not in self._tipos:
+            return
+        codigo = re.escape(bytes([self._tipos.index(tipo)]))
+        for encontrado in re.finditer(codigo, self.tipos):
+            yield encontrado.start()
+
+    def tamanho_total(self, linhas: Optional[Iterable[int]] = None) -> int:
+        """Soma os tamanhos conhecidos (de todas as linhas ou das informadas)."""
+        if linhas is None:
+            return sum(t for t in self.tamanhos if t > 0)
+        return sum(max(self.tamanhos[i], 0) for i in linhas)
+
+    def fechar(self) -> None:
+        for coluna in (
+            self._diretorios,
+            self._fim_nomes,
+            self._conteudos,
+            self.tipos,
+            self.status,
+            self.tamanhos,
+            self.modificados,
+            self._offsets_strings,
+        ):
+            coluna.release()
+        self._mapa.close()
+
+    def __enter__(self) -> "ScanColunar":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.fechar()
+
+
+# === EXPORTADORES ===
+
+
+def _linha_exportacao(modelo: CaminhoModel) -> dict[str, Union[str, int, float, None]]:
+    return {
+        "nome": modelo.nome,
+        "tipo": modelo.tipo.value,
+        "caminho": modelo.caminho,
+        "status": modelo.status.value,
+        "tamanho": modelo.tamanho,
+        "modificado": modelo.modificado,
+        "tipo_conteudo": modelo.tipo_conteudo,
+    }
+
+
+def exportar_csv(modelos: Iterable[CaminhoModel], destino: Union[str, Path]) -> int:
+    """
+    Exporta modelos (ex.: um `ScanColunar`) para CSV, linha a linha.
+
+    Returns:
+        int: Quantidade de linhas exportadas.
+    """
+    total = 0
+    # surrogateescape: nomes lidos do disco com bytes inválidos em UTF-8 voltam aos
+    # bytes originais, em vez de interromper a exportação.
+    with open(destino, "w", encoding="utf-8", errors="surrogateescape", newline="") as saida:
+        escritor = csv.DictWriter(saida, fieldnames=CAMPOS_EXPORTACAO)
+        escritor.writeheader()
+        for modelo in modelos:
+            escritor.writerow(_linha_exportacao(modelo))
+            total += 1
+    return total
+
+
+def exportar_jsonl(modelos: Iterable[CaminhoModel], destino: Union[str, Path]) -> int:
+    """
+    Exporta modelos para JSON Lines (um objeto por linha).
+
+    Returns:
+        int: Quantidade de linhas exportadas.
+    """
+    total = 0
+    with open(destino, "w", encoding="utf-8", errors="surrogateescape") as saida:
+        for modelo in modelos:
+            saida.write(json.dumps(_linha_exportacao(modelo), ensure_ascii=False) + "\n")
+            total += 1
+    return total
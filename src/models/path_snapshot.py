@@ -0,0 +1,348 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Módulo de snapshots de varredura e comparação entre dois estados de uma árvore.
+
+Um snapshot registra cada entrada da árvore como (caminho relativo, modo, inode,
+tamanho, mtime) em formato binário compacto, ordenado pelo caminho. Por estar
+ordenado, a comparação de dois snapshots é um merge linear que lê ambos os arquivos
+em streaming, com memória limitada, mesmo para milhões de entradas.
+
+Inclui:
+- `listar_nivel()` / `varrer_registros()`: varredura da árvore com `os.scandir`.
+- `gravar_snapshot()`: gravação com ordenação externa (lotes ordenados + merge).
+- `Snapshot`: leitura em streaming de um snapshot gravado.
+- `comparar_snapshots()`: diff que produz `CaminhoModel` com status CREATED/UPDATED/DELETED.
+- `codificar_registros()` / `decodificar_registros()`: serialização compacta reutilizável.
+- `registro_para_modelo()`: conversão de um registro em `CaminhoModel`.
+"""
+
+import heapq
+from itertools import islice
+import logging
+import os
+from pathlib import Path
+import struct
+import tempfile
+import time
+from typing import BinaryIO, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathInvalidError, PathStatus, PathType
+from tools.path_resolver import resolver_caminho
+
+MAGIC = b"PSNAP\x01"
+
+# Tamanho do caminho (H), st_mode (I), inode (Q), tamanho (Q), mtime em ns (q).
+_REGISTRO = struct.Struct("<HIQQq")
+_TAMANHO_RAIZ = struct.Struct("<H")
+_BUFFER_LEITURA = 1 << 20
+
+
+class RegistroSnapshot(NamedTuple):
+    """
+    Entrada de um snapshot.
+
+    Atributos:
+        caminho (str): Caminho relativo à raiz da varredura.
+        modo (int): Campo `st_mode` (sem seguir links simbólicos).
+        inode (int): Número do inode.
+        tamanho (int): Tamanho em bytes.
+        modificado_ns (int): Data de modificação em nanossegundos.
+    """
+
+    caminho: str
+    modo: int
+    inode: int
+    tamanho: int
+    modificado_ns: int
+
+
+# === SERIALIZAÇÃO ===
+
+
+def codificar_registros(registros: Iterable[RegistroSnapshot]) -> bytes:
+    """
+    Serializa registros no formato binário compacto do snapshot.
+
+    Args:
+        registros (Iterable[RegistroSnapshot]): Registros a serializar.
+
+    Returns:
+        bytes: Bloco com os registros concatenados.
+    """
+    partes: list[bytes] = []
+    for registro in registros:
+        nome = os.fsencode(registro.caminho)
+        partes.append(
+            _REGISTRO.pack(
+                len(nome),
+                registro.modo,
+                registro.inode,
+                registro.tamanho,
+                registro.modificado_ns,
+            )
+        )
+        partes.append(nome)
+    return b"".join(partes)
+
+
+def decodificar_registros(dados: bytes) -> Iterator[RegistroSnapshot]:
+    """
+    Desserializa um bloco produzido por `codificar_registros()`.
+
+    Args:
+        dados (bytes): Bloco serializado.
+
+    Yields:
+        RegistroSnapshot: Registros na ordem em que foram gravados.
+    """
+    visao = memoryview(dados)
+    posicao = 0
+    while posicao < len(visao):
+        tamanho_nome, modo, inode, tamanho, modificado_ns = _REGISTRO.unpack_from(visao, posicao)
+        posicao += _REGISTRO.size
+        nome = os.fsdecode(bytes(visao[posicao : posicao + tamanho_nome]))
+        posicao += tamanho_nome
+        yield RegistroSnapshot(nome, modo, inode, tamanho, modificado_ns)
+
+
+def _ler_registros(arquivo: BinaryIO) -> Iterator[RegistroSnapshot]:
+    while cabecalho := arquivo.read(_REGISTRO.size):
+        if len(cabecalho) < _REGISTRO.size:
+            raise ValueError("Snapshot truncado")
+        tamanho_nome, modo, inode, tamanho, modificado_ns = _REGISTRO.unpack(cabecalho)
+        nome = os.fsdecode(arquivo.read(tamanho_nome))
+        yield RegistroSnapshot(nome, modo, inode, tamanho, modificado_ns)
+
+
+# === VARREDURA ===
+
+
+def listar_nivel(
+    raiz: Union[str, Path],
+    relativo: str = "",
+    medir: Optional[Callable[[float], None]] = None,
+) -> tuple[list[RegistroSnapshot], list[str]]:
+    """
+    Lista um único diretório da árvore, sem seguir links simbólicos.
+
+    Args:
+        raiz (str | Path): Diretório raiz da varredura.
+        relativo (str): Diretório a listar, relativo a `raiz`.
+        medir (Callable[[float], None] | None): Recebe a duração, em segundos, de
+            cada chamada de sistema (abertura do diretório e `stat` das entradas).
+
+    Returns:
+        tuple[list[RegistroSnapshot], list[str]]: Registros das entradas e os
+        subdiretórios encontrados (relativos a `raiz`).
+    """
+    base = os.fspath(raiz)
+    registros: list[RegistroSnapshot] = []
+    subdiretorios: list[str] = []
+    try:
+        inicio = time.perf_counter()
+        with os.scandir(os.path.join(base, relativo) if relativo else base) as entradas:
+            if medir:
+                medir(time.perf_counter() - inicio)
+            for entrada in entradas:
+                inicio = time.perf_counter()
+                try:
+                    info = entrada.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                finally:
+                    if medir:
+                        medir(time.perf_counter() - inicio)
+                caminho = os.path.join(relativo, entrada.name) if relativo else entrada.name
+                if entrada.is_dir(follow_symlinks=False):
+                    subdiretorios.append(caminho)
+                registros.append(
+                    RegistroSnapshot(
+                        caminho, info.st_mode, info.st_ino, info.st_size, info.st_mtime_ns
+                    )
+                )
+    except OSError as e:
+        logging.warning(" Diretório ignorado na varredura -> %s (%s)", relativo or base, e)
+    return registros, subdiretorios
+
+
+def varrer_registros(
+    raiz: Union[str, Path],
+    subdiretorio: str = "",
+    medir: Optional[Callable[[float], None]] = None,
+) -> Iterator[RegistroSnapshot]:
+    """
+    Percorre a árvore sob `raiz` sem seguir links simbólicos.
+
+    Diretórios sem permissão de leitura são registrados, mas não percorridos.
+
+    Args:
+        raiz (str | Path): Diretório raiz da varredura.
+        subdiretorio (str): Percorre apenas este subdiretório (relativo a `raiz`);
+            os caminhos continuam relativos a `raiz`.
+        medir (Callable[[float], None] | None): Repassado a `listar_nivel`.
+
+    Yields:
+        RegistroSnapshot: Entradas na ordem do sistema de arquivos (não ordenadas).
+    """
+    pendentes = [subdiretorio]
+    while pendentes:
+        registros, subdiretorios = listar_nivel(raiz, pendentes.pop(), medir)
+        pendentes.extend(subdiretorios)
+        yield from registros
+
+
+# === GRAVAÇÃO E LEITURA ===
+
+
+def _gravar_lote(registros: list[RegistroSnapshot], diretorio: str) -> str:
+    registros.sort()
+    with tempfile.NamedTemporaryFile("wb", dir=diretorio, suffix=".run", delete=False) as run:
+        run.write(codificar_registros(registros))
+        return run.name
+
+
+def gravar_snapshot(
+    raiz: Union[str, Path],
+    destino: Union[str, Path],
+    registros_por_lote: int = 200_000,
+) -> Path:
+    """
+    Varre `raiz` e grava o snapshot ordenado em `destino`.
+
+    A ordenação é externa: cada lote de `registros_por_lote` entradas é ordenado e
+    gravado em um arquivo temporário, e os lotes são intercalados com `heapq.merge`.
+    O consumo de memória fica limitado ao tamanho de um lote.
+
+    Args:
+        raiz (str | Path): Diretório a ser varrido.
+        destino (str | Path): Arquivo de saída do snapshot.
+        registros_por_lote (int): Quantidade de registros ordenados em memória por vez.
+
+    Raises:
+        PathInvalidError: Se `raiz` não for um diretório.
+
+    Returns:
+        Path: Caminho do snapshot gravado.
+    """
+    raiz_resolvida = resolver_caminho(raiz)
+    if not raiz_resolvida.is_dir():
+        raise PathInvalidError(str(raiz))
+
+    destino = Path(destino)
+    with tempfile.TemporaryDirectory(dir=destino.parent) as temporario:
+        runs: list[str] = []
+        lote: list[RegistroSnapshot] = []
+        for registro in varrer_registros(raiz_resolvida):
+            lote.append(registro)
+            if len(lote) >= registros_por_lote:
+                runs.append(_gravar_lote(lote, temporario))
+                lote = []
+        if lote:
+            runs.append(_gravar_lote(lote, temporario))
+
+        arquivos = [open(run, "rb", buffering=_BUFFER_LEITURA) for run in runs]
+        try:
+            with open(destino, "wb", buffering=_BUFFER_LEITURA) as saida:
+                raiz_bytes = os.fsencode(str(raiz_resolvida))
+                saida.write(MAGIC + _TAMANHO_RAIZ.pack(len(raiz_bytes)) + raiz_bytes)
+                intercalados = heapq.merge(*(_ler_registros(a) for a in arquivos))
+                while bloco := list(islice(intercalados, 4096)):
+                    saida.write(codificar_registros(bloco))
+        finally:
+            for arquivo in arquivos:
+                arquivo.close()
+    return destino
+
+
+class Snapshot:
+    """
+    Leitura em streaming de um snapshot gravado por `gravar_snapshot()`.
+
+    Atributos:
+        arquivo (Path): Caminho do arquivo de snapshot.
+        raiz (str): Diretório raiz registrado no snapshot.
+    """
+
+    def __init__(self, arquivo: Union[str, Path]) -> None:
+        self.arquivo = Path(arquivo)
+        with open(self.arquivo, "rb") as entrada:
+            if entrada.read(len(MAGIC)) != MAGIC:
+                raise PathInvalidError(str(arquivo))
+            (tamanho_raiz,) = _TAMANHO_RAIZ.unpack(entrada.read(_TAMANHO_RAIZ.size))
+            self.raiz = os.fsdecode(entrada.read(tamanho_raiz))
+            self._inicio_registros = entrada.tell()
+
+    def __iter__(self) -> Iterator[RegistroSnapshot]:
+        with open(self.arquivo, "rb", buffering=_BUFFER_LEITURA) as entrada:
+            entrada.seek(self._inicio_registros)
+            yield from _ler_registros(entrada)
+
+
+# === COMPARAÇÃO ===
+
+
+def registro_para_modelo(
+    raiz: str, registro: RegistroSnapshot, status: PathStatus = PathStatus.EXISTS
+) -> CaminhoModel:
+    """
+    Converte um registro de snapshot em `CaminhoModel`.
+
+    Args:
+        raiz (str): Raiz à qual o caminho do registro é relativo.
+        registro (RegistroSnapshot): Registro a converter.
+        status (PathStatus): Status atribuído ao modelo.
+
+    Returns:
+        CaminhoModel: Modelo com tipo, tamanho e data de modificação preenchidos.
+    """
+    return CaminhoModel(
+        nome=os.path.basename(registro.caminho),
+        tipo=PathType.from_mode(registro.modo),
+        caminho=os.path.join(raiz, registro.caminho),
+        status=status,
+        tamanho=registro.tamanho,
+        modificado=registro.modificado_ns / 1e9,
+    )
+
+
+def _foi_alterado(antes: RegistroSnapshot, depois: RegistroSnapshot) -> bool:
+    return (
+        antes.inode != depois.inode
+        or antes.tamanho != depois.tamanho
+        or antes.modificado_ns != depois.modificado_ns
+        or PathType.from_mode(antes.modo) != PathType.from_mode(depois.modo)
+    )
+
+
+def comparar_snapshots(antigo: Snapshot, novo: Snapshot) -> Iterator[CaminhoModel]:
+    """
+    Compara dois snapshots com um merge linear sobre os registros ordenados.
+
+    Args:
+        antigo (Snapshot): Estado anterior da árvore.
+        novo (Snapshot): Estado atual da árvore.
+
+    Yields:
+        CaminhoModel: Entradas com status CREATED, UPDATED ou DELETED, em ordem de caminho.
+    """
+    iter_antigo, iter_novo = iter(antigo), iter(novo)
+    atual_antigo = next(iter_antigo, None)
+    atual_novo = next(iter_novo, None)
+
+    while atual_antigo is not None or atual_novo is not None:
+        if atual_novo is None or (
+            atual_antigo is not None and atual_antigo.caminho < atual_novo.caminho
+        ):
+            assert atual_antigo is not None
+            yield registro_para_modelo(antigo.raiz, atual_antigo, PathStatus.DELETED)
+            atual_antigo = next(iter_antigo, None)
+        elif atual_antigo is None or atual_novo.caminho < atual_antigo.caminho:
+            yield registro_para_modelo(novo.raiz, atual_novo, PathStatus.CREATED)
+            atual_novo = next(iter_novo, None)
+        else:
+            if _foi_alterado(atual_antigo, atual_novo):
+                yield registro_para_modelo(novo.raiz, atual_novo, PathStatus.UPDATED)
+            atual_antigo = next(iter_antigo, None)
+            atual_novo = next(iter_novo, None)
@@ -26,6 +26,7 @@ from tools.path_definitions import (
     PathStatus,
     PathType,
 )
+from tools.path_resolver import resolver_caminho
 
 
 @dataclass
@@ -35,15 +36,21 @@ class CaminhoModel:
 
     Atributos:
         nome (str): Nome base do caminho (arquivo ou diretório).
-        tipo (PathType): Tipo do caminho (FILE, DIRECTORY, UNKNOWN, ERROR).
+        tipo (PathType): Tipo do caminho (FILE, DIRECTORY, SYMLINK, FIFO, etc.).
         caminho (str): Caminho absoluto.
         status (PathStatus): Estado atual do caminho (EXISTS, NOT_EXISTS, etc.).
+        tamanho (int | None): Tamanho em bytes, quando conhecido.
+        modificado (float | None): Data de modificação (timestamp), quando conhecida.
+        tipo_conteudo (str | None): Tipo MIME detectado pelo conteúdo, quando classificado.
     """
 
     nome: str
     tipo: PathType
     caminho: str
     status: PathStatus = PathStatus.UNKNOWN
+    tamanho: int | None = None
+    modificado: float | None = None
+    tipo_conteudo: str | None = None
 
     @classmethod
     def from_path(cls, caminho_input: Union[str, Path]) -> "CaminhoModel":
@@ -63,18 +70,12 @@ class CaminhoModel:
             if not caminho_input or not isinstance(caminho_input, (str, Path)):
                 raise PathInvalidError(str(caminho_input))
 
-            caminho = Path(caminho_input).expanduser().resolve()
+            caminho = resolver_caminho(caminho_input)
 
             if not caminho.exists():
                 raise PathNotFoundError(str(caminho))
 
-            tipo = (
-                PathType.DIRECTORY
-                if caminho.is_dir()
-                else PathType.FILE
-                if caminho.is_file()
-                else PathType.UNKNOWN
-            )
+            tipo = PathType.from_mode(caminho.stat().st_mode)
 
             return cls(
                 nome=caminho.name,
@@ -88,7 +89,7 @@ class CaminhoModel:
             return cls(
                 nome=Path(caminho_input).name,
                 tipo=PathType.UNKNOWN,
-                caminho=str(Path(caminho_input).expanduser().resolve()),
+                caminho=str(resolver_caminho(caminho_input)),
                 status=PathStatus.NOT_EXISTS,
             )
         except PathInvalidError as e:
@@ -0,0 +1,238 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Leitura incremental de exportações de favoritos no formato Netscape (bookmarks.html).
+
+Exportações de navegadores podem ter centenas de megabytes; montar a árvore completa
+com BeautifulSoup consome gigabytes de memória. Este módulo usa o `HTMLParser` da
+biblioteca padrão alimentado em blocos, emitindo pastas e links à medida que são
+encontrados, com memória constante durante a leitura.
+
+Inclui:
+- `BookmarkRecord`: pasta ou link com título, URL e caminho de pastas.
+- `ler_bookmarks()`: gerador de registros a partir do arquivo.
+- `IndiceBookmarks`: índice por URL, host e palavras do título, com detecção de duplicados.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import Enum
+from html.parser import HTMLParser
+from pathlib import Path
+import re
+from typing import Iterable, Iterator, Optional, Union
+from urllib.parse import urlsplit
+
+from .path_definitions import PathNotFoundError
+from .path_resolver import resolver_caminho
+
+_PALAVRAS = re.compile(r"\w+")
+
+
+class BookmarkType(str, Enum):
+    """
+    Enum para o tipo de registro de favoritos.
+
+    Valores possíveis:
+        - FOLDER: Pasta.
+        - LINK: Link.
+    """
+
+    FOLDER = "folder"
+    LINK = "link"
+
+
+@dataclass
+class BookmarkRecord:
+    """
+    Pasta ou link de uma exportação de favoritos.
+
+    Atributos:
+        tipo (BookmarkType): Pasta ou link.
+        titulo (str): Título exibido.
+        pasta (tuple[str, ...]): Pastas que contêm o registro, da raiz até o pai.
+        url (str | None): Endereço do link (None para pastas).
+        adicionado (int | None): Valor de ADD_DATE (timestamp), quando presente.
+    """
+
+    tipo: BookmarkType
+    titulo: str
+    pasta: tuple[str, ...]
+    url: Optional[str] = None
+    adicionado: Optional[int] = None
+
+    @property
+    def host(self) -> str:
+        """Host do link em minúsculas (vazio para pastas ou URLs sem host)."""
+        return (urlsplit(self.url).hostname or "") if self.url else ""
+
+
+class _ParserBookmarks(HTMLParser):
+    """Parser incremental: acumula registros em `pendentes` a cada bloco recebido."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.pendentes: list[BookmarkRecord] = []
+        self._pastas: list[str] = []
+        self._pilha_dl: list[bool] = []
+        self._pasta_anterior: Optional[str] = None
+        self._tag_texto: Optional[str] = None
+        self._texto: list[str] = []
+        self._atributos: dict[str, Optional[str]] = {}
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag in ("h3", "a"):
+            if tag == "a":
+                self._pasta_anterior = None
+            self._tag_texto = tag
+            self._texto = []
+            self._atributos = {chave: valor for chave, valor in attrs if chave != "icon"}
+        elif tag == "dl":
+            # Um <DL> logo após um <H3> abre o conteúdo dessa pasta.
+            abriu_pasta = self._pasta_anterior is not None
+            if abriu_pasta:
+                self._pastas.append(self._pasta_anterior or "")
+            self._pasta_anterior = None
+            self._pilha_dl.append(abriu_pasta)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "dl":
+            if self._pilha_dl and self._pilha_dl.pop() and self._pastas:
+                self._pastas.pop()
+            return
+        if tag != self._tag_texto:
+            return
+
+        titulo = "".join(self._texto).strip()
+        self._tag_texto = None
+        if tag == "h3":
+            self._pasta_anterior = titulo
+            self.pendentes.append(
+                BookmarkRecord(BookmarkType.FOLDER, titulo, tuple(self._pastas), None, self._data())
+            )
+        else:
+            self.pendentes.append(
+                BookmarkRecord(
+                    BookmarkType.LINK,
+                    titulo,
+                    tuple(self._pastas),
+                    self._atributos.get("href"),
+                    self._data(),
+                )
+            )
+
+    def handle_data(self, data: str) -> None:
+        if self._tag_texto is not None:
+            self._texto.append(data)
+
+    def _data(self) -> Optional[int]:
+        valor = self._atributos.get("add_date")
+        return int(valor) if valor and valor.isdigit() else None
+
+
+def ler_bookmarks(
+    caminho: Union[str, Path], tamanho_bloco: int = 1 << 16
+) -> Iterator[BookmarkRecord]:
+    """
+    Lê um arquivo de favoritos em blocos e emite pastas e links em ordem de documento.
+
+    Args:
+        caminho (str | Path): Arquivo bookmarks.html.
+        tamanho_bloco (int): Quantidade de caracteres lida por vez.
+
+    Raises:
+        PathNotFoundError: Se o arquivo não existir.
+
+    Yields:
+        BookmarkRecord: Registros de pasta e de link.
+    """
+    arquivo = resolver_caminho(caminho)
+    if not arquivo.is_file():
+        raise PathNotFoundError(str(caminho))
+
+    parser = _ParserBookmarks()
+    with open(arquivo, encoding="utf-8", errors="replace") as entrada:
+        while bloco := entrada.read(tamanho_bloco):
+            parser.feed(bloco)
+            yield from parser.pendentes
+            parser.pendentes.clear()
+    parser.close()
+    yield from parser.pendentes
+
+
+def normalizar_url(url: str) -> str:
+    """
+    Normaliza uma URL para comparação (esquema e host em minúsculas, sem '/' final).
+
+    Args:
+        url (str): URL original.
+
+    Returns:
+        str: URL normalizada.
+    """
+    partes = urlsplit(url.strip())
+    caminho = partes.path.rstrip("/")
+    normalizada = f"{partes.scheme.lower()}://{partes.netloc.lower()}{caminho}"
+    if partes.query:
+        normalizada += f"?{partes.query}"
+    return normalizada
+
+
+class IndiceBookmarks:
+    """
+    Índice pesquisável de links por URL, host e palavras do título.
+
+    Construído em uma única passada sobre os registros; duplicados (mesma URL
+    normalizada) são detectados durante a inserção.
+    """
+
+    def __init__(self, registros: Iterable[BookmarkRecord] = ()) -> None:
+        self.links: list[BookmarkRecord] = []
+        self._por_url: dict[str, list[int]] = defaultdict(list)
+        self._por_host: dict[str, list[int]] = defaultdict(list)
+        self._por_palavra: dict[str, set[int]] = defaultdict(set)
+        self._duplicados: set[str] = set()
+        for registro in registros:
+            self.adicionar(registro)
+
+    @classmethod
+    def from_path(cls, caminho: Union[str, Path]) -> "IndiceBookmarks":
+        """Constrói o índice lendo o arquivo de favoritos em streaming."""
+        return cls(ler_bookmarks(caminho))
+
+    def adicionar(self, registro: BookmarkRecord) -> None:
+        """Indexa um registro; pastas e links sem URL são ignorados."""
+        if registro.tipo != BookmarkType.LINK or not registro.url:
+            return
+        posicao = len(self.links)
+        self.links.append(registro)
+
+        url = normalizar_url(registro.url)
+        self._por_url[url].append(posicao)
+        if len(self._por_url[url]) == 2:
+            self._duplicados.add(url)
+        self._por_host[registro.host].append(posicao)
+        for palavra in _PALAVRAS.findall(registro.titulo.lower()):
+            self._por_palavra[palavra].add(posicao)
+
+    def por_url(self, url: str) -> list[BookmarkRecord]:
+        return [self.links[i] for i in self._por_url.get(normalizar_url(url), [])]
+
+    def por_host(self, host: str) -> list[BookmarkRecord]:
+        return [self.links[i] for i in self._por_host.get(host.lower(), [])]
+
+    def buscar_titulo(self, termo: str) -> list[BookmarkRecord]:
+        """Retorna os links cujo título contém todas as palavras de `termo`."""
+        palavras = _PALAVRAS.findall(termo.lower())
+        if not palavras:
+            return []
+        conjuntos = sorted((self._por_palavra.get(p, set()) for p in palavras), key=len)
+        encontrados = set.intersection(*conjuntos)
+        return [self.links[i] for i in sorted(encontrados)]
+
+    def duplicados(self) -> dict[str, list[BookmarkRecord]]:
+        """Retorna, por URL normalizada, os links que aparecem mais de uma vez."""
+        return {url: [self.links[i] for i in self._por_url[url]] for url in self._duplicados}
+
+    def __len__(self) -> int:
+        return len(self.links)
@@ -14,8 +14,11 @@ Este módulo fornece:
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+import stat
 from typing import Union
 
+from .path_resolver import resolver_caminho
+
 # === ENUMS COM MÉTODOS DE PARSING ===
 
 
@@ -26,12 +29,22 @@ class PathType(str, Enum):
     Valores possíveis:
         - FILE: Arquivo.
         - DIRECTORY: Diretório.
+        - SYMLINK: Link simbólico.
+        - SOCKET: Socket.
+        - FIFO: Pipe nomeado (FIFO).
+        - CHAR_DEVICE: Dispositivo de caractere.
+        - BLOCK_DEVICE: Dispositivo de bloco.
         - UNKNOWN: Tipo desconhecido.
         - ERROR: Erro na classificação.
     """
 
     FILE = "File"
     DIRECTORY = "Directory"
+    SYMLINK = "Symlink"
+    SOCKET = "Socket"
+    FIFO = "Fifo"
+    CHAR_DEVICE = "CharDevice"
+    BLOCK_DEVICE = "BlockDevice"
     UNKNOWN = "unknown"
     ERROR = "error"
 
@@ -49,6 +62,28 @@ class PathType(str, Enum):
         except ValueError:
             return cls.UNKNOWN
 
+    @classmethod
+    def from_mode(cls, modo: int) -> "PathType":
+        """
+        Constrói um PathType a partir do campo `st_mode` de um `os.stat_result`.
+
+        Retorna:
+            - O tipo de entrada correspondente ao modo.
+            - PathType.UNKNOWN para modos não reconhecidos.
+        """
+        return _TIPOS_POR_MODO.get(stat.S_IFMT(modo), cls.UNKNOWN)
+
+
+_TIPOS_POR_MODO = {
+    stat.S_IFREG: PathType.FILE,
+    stat.S_IFDIR: PathType.DIRECTORY,
+    stat.S_IFLNK: PathType.SYMLINK,
+    stat.S_IFSOCK: PathType.SOCKET,
+    stat.S_IFIFO: PathType.FIFO,
+    stat.S_IFCHR: PathType.CHAR_DEVICE,
+    stat.S_IFBLK: PathType.BLOCK_DEVICE,
+}
+
 
 class PathStatus(str, Enum):
     """
@@ -125,18 +160,12 @@ class PathData:
         if not caminho_str or not isinstance(caminho_str, (str, Path)):
             raise PathInvalidError(str(caminho_str))
 
-        caminho = Path(caminho_str).expanduser().resolve()
+        caminho = resolver_caminho(caminho_str)
 
         if not caminho.exists():
             raise PathNotFoundError(str(caminho))
 
-        tipo = (
-            PathType.FILE
-            if caminho.is_file()
-            else PathType.DIRECTORY
-            if caminho.is_dir()
-            else PathType.UNKNOWN
-        )
+        tipo = PathType.from_mode(caminho.stat().st_mode)
 
         return cls(
             nome=caminho.name,
@@ -0,0 +1,146 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Módulo de normalização de caminhos com cache de diretórios-pai resolvidos.
+
+`Path(...).expanduser().resolve()` percorre e executa `readlink` em cada componente
+do caminho. Para entradas irmãs dentro do mesmo diretório profundo, esse trabalho
+é idêntico para toda a cadeia de diretórios-pai. Este módulo resolve o pai uma única
+vez e, nas chamadas seguintes, resolve apenas o componente final.
+
+Inclui:
+- Classe `PathResolver`, com cache LRU e invalidação por identidade do diretório.
+- Instância compartilhada `resolver_padrao` e atalho `resolver_caminho()`.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, Union
+
+# Componentes finais que exigem a resolução completa do caminho.
+_NOMES_ESPECIAIS = {"", ".", ".."}
+
+
+class _PaiResolvido(NamedTuple):
+    """Entrada do cache: diretório-pai resolvido e sua identidade (st_dev, st_ino)."""
+
+    caminho: str
+    dispositivo: int
+    inode: int
+
+
+class PathResolver:
+    """
+    Resolve caminhos reaproveitando a resolução dos diretórios-pai.
+
+    O cache é indexado pelo diretório-pai já expandido (antes da resolução). A cada
+    consulta, um único `os.stat` do pai (que segue links simbólicos no kernel) confirma
+    que ele ainda aponta para o mesmo diretório; se um link simbólico da cadeia mudar de
+    destino, a identidade (st_dev, st_ino) muda e a entrada é recalculada.
+
+    Atributos:
+        max_entradas (int): Quantidade máxima de diretórios-pai mantidos no cache.
+    """
+
+    def __init__(self, max_entradas: int = 4096) -> None:
+        self.max_entradas = max_entradas
+        self._cache: OrderedDict[str, _PaiResolvido] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolver(self, caminho_input: Union[str, Path]) -> Path:
+        """
+        Equivalente a `Path(caminho_input).expanduser().resolve()`.
+
+        Args:
+            caminho_input (str | Path): Caminho a ser normalizado.
+
+        Returns:
+            Path: Caminho absoluto, com links simbólicos resolvidos.
+        """
+        expandido = os.path.expanduser(os.fspath(caminho_input))
+        # `abspath` colapsa ".." textualmente, antes de resolver links simbólicos:
+        # "link/../x" deve subir a partir do destino de "link", não de seu diretório.
+        if ".." in Path(expandido).parts:
+            return Path(expandido).resolve()
+
+        caminho = os.path.abspath(expandido)
+        pai, nome = os.path.split(caminho)
+
+        if nome in _NOMES_ESPECIAIS or pai == caminho:
+            return Path(caminho).resolve()
+
+        pai_resolvido = self._resolver_pai(pai)
+        if pai_resolvido is None:
+            return Path(caminho).resolve()
+
+        completo = os.path.join(pai_resolvido, nome)
+        try:
+            if os.path.islink(completo):
+                return Path(os.path.realpath(completo))
+        except (OSError, ValueError):
+            return Path(caminho).resolve()
+        return Path(completo)
+
+    def invalidar(self, prefixo: Union[str, Path, None] = None) -> None:
+        """
+        Remove entradas do cache.
+
+        Args:
+            prefixo (str | Path | None): Remove apenas os pais sob este prefixo
+                (expandido); quando omitido, limpa todo o cache.
+        """
+        with self._lock:
+            if prefixo is None:
+                self._cache.clear()
+                return
+            base = os.path.abspath(os.path.expanduser(os.fspath(prefixo)))
+            for chave in [c for c in self._cache if _esta_sob(c, base)]:
+                del self._cache[chave]
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _resolver_pai(self, pai: str) -> str | None:
+        try:
+            info = os.stat(pai)
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            entrada = self._cache.get(pai)
+            if entrada is not None:
+                if (entrada.dispositivo, entrada.inode) == (info.st_dev, info.st_ino):
+                    self._cache.move_to_end(pai)
+                    return entrada.caminho
+                del self._cache[pai]
+
+        resolvido = str(Path(pai).resolve())
+        with self._lock:
+            self._cache[pai] = _PaiResolvido(resolvido, info.st_dev, info.st_ino)
+            self._cache.move_to_end(pai)
+            while len(self._cache) > self.max_entradas:
+                self._cache.popitem(last=False)
+        return resolvido
+
+
+def _esta_sob(caminho: str, base: str) -> bool:
+    return caminho == base or caminho.startswith(base.rstrip(os.sep) + os.sep)
+
+
+# Instância compartilhada por PathData, CaminhoModel e pelo controller.
+resolver_padrao = PathResolver()
+
+
+def resolver_caminho(caminho_input: Union[str, Path]) -> Path:
+    """
+    Resolve um caminho usando o cache compartilhado `resolver_padrao`.
+
+    Args:
+        caminho_input (str | Path): Caminho a ser normalizado.
+
+    Returns:
+        Path: Caminho absoluto resolvido.
+    """
+    return resolver_padrao.resolver(caminho_input)
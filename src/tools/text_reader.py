@@ -0,0 +1,231 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Leitura de arquivos de texto em streaming, com detecção de codificação.
+
+Substitui o `read_text(encoding="utf-8")` planejado para `ler_arquivo`, que carrega o
+arquivo inteiro e falha por completo no primeiro byte inválido. Aqui o conteúdo é
+decodificado em blocos por um decodificador incremental, e as linhas podem ser
+acessadas diretamente por número através de um índice de deslocamentos construído
+sob demanda.
+
+Inclui:
+- `detectar_codificacao()`: BOM e heurísticas sobre uma amostra.
+- `LeitorTexto`: blocos decodificados, iteração por linhas e acesso aleatório por linha.
+"""
+
+from array import array
+import codecs
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from .path_definitions import PathNotFoundError, PathOperationError
+from .path_resolver import resolver_caminho
+
+TAMANHO_AMOSTRA = 64 * 1024
+TAMANHO_BLOCO = 64 * 1024
+
+# Ordem importa: o BOM de UTF-32-LE começa com o BOM de UTF-16-LE.
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+
+def detectar_codificacao(amostra: bytes) -> tuple[str, int]:
+    """
+    Detecta a codificação de um texto a partir de uma amostra inicial.
+
+    Ordem de decisão: BOM; UTF-16 sem BOM (bytes nulos alternados); UTF-8 válido;
+    cp1252; latin-1 (sempre decodifica).
+
+    Args:
+        amostra (bytes): Primeiros bytes do arquivo.
+
+    Returns:
+        tuple[str, int]: Nome do codec (sem BOM) e tamanho do BOM em bytes.
+    """
+    for bom, codec in _BOMS:
+        if amostra.startswith(bom):
+            return codec, len(bom)
+
+    pares, impares = amostra[0::2], amostra[1::2]
+    if len(amostra) >= 4:
+        if impares.count(0) > 0.4 * len(impares) and pares.count(0) < 0.1 * len(pares):
+            return "utf-16-le", 0
+        if pares.count(0) > 0.4 * len(pares) and impares.count(0) < 0.1 * len(impares):
+            return "utf-16-be", 0
+
+    for codec in ("utf-8", "cp1252"):
+        try:
+            codecs.getincrementaldecoder(codec)().decode(amostra, final=False)
+            return codec, 0
+        except UnicodeDecodeError:
+            continue
+    return "latin-1", 0
+
+
+def _codificar_quebra(codificacao: str) -> bytes:
+    """Codifica "\\n" no codec informado, sem o BOM que alguns codecs acrescentam."""
+    quebra = "\n".encode(codificacao)
+    for bom, _ in _BOMS:
+        if quebra.startswith(bom) and len(quebra) > len(bom):
+            return quebra[len(bom) :]
+    return quebra
+
+
+class LeitorTexto:
+    """
+    Leitor de texto em streaming com acesso aleatório por linha.
+
+    Atributos:
+        caminho (Path): Arquivo lido.
+        codificacao (str): Codec usado (detectado ou informado).
+        erros (str): Tratamento de bytes inválidos ("replace" ou "strict").
+    """
+
+    def __init__(
+        self,
+        caminho: Union[str, Path],
+        codificacao: Optional[str] = None,
+        erros: str = "replace",
+        tamanho_bloco: int = TAMANHO_BLOCO,
+    ) -> None:
+        self.caminho = resolver_caminho(caminho)
+        if not self.caminho.exists():
+            raise PathNotFoundError(str(caminho))
+        if not self.caminho.is_file():
+            raise PathOperationError(str(caminho), "Caminho não é um arquivo")
+
+        with open(self.caminho, "rb") as arquivo:
+            amostra = arquivo.read(TAMANHO_AMOSTRA)
+        detectada, tamanho_bom = detectar_codificacao(amostra)
+        if codificacao is None:
+            codificacao = detectada
+        elif codecs.lookup(codificacao).name != codecs.lookup(detectada).name:
+            tamanho_bom = 0
+        self.codificacao = codificacao
+        self.erros = erros
+        self._inicio = tamanho_bom
+
+        self._quebra = _codificar_quebra(self.codificacao)
+        # Blocos alinhados ao tamanho da unidade de código: a quebra nunca fica dividida.
+        unidade = len(self._quebra)
+        self._tamanho_bloco = max(unidade, tamanho_bloco - tamanho_bloco % unidade)
+        self._offsets = array("Q", [self._inicio])
+        self._indexado_ate = self._inicio
+        self._indice_completo = False
+
+    # === LEITURA SEQUENCIAL ===
+
+    def blocos(self) -> Iterator[str]:
+        """
+        Decodifica o arquivo em blocos, sem carregá-lo inteiro na memória.
+
+        Raises:
+            PathOperationError: Em modo "strict", ao encontrar bytes inválidos.
+
+        Yields:
+            str: Trechos decodificados, na ordem do arquivo.
+        """
+        decodificador = codecs.getincrementaldecoder(self.codificacao)(self.erros)
+        try:
+            with open(self.caminho, "rb") as arquivo:
+                arquivo.seek(self._inicio)
+                while dados := arquivo.read(self._tamanho_bloco):
+                    if texto := decodificador.decode(dados):
+                        yield texto
+                if texto := decodificador.decode(b"", final=True):
+                    yield texto
+        except UnicodeDecodeError as e:
+            raise PathOperationError(str(self.caminho), f"Erro ao decodificar arquivo: {e}") from e
+
+    def linhas(self) -> Iterator[str]:
+        """Itera pelas linhas do arquivo (sem a quebra de linha final)."""
+        # Trechos de uma linha ainda sem quebra; unidos uma única vez quando ela chega.
+        pendentes: list[str] = []
+        for bloco in self.blocos():
+            if "\n" not in bloco:
+                pendentes.append(bloco)
+                continue
+            partes = bloco.split("\n")
+            if pendentes:
+                pendentes.append(partes[0])
+                partes[0] = "".join(pendentes)
+            ultima = partes.pop()
+            pendentes = [ultima] if ultima else []
+            for parte in partes:
+                yield parte.removesuffix("\r")
+        if pendentes:
+            yield "".join(pendentes).removesuffix("\r")
+
+    # === ACESSO ALEATÓRIO ===
+
+    def _indexar_ate(self, linha: int) -> None:
+        """Estende o índice de deslocamentos até conhecer o início de `linha + 1`."""
+        if self._indice_completo or len(self._offsets) > linha + 1:
+            return
+        unidade = len(self._quebra)
+        with open(self.caminho, "rb") as arquivo:
+            arquivo.seek(self._indexado_ate)
+            while len(self._offsets) <= linha + 1:
+                dados = arquivo.read(self._tamanho_bloco)
+                if not dados:
+                    self._indice_completo = True
+                    return
+                posicao = dados.find(self._quebra)
+                while posicao >= 0:
+                    if posicao % unidade == 0:
+                        self._offsets.append(self._indexado_ate + posicao + unidade)
+                        posicao = dados.find(self._quebra, posicao + unidade)
+                    else:
+                        posicao = dados.find(self._quebra, posicao + 1)
+                self._indexado_ate += len(dados)
+
+    def linha(self, numero: int) -> str:
+        """
+        Retorna uma linha pelo número (a partir de 0), lendo apenas os bytes dela.
+
+        Raises:
+            IndexError: Se a linha não existir.
+        """
+        if numero < 0:
+            raise IndexError(numero)
+        self._indexar_ate(numero)
+        if numero >= len(self._offsets):
+            raise IndexError(numero)
+        inicio = self._offsets[numero]
+        if numero + 1 < len(self._offsets):
+            fim: Optional[int] = self._offsets[numero + 1]
+        else:
+            fim = None
+        with open(self.caminho, "rb") as arquivo:
+            arquivo.seek(inicio)
+            dados = arquivo.read(-1 if fim is None else fim - inicio)
+        if fim is None and not dados:
+            raise IndexError(numero)
+        try:
+            texto = dados.decode(self.codificacao, self.erros)
+        except UnicodeDecodeError as e:
+            raise PathOperationError(str(self.caminho), f"Erro ao decodificar linha: {e}") from e
+        return texto.removesuffix("\n").removesuffix("\r")
+
+    def intervalo(self, inicio: int, quantidade: int) -> list[str]:
+        """Retorna até `quantidade` linhas a partir de `inicio` (útil para pré-visualização)."""
+        resultado: list[str] = []
+        for numero in range(inicio, inicio + quantidade):
+            try:
+                resultado.append(self.linha(numero))
+            except IndexError:
+                break
+        return resultado
+
+    def total_linhas(self) -> int:
+        """Conta as linhas, completando o índice de deslocamentos."""
+        while not self._indice_completo:
+            self._indexar_ate(len(self._offsets) + 1024)
+        ultimo = self._offsets[-1]
+        return len(self._offsets) - (1 if ultimo >= self.caminho.stat().st_size else 0)
@@ -4,6 +4,7 @@
 # from typing import Any, Optional
 
 # from controllers.path_controller import PathController
+# from controllers.path_prefetch import SelecaoPrefetch
 # from tools.path_definitions import BasePathData, PathStatus
 
 
@@ -32,6 +33,15 @@
 #         # Controlador que gerencia a lógica do sistema de arquivos
 #         self.controller = PathController()
 
+#         # Carrega a seleção com debounce e pré-carrega as linhas vizinhas
+#         self.selecao = SelecaoPrefetch(
+#             self.controller.ler_caminho,
+#             self._exibir_detalhes,
+#             self.after,
+#             self.after_cancel,
+#             ao_erro=lambda _, erro: self._exibir_erro_gui(erro),
+#         )
+
 #         self._criar_widgets()
 
 #     def _criar_widgets(self) -> None:
@@ -69,6 +79,7 @@
 #         if caminho:
 #             try:
 #                 dados = self.controller.ler_caminho(caminho)
+#                 self.selecao.invalidar()
 #                 self._preencher_treeview(dados)
 #                 self.text_area.delete("1.0", tk.END)
 #             except Exception as e:
@@ -101,13 +112,23 @@
 #         item_id = self.tree.focus()
 #         if not item_id:
 #             return
-#         try:
-#             dados = self.controller.ler_caminho(item_id)
-#             texto = self._formatar_dados_para_texto(dados)
-#             self.text_area.delete("1.0", tk.END)
-#             self.text_area.insert(tk.END, texto)
-#         except Exception as e:
-#             self._exibir_erro_gui(e)
+#         self.selecao.selecionar(item_id, vizinhos=self._vizinhos(item_id))
+
+#     def _vizinhos(self, item_id: str) -> list[str]:
+#         # next()/prev() seguem os ponteiros do item; get_children() e index()
+#         # percorreriam a lista inteira a cada evento.
+#         vizinhos = []
+#         abaixo = acima = item_id
+#         for _ in range(self.selecao.vizinhos):
+#             abaixo = self.tree.next(abaixo) if abaixo else ""
+#             acima = self.tree.prev(acima) if acima else ""
+#             vizinhos.extend(v for v in (abaixo, acima) if v)
+#         return vizinhos
+
+#     def _exibir_detalhes(self, item_id: str, dados: Any) -> None:
+#         texto = self._formatar_dados_para_texto(dados)
+#         self.text_area.delete("1.0", tk.END)
+#         self.text_area.insert(tk.END, texto)
 
 #     def _formatar_dados_para_texto(self, dados: Any) -> str:
 #         if not dados:
@@ -0,0 +1,152 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+from pathlib import Path
+import threading
+import time
+from typing import Iterator
+
+import pytest
+
+from controllers.io_scheduler import AgendadorIO, BaldeTokens, Prioridade
+from models.path_snapshot import varrer_registros
+
+
+class _Relogio:
+    def __init__(self) -> None:
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+def test_balde_tokens() -> None:
+    relogio = _Relogio()
+    balde = BaldeTokens(10, relogio=relogio)
+
+    assert balde.espera(10) == 0
+    balde.consumir(15)
+    assert balde.espera(1) == pytest.approx(0.6)
+    relogio.agora = 2.0
+    assert balde.espera(10) == 0  # Saldo limitado à capacidade.
+    with pytest.raises(ValueError):
+        BaldeTokens(0)
+
+
+def test_limitar_respeita_taxa() -> None:
+    agendador = AgendadorIO(ops_por_segundo=200)
+
+    inicio = time.monotonic()
+    assert len(list(agendador.limitar(range(260)))) == 260
+
+    # 200 na rajada inicial e 60 à taxa de 200/s.
+    assert time.monotonic() - inicio >= 0.25
+
+
+def test_interativa_nao_espera_segundo_plano_saturado() -> None:
+    agendador = AgendadorIO(ops_por_segundo=20)
+    parar = threading.Event()
+
+    def varrer() -> None:
+        while not parar.is_set():
+            agendador.adquirir(Prioridade.SEGUNDO_PLANO)
+
+    fundo = threading.Thread(target=varrer, daemon=True)
+    fundo.start()
+    time.sleep(0.1)
+    try:
+        inicio = time.monotonic()
+        for _ in range(10):
+            agendador.adquirir(Prioridade.INTERATIVA)
+        assert time.monotonic() - inicio < 0.05
+    finally:
+        parar.set()
+        fundo.join(timeout=2)
+
+
+def test_modo_adaptativo() -> None:
+    relogio = _Relogio()
+    agendador = AgendadorIO(
+        ops_por_segundo=1000, adaptativo=True, latencia_alvo=0.01, relogio=relogio
+    )
+
+    # Várias amostras no mesmo intervalo: um único ajuste.
+    relogio.agora = 1.0
+    for _ in range(5):
+        agendador.registrar_latencia(0.1)
+    assert agendador.taxa_ops == 500
+
+    for _ in range(5):
+        relogio.agora += agendador.intervalo_ajuste
+        agendador.registrar_latencia(0.1)
+    reduzida = agendador.taxa_ops
+    assert reduzida is not None and reduzida < 100
+
+    for _ in range(200):
+        relogio.agora += agendador.intervalo_ajuste
+        agendador.registrar_latencia(0.0)
+    assert agendador.taxa_ops == 1000
+
+
+def test_configuracao_divide_limites() -> None:
+    agendador = AgendadorIO(ops_por_segundo=1000, bytes_por_segundo=4000, adaptativo=True)
+
+    parte = AgendadorIO(**agendador.configuracao(4))
+
+    assert parte.taxa_ops == 250 and parte.bytes_por_segundo == 1000
+    assert parte.adaptativo
+    assert AgendadorIO().configuracao(2)["ops_por_segundo"] is None
+
+
+def test_varredura_mede_latencia_das_chamadas_de_sistema(tmp_path: Path) -> None:
+    for i in range(5):
+        (tmp_path / f"{i}.txt").write_text("x")
+    medidas: list[float] = []
+
+    registros = list(varrer_registros(tmp_path, medir=medidas.append))
+
+    # Uma medida para abrir o diretório e uma por `stat`, mesmo que o gerador
+    # faça todas no primeiro item.
+    assert len(registros) == 5 and len(medidas) == 6
+    assert all(m >= 0 for m in medidas)
+
+
+def test_limitar_nao_mede_o_consumo() -> None:
+    agendador = AgendadorIO()
+
+    def lento() -> Iterator[int]:
+        for i in range(3):
+            time.sleep(0.02)
+            yield i
+
+    assert list(agendador.limitar(lento())) == [0, 1, 2]
+    assert agendador.latencia_media == 0
+
+
+def test_stat_e_progresso(tmp_path: Path) -> None:
+    arquivo = tmp_path / "a.txt"
+    arquivo.write_text("abc")
+    agendador = AgendadorIO(bytes_por_segundo=1000)
+    chamadas = []
+
+    assert agendador.stat(arquivo).st_size == 3
+    progresso = agendador.como_progresso(progresso=lambda *args: chamadas.append(args))
+    inicio = time.monotonic()
+    for posicao in (0, 500, 1000, 1500):
+        progresso("destino", posicao, 1500)
+
+    assert time.monotonic() - inicio >= 0.4
+    assert chamadas[-1] == ("destino", 1500, 1500)
+
+
+def test_progresso_de_copia_retomada_cobra_apenas_o_delta() -> None:
+    agendador = AgendadorIO(bytes_por_segundo=1000)
+    cobrados: list[int] = []
+    agendador.adquirir = lambda _p, _o=1, tamanho=0: cobrados.append(tamanho)  # type: ignore
+    progresso = agendador.como_progresso()
+
+    for posicao in (20_000, 20_500, 21_000):  # Cópia retomada a partir de 20 000 bytes.
+        progresso("destino", posicao, 21_000)
+    progresso("destino", 0, 300)  # Nova cópia para o mesmo destino.
+    progresso("destino", 300, 300)
+
+    assert cobrados == [500, 500, 300]
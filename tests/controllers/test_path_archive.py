@@ -0,0 +1,142 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+import io
+from pathlib import Path
+import tarfile
+import time
+import zipfile
+
+import pytest
+
+from controllers import path_archive
+from controllers.path_archive import (
+    abrir_arquivo_virtual,
+    ArquivoVirtual,
+    dividir_caminho_virtual,
+    listar_caminho_virtual,
+)
+from tools.path_definitions import PathNotFoundError, PathOperationError, PathStatus, PathType
+
+
+def _criar_zip(destino: Path) -> Path:
+    with zipfile.ZipFile(destino, "w") as arquivo:
+        arquivo.writestr("docs/", "")
+        arquivo.writestr("docs/leia.txt", "conteúdo do zip")
+        arquivo.writestr("src/pacote/modulo.py", "x = 1\n")
+        arquivo.writestr("../fora.txt", "normalizado")
+    return destino
+
+
+def _criar_tar(destino: Path) -> Path:
+    with tarfile.open(destino, "w:gz") as arquivo:
+        dados = b"dados do tar"
+        info = tarfile.TarInfo("pasta/dados.bin")
+        info.size = len(dados)
+        arquivo.addfile(info, io.BytesIO(dados))
+        link = tarfile.TarInfo("pasta/atalho")
+        link.type, link.linkname = tarfile.SYMTYPE, "dados.bin"
+        arquivo.addfile(link)
+        fisico = tarfile.TarInfo("copia.bin")
+        fisico.type, fisico.linkname = tarfile.LNKTYPE, "pasta/dados.bin"
+        arquivo.addfile(fisico)
+    return destino
+
+
+def test_zip_listagem_e_leitura(tmp_path: Path) -> None:
+    arquivo = ArquivoVirtual(_criar_zip(tmp_path / "pacote.zip"))
+
+    raiz = {m.nome: m for m in arquivo.listar()}
+    assert set(raiz) == {"docs", "src", "fora.txt"}
+    assert raiz["src"].tipo == PathType.DIRECTORY  # Diretório implícito.
+    assert raiz["docs"].caminho == str(tmp_path / "pacote.zip" / "docs")
+
+    modulo = arquivo.listar("src/pacote")[0]
+    assert (modulo.nome, modulo.tipo, modulo.tamanho) == ("modulo.py", PathType.FILE, 6)
+    assert arquivo.ler("docs/leia.txt").decode() == "conteúdo do zip"
+    assert arquivo.ler("docs/leia.txt", 4) == b"cont"
+    assert len(arquivo) == 6
+
+    with pytest.raises(PathNotFoundError):
+        arquivo.listar("inexistente")
+    with pytest.raises(PathOperationError):
+        arquivo.ler("docs")
+    arquivo.fechar()
+
+
+def test_tar_links_e_extracao(tmp_path: Path) -> None:
+    arquivo = ArquivoVirtual(_criar_tar(tmp_path / "pacote.tar.gz"))
+
+    assert arquivo.formato == "tar"
+    assert {m.nome: m.tipo for m in arquivo.listar("pasta")} == {
+        "dados.bin": PathType.FILE,
+        "atalho": PathType.SYMLINK,
+    }
+    assert arquivo.ler("pasta/atalho") == b"dados do tar"
+    assert arquivo.ler("copia.bin") == b"dados do tar"
+
+    extraido = arquivo.extrair_membro("pasta/dados.bin", tmp_path / "saida.bin")
+    assert extraido.status == PathStatus.CREATED
+    assert (tmp_path / "saida.bin").read_bytes() == b"dados do tar"
+
+
+def test_cache_e_caminhos_virtuais(tmp_path: Path) -> None:
+    zip_path = _criar_zip(tmp_path / "pacote.zip")
+
+    assert abrir_arquivo_virtual(zip_path) is abrir_arquivo_virtual(zip_path)
+    assert dividir_caminho_virtual(zip_path / "src" / "pacote") == (str(zip_path), "src/pacote")
+    assert dividir_caminho_virtual(tmp_path) is None
+    assert [m.nome for m in listar_caminho_virtual(zip_path / "docs")] == ["leia.txt"]
+
+    (tmp_path / "texto.txt").write_text("não é arquivo compactado")
+    with pytest.raises(PathOperationError):
+        ArquivoVirtual(tmp_path / "texto.txt")
+    with pytest.raises(PathNotFoundError):
+        listar_caminho_virtual(tmp_path / "texto.txt" / "x")
+
+
+def test_zip_grande_indexado_rapidamente(tmp_path: Path) -> None:
+    destino = tmp_path / "grande.zip"
+    with zipfile.ZipFile(destino, "w") as arquivo:
+        for i in range(50_000):
+            arquivo.writestr(f"d{i % 100}/arquivo{i}.txt", "")
+
+    inicio = time.perf_counter()
+    listagem = ArquivoVirtual(destino).listar()
+    assert time.perf_counter() - inicio < 2.0
+    assert len(listagem) == 100
+
+
+def test_zip_com_data_dos_zerada(tmp_path: Path) -> None:
+    destino = tmp_path / "zerado.zip"
+    with zipfile.ZipFile(destino, "w") as arquivo:
+        arquivo.writestr(zipfile.ZipInfo("sem_data.txt", (1980, 0, 0, 0, 0, 0)), "x")
+
+    membro = ArquivoVirtual(destino).listar()[0]
+
+    assert (membro.nome, membro.modificado) == ("sem_data.txt", 0.0)
+
+
+def test_cache_fecha_indices_descartados(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(path_archive, "MAX_INDICES", 1)
+    primeiro = abrir_arquivo_virtual(_criar_zip(tmp_path / "um.zip"))
+
+    aberto = primeiro.abrir("docs/leia.txt")
+    membro = aberto.__enter__()
+
+    abrir_arquivo_virtual(_criar_zip(tmp_path / "dois.zip"))
+
+    # O handle foi liberado, mas quem ainda guarda o índice continua lendo.
+    assert primeiro._zip is None
+    assert membro.read().decode() == "conteúdo do zip"
+    aberto.__exit__(None, None, None)
+    assert primeiro.ler("docs/leia.txt", 4) == b"cont"
+
+
+def test_zip_removido_gera_erro_de_operacao(tmp_path: Path) -> None:
+    caminho = _criar_zip(tmp_path / "pacote.zip")
+    arquivo = ArquivoVirtual(caminho)
+    arquivo.fechar()
+    caminho.unlink()
+
+    with pytest.raises(PathOperationError):
+        arquivo.ler("docs/leia.txt")
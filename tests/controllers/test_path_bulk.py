@@ -0,0 +1,105 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+import os
+from pathlib import Path
+
+import pytest
+
+from controllers import path_bulk
+from controllers.path_bulk import criar_diretorios, marcar_removidos, remover_arvore
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathNotFoundError, PathStatus, PathType
+
+
+def _criar_arvore(raiz: Path, largura: int = 3, profundidade: int = 3) -> int:
+    total = 0
+    for i in range(largura):
+        atual = raiz / f"d{i}"
+        for nivel in range(profundidade):
+            atual = atual / f"n{nivel}"
+        atual.mkdir(parents=True)
+        total += profundidade + 1
+        for j in range(5):
+            (atual / f"f{j}.txt").write_text("x")
+            total += 1
+    (raiz / "solto.txt").write_text("y")
+    return total + 1
+
+
+def test_criar_diretorios(tmp_path: Path) -> None:
+    (tmp_path / "existente").mkdir()
+
+    resultados = criar_diretorios(
+        [tmp_path / "a" / "b" / "c", tmp_path / "a" / "b" / "d", tmp_path / "existente"]
+    )
+
+    assert [r.status for r in resultados] == [
+        PathStatus.CREATED,
+        PathStatus.CREATED,
+        PathStatus.EXISTS,
+    ]
+    assert all(r.tipo == PathType.DIRECTORY for r in resultados)
+    assert (tmp_path / "a" / "b" / "c").is_dir()
+    assert (tmp_path / "a" / "b" / "d").is_dir()
+
+
+def test_criar_diretorios_conflito_com_arquivo(tmp_path: Path) -> None:
+    (tmp_path / "arquivo").write_text("x")
+
+    (resultado,) = criar_diretorios([tmp_path / "arquivo" / "sub"])
+
+    assert resultado.status == PathStatus.ERROR
+
+
+@pytest.mark.parametrize("dir_fd", [True, False])
+def test_remover_arvore(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dir_fd: bool) -> None:
+    monkeypatch.setattr(path_bulk, "_SUPORTA_DIR_FD", dir_fd and path_bulk._SUPORTA_DIR_FD)
+    raiz = tmp_path / "raiz"
+    esperado = _criar_arvore(raiz)
+
+    assert remover_arvore(raiz, max_workers=2) == esperado + 1
+    assert not raiz.exists()
+
+
+def test_remover_arvore_subdiretorio_unico_grande(tmp_path: Path) -> None:
+    raiz = tmp_path / "raiz"
+    esperado = 1
+    for i in range(20):
+        for j in range(10):
+            folha = raiz / "unico" / f"a{i}" / f"b{j}"
+            folha.mkdir(parents=True)
+            (folha / "f.txt").write_text("x")
+    esperado += 1 + 20 + 20 * 10 * 2
+
+    assert remover_arvore(raiz, max_workers=4) == esperado
+    assert not raiz.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlink indisponível")
+def test_remover_arvore_nao_segue_links(tmp_path: Path) -> None:
+    externo = tmp_path / "externo"
+    externo.mkdir()
+    (externo / "preservar.txt").write_text("x")
+    raiz = tmp_path / "raiz"
+    (raiz / "sub").mkdir(parents=True)
+    (raiz / "sub" / "link").symlink_to(externo, target_is_directory=True)
+
+    remover_arvore(raiz)
+
+    assert not raiz.exists()
+    assert (externo / "preservar.txt").exists()
+
+
+def test_remover_arvore_inexistente(tmp_path: Path) -> None:
+    with pytest.raises(PathNotFoundError):
+        remover_arvore(tmp_path / "nada")
+
+
+def test_marcar_removidos(tmp_path: Path) -> None:
+    cache = {
+        str(tmp_path / nome): CaminhoModel(nome, PathType.FILE, str(tmp_path / nome))
+        for nome in ("a", os.path.join("a", "b"), "ab")
+    }
+
+    assert marcar_removidos(cache, tmp_path / "a") == 2
+    assert cache[str(tmp_path / "ab")].status == PathStatus.UNKNOWN
@@ -0,0 +1,129 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Iterator
+
+import pytest
+
+from controllers.path_classifier import (
+    TAMANHO_AMOSTRA,
+    CacheTipoConteudo,
+    ClassificadorConteudo,
+    detectar_tipo_conteudo,
+)
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathType
+
+
+@pytest.mark.parametrize(
+    "amostra,esperado",
+    [
+        (b"", "application/x-empty"),
+        (b"%PDF-1.7\n", "application/pdf"),
+        (b"\x89PNG\r\n\x1a\n....", "image/png"),
+        (b"PK\x03\x04rest", "application/zip"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"\0" * 257 + b"ustar\x0000", "application/x-tar"),
+        (b"<!DOCTYPE NETSCAPE-Bookmark-file-1>", "text/html"),
+        ("olá, mundo".encode(), "text/plain"),
+        (b"\xff\xfe\x00\x01\x02", "application/octet-stream"),
+        (b"a" * (TAMANHO_AMOSTRA - 1) + "ç".encode()[:1], "text/plain"),
+    ],
+)
+def test_detectar_tipo_conteudo(amostra: bytes, esperado: str) -> None:
+    assert detectar_tipo_conteudo(amostra) == esperado
+
+
+def test_cache_nao_recalcula_arquivo_inalterado(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    arquivo = tmp_path / "a.txt"
+    arquivo.write_text("texto")
+    cache = CacheTipoConteudo()
+    assert cache.tipo_de(str(arquivo)) == "text/plain"
+
+    leituras: list[str] = []
+    original = open
+
+    def open_contado(caminho, *args, **kwargs):  # type: ignore[no-untyped-def]
+        leituras.append(str(caminho))
+        return original(caminho, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", open_contado)
+    assert cache.tipo_de(str(arquivo)) == "text/plain"
+    assert not leituras
+
+    arquivo.write_bytes(b"%PDF-1.4")
+    os.utime(arquivo, ns=(0, 10**9))
+    assert cache.tipo_de(str(arquivo)) == "application/pdf"
+    assert leituras == [str(arquivo)]
+
+
+def test_classificador_preenche_modelos_e_indice(tmp_path: Path) -> None:
+    (tmp_path / "img.png").write_bytes(b"\x89PNG\r\n\x1a\nxxxx")
+    (tmp_path / "nota.txt").write_text("nota")
+    modelos = [CaminhoModel.from_path(p) for p in sorted(tmp_path.iterdir())]
+    modelos.append(CaminhoModel.from_path(tmp_path))
+
+    classificador = ClassificadorConteudo(max_workers=2)
+    try:
+        resultado = list(classificador.classificar(modelos))
+    finally:
+        classificador.encerrar()
+
+    assert [m.tipo_conteudo for m in resultado] == ["image/png", "text/plain", None]
+    assert classificador.indice.filtrar("image/") == {str(tmp_path / "img.png")}
+    assert classificador.indice.tipos() == {"image/png": 1, "text/plain": 1}
+
+
+def test_classificador_limita_pendentes(tmp_path: Path) -> None:
+    consumidos = 0
+
+    def entrada() -> Iterator[CaminhoModel]:
+        nonlocal consumidos
+        for i in range(100):
+            consumidos += 1
+            yield CaminhoModel(f"d{i}", PathType.DIRECTORY, str(tmp_path))
+
+    classificador = ClassificadorConteudo(max_workers=2)
+    try:
+        resultado = classificador.classificar(entrada())
+        next(resultado)
+        assert consumidos <= 4
+        assert len(list(resultado)) == 99
+    finally:
+        classificador.encerrar()
+
+
+def test_classificador_em_segundo_plano_limita_pendentes(tmp_path: Path) -> None:
+    arquivo = tmp_path / "a.txt"
+    arquivo.write_text("texto")
+    consumidos = 0
+    liberar = threading.Event()
+    concluidos: list[CaminhoModel] = []
+
+    def entrada() -> Iterator[CaminhoModel]:
+        nonlocal consumidos
+        for _ in range(100):
+            consumidos += 1
+            yield CaminhoModel.from_path(arquivo)
+
+    def ao_concluir(modelo: CaminhoModel) -> None:
+        liberar.wait(5)
+        concluidos.append(modelo)
+
+    classificador = ClassificadorConteudo(max_workers=2)
+    try:
+        futuro = classificador.classificar_em_segundo_plano(entrada(), ao_concluir)
+        time.sleep(0.2)
+        # O chamador não bloqueia, e a entrada para na janela de pendentes.
+        assert not futuro.done() and consumidos <= 4
+        liberar.set()
+        assert futuro.result(timeout=10) == 100
+    finally:
+        classificador.encerrar()
+
+    assert len(concluidos) == 100 and all(m.tipo_conteudo == "text/plain" for m in concluidos)
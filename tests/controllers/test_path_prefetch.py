@@ -0,0 +1,134 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+import threading
+import time
+from typing import Any, Callable
+
+from controllers.path_prefetch import SelecaoPrefetch
+
+
+class _Agenda:
+    """Substitui `after`/`after_cancel`: os callbacks rodam quando `rodar()` é chamado."""
+
+    def __init__(self) -> None:
+        self.pendentes: dict[int, Callable[[], None]] = {}
+        self._proximo = 0
+
+    def after(self, _ms: int, callback: Callable[[], None]) -> int:
+        self._proximo += 1
+        self.pendentes[self._proximo] = callback
+        return self._proximo
+
+    def after_cancel(self, identificador: Any) -> None:
+        self.pendentes.pop(identificador, None)
+
+    def rodar(self, limite: float = 2.0) -> None:
+        fim = time.monotonic() + limite
+        while self.pendentes and time.monotonic() < fim:
+            identificador = min(self.pendentes)
+            self.pendentes.pop(identificador)()
+            time.sleep(0.005)
+
+
+def _criar(carregar: Callable[[str], str], agenda: _Agenda, entregues: list) -> SelecaoPrefetch:
+    return SelecaoPrefetch(
+        carregar,
+        lambda chave, valor: entregues.append((chave, valor)),
+        agenda.after,
+        agenda.after_cancel,
+        vizinhos=1,
+        tamanho_cache=3,
+    )
+
+
+def test_debounce_entrega_apenas_a_selecao_final() -> None:
+    agenda, entregues, carregados = _Agenda(), [], []
+    linhas = ["a", "b", "c", "d"]
+
+    def carregar(chave: str) -> str:
+        carregados.append(chave)
+        return chave.upper()
+
+    selecao = _criar(carregar, agenda, entregues)
+    for posicao, chave in enumerate(linhas[:3]):
+        selecao.selecionar(chave, linhas, posicao)
+    agenda.rodar()
+    selecao.encerrar()
+
+    assert entregues == [("c", "C")]
+    assert "a" not in carregados
+    assert set(carregados) == {"b", "c", "d"}  # Seleção e vizinhos.
+
+
+def test_vizinhos_em_cache_entregues_imediatamente() -> None:
+    agenda, entregues = _Agenda(), []
+    linhas = ["a", "b", "c"]
+    selecao = _criar(str.upper, agenda, entregues)
+
+    selecao.selecionar("b", linhas)
+    agenda.rodar()
+    selecao.selecionar("c", linhas)
+
+    assert entregues == [("b", "B"), ("c", "C")]
+    selecao.encerrar()
+
+
+def test_resultado_obsoleto_nao_e_entregue() -> None:
+    agenda, entregues, erros = _Agenda(), [], []
+    liberar = threading.Event()
+
+    def carregar(chave: str) -> str:
+        if chave == "lento":
+            liberar.wait(2)
+        if chave == "ruim":
+            raise OSError("falha")
+        return chave
+
+    selecao = SelecaoPrefetch(
+        carregar,
+        lambda chave, valor: entregues.append(chave),
+        agenda.after,
+        agenda.after_cancel,
+        ao_erro=lambda chave, erro: erros.append(chave),
+    )
+    selecao.selecionar("lento")
+    agenda.pendentes.pop(min(agenda.pendentes))()  # Dispara o debounce.
+    selecao.selecionar("ruim")
+    liberar.set()
+    agenda.rodar()
+    selecao.encerrar()
+
+    assert not entregues
+    assert erros == ["ruim"]
+    assert selecao.em_cache("lento") == "lento"
+
+
+def test_cache_limitado_e_invalidar() -> None:
+    agenda, entregues = _Agenda(), []
+    selecao = _criar(str.upper, agenda, entregues)
+
+    for chave in "abcd":
+        selecao.selecionar(chave)
+        agenda.rodar()
+    selecao.invalidar("d")
+
+    assert selecao.em_cache("a") is None
+    assert selecao.em_cache("d") is None
+    assert selecao.em_cache("c") == "C"
+    selecao.encerrar()
+
+
+def test_vizinhos_informados_pela_view() -> None:
+    agenda, entregues, carregados = _Agenda(), [], []
+
+    def carregar(chave: str) -> str:
+        carregados.append(chave)
+        return chave.upper()
+
+    selecao = _criar(carregar, agenda, entregues)
+    selecao.selecionar("b", vizinhos=["c", "a"])
+    agenda.rodar()
+    selecao.encerrar()
+
+    assert entregues == [("b", "B")]
+    assert set(carregados) == {"a", "b", "c"}
@@ -0,0 +1,119 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+from pathlib import Path
+import threading
+import time
+
+import pytest
+
+from controllers import path_scanner
+from controllers.io_scheduler import AgendadorIO
+from controllers.path_scanner import (
+    LoteVarredura,
+    mesclar_no_cache,
+    varrer_paralelo,
+    varrer_registros_paralelo,
+)
+from models.path_snapshot import varrer_registros
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathInvalidError, PathStatus, PathType
+
+
+def _criar_arvore(raiz: Path) -> None:
+    for i in range(3):
+        for j in range(4):
+            pasta = raiz / f"a{i}" / f"b{j}"
+            pasta.mkdir(parents=True)
+            for k in range(3):
+                (pasta / f"f{k}.txt").write_text("x" * k)
+    (raiz / "raiz.txt").write_text("r")
+
+
+def test_varrer_paralelo_equivale_a_varredura_sequencial(tmp_path: Path) -> None:
+    _criar_arvore(tmp_path)
+
+    modelos = list(varrer_paralelo([tmp_path], processos=2))
+
+    esperado = {str(tmp_path / r.caminho) for r in varrer_registros(tmp_path)}
+    assert len(modelos) == len(esperado)
+    assert {m.caminho for m in modelos} == esperado
+    assert all(m.status == PathStatus.EXISTS for m in modelos)
+    arquivo = next(m for m in modelos if m.caminho.endswith("f2.txt"))
+    assert arquivo.tipo == PathType.FILE
+    assert arquivo.tamanho == 2
+
+
+def test_varrer_registros_paralelo_produz_lotes_colunares(tmp_path: Path) -> None:
+    _criar_arvore(tmp_path)
+
+    lotes = list(varrer_registros_paralelo([tmp_path], processos=2))
+
+    assert all(isinstance(lote, LoteVarredura) for _, lote in lotes)
+    assert len(lotes) > 1  # entradas da expansão + um lote por shard
+    registros = sorted(r for _, lote in lotes for r in lote)
+    assert registros == sorted(varrer_registros(tmp_path))
+    assert sum(sum(lote.tamanhos) for _, lote in lotes) == sum(r.tamanho for r in registros)
+
+
+def test_lote_varredura_monta_modelos_sob_demanda(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("abc")
+    registros = list(varrer_registros(tmp_path))
+
+    lote = LoteVarredura.from_registros(str(tmp_path), registros)
+
+    assert len(lote) == 1 and lote._caminhos is None
+    assert lote.registro(0) == registros[0]
+    modelo = next(lote.modelos())
+    assert modelo.caminho == str(tmp_path / "a.txt") and modelo.tamanho == 3
+    assert len(LoteVarredura.from_registros(str(tmp_path), [])) == 0
+
+
+def test_varrer_paralelo_com_agendador(tmp_path: Path) -> None:
+    _criar_arvore(tmp_path)
+    agendador = AgendadorIO(ops_por_segundo=20)
+
+    inicio = time.monotonic()
+    modelos = list(varrer_paralelo([tmp_path], processos=1, agendador=agendador))
+
+    assert len(modelos) == len(list(varrer_registros(tmp_path)))
+    # Os 36 arquivos são listados no worker, que recebe o limite de 20 ops/s.
+    assert time.monotonic() - inicio >= 0.5
+
+
+def test_varrer_paralelo_encerramento_antecipado(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Lotes de uma entrada: a fila limitada enche e os workers ficam bloqueados em `put`.
+    monkeypatch.setattr(path_scanner, "TAMANHO_LOTE", 1)
+    _criar_arvore(tmp_path)
+    primeiros = []
+
+    def consumir() -> None:
+        for modelo in varrer_paralelo([tmp_path], processos=2):
+            primeiros.append(modelo)
+            break
+
+    consumidor = threading.Thread(target=consumir, daemon=True)
+    consumidor.start()
+    consumidor.join(timeout=10)
+
+    assert not consumidor.is_alive()
+    assert len(primeiros) == 1
+
+
+def test_varrer_paralelo_raiz_invalida(tmp_path: Path) -> None:
+    with pytest.raises(PathInvalidError):
+        list(varrer_paralelo([tmp_path / "inexistente"], processos=1))
+
+
+def test_mesclar_no_cache_atualiza_indices() -> None:
+    cache: dict[str, CaminhoModel] = {}
+    indice: dict[PathType, set[str]] = {}
+    mesclar_no_cache(cache, [CaminhoModel("x", PathType.FILE, "/x")], indice)
+
+    total = mesclar_no_cache(cache, [CaminhoModel("x", PathType.DIRECTORY, "/x")], indice)
+
+    assert total == 1
+    assert cache["/x"].tipo == PathType.DIRECTORY
+    assert indice[PathType.FILE] == set()
+    assert indice[PathType.DIRECTORY] == {"/x"}
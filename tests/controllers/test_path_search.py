@@ -0,0 +1,145 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+from pathlib import Path
+import time
+from typing import Iterator
+
+import pytest
+
+from controllers import path_search
+from controllers.io_scheduler import AgendadorIO
+from controllers.path_search import buscar_conteudo
+from models.path_system_model import CaminhoModel
+
+
+def _modelos(*arquivos: Path) -> list[CaminhoModel]:
+    modelos = []
+    for arquivo in arquivos:
+        modelo = CaminhoModel.from_path(arquivo)
+        modelo.tamanho = arquivo.stat().st_size
+        modelos.append(modelo)
+    return modelos
+
+
+def test_buscar_literal(tmp_path: Path) -> None:
+    a = tmp_path / "a.txt"
+    a.write_text("primeira linha\nsegunda com alvo\nalvo alvo na terceira\n")
+    b = tmp_path / "b.py"
+    b.write_text("nada aqui\n")
+
+    ocorrencias = list(buscar_conteudo(_modelos(a, b, tmp_path), "alvo"))
+
+    assert [(o.caminho, o.linha) for o in ocorrencias] == [(str(a), 2), (str(a), 3)]
+    assert ocorrencias[0].offset == len("primeira linha\nsegunda com ")
+    assert ocorrencias[1].trecho == "alvo alvo na terceira"
+
+
+def test_buscar_regex_sem_maiusculas(tmp_path: Path) -> None:
+    arquivo = tmp_path / "log.txt"
+    arquivo.write_text("INFO ok\nERRO 42\nerro 7\n")
+
+    ocorrencias = list(
+        buscar_conteudo(_modelos(arquivo), r"erro \d+", regex=True, ignorar_maiusculas=True)
+    )
+
+    assert [o.linha for o in ocorrencias] == [2, 3]
+
+
+def test_buscar_filtros_e_binarios(tmp_path: Path) -> None:
+    binario = tmp_path / "dados.txt"
+    binario.write_bytes(b"alvo\0\1\2")
+    grande = tmp_path / "grande.txt"
+    grande.write_text("alvo" * 100)
+    outro = tmp_path / "codigo.py"
+    outro.write_text("alvo\n")
+    vazio = tmp_path / "vazio.txt"
+    vazio.write_text("")
+
+    modelos = _modelos(binario, grande, outro, vazio)
+
+    assert not list(buscar_conteudo(modelos, "alvo", extensoes=[".txt"], tamanho_maximo=100))
+    assert [o.caminho for o in buscar_conteudo(modelos, "alvo", extensoes=[".PY"])] == [
+        str(outro)
+    ]
+
+
+def test_buscar_encerramento_antecipado(tmp_path: Path) -> None:
+    arquivos = []
+    for i in range(20):
+        arquivo = tmp_path / f"{i}.txt"
+        arquivo.write_text("alvo\n" * 500)
+        arquivos.append(arquivo)
+
+    busca = buscar_conteudo(_modelos(*arquivos), "alvo", max_workers=2)
+    primeiras = [next(busca) for _ in range(3)]
+    busca.close()
+
+    assert len(primeiras) == 3
+
+
+def test_buscar_encerramento_durante_arquivo_sem_ocorrencias(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(path_search, "BLOCO_LEITURA", 1024)
+    pequeno = tmp_path / "a.txt"
+    pequeno.write_text("alvo\n")
+    grande = tmp_path / "b.txt"
+    grande.write_text("nada aqui\n" * 6_000)
+    # A 4 KB/s, ler o arquivo grande inteiro levaria cerca de 15 s.
+    agendador = AgendadorIO(bytes_por_segundo=4096)
+
+    busca = buscar_conteudo(_modelos(pequeno, grande), "alvo", max_workers=2, agendador=agendador)
+    assert next(busca).caminho == str(pequeno)
+    inicio = time.monotonic()
+    busca.close()
+
+    assert time.monotonic() - inicio < 2
+
+
+def test_buscar_ancora_em_qualquer_linha(tmp_path: Path) -> None:
+    arquivo = tmp_path / "log.txt"
+    arquivo.write_text("INFO ok\nERRO 1\nINFO ERRO\nERRO 2\n")
+
+    ocorrencias = list(buscar_conteudo(_modelos(arquivo), r"^ERRO \d$", regex=True))
+
+    assert [o.linha for o in ocorrencias] == [2, 4]
+
+
+def test_buscar_entre_blocos(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(path_search, "BLOCO_LEITURA", 16)
+    conteudo = "curta\n" + "x" * 50 + "alvo" + "y" * 50 + "\n" + "linha\n" * 10 + "fim alvo"
+    arquivo = tmp_path / "a.txt"
+    arquivo.write_text(conteudo)
+
+    ocorrencias = list(buscar_conteudo(_modelos(arquivo), "alvo"))
+
+    assert [(o.linha, o.offset) for o in ocorrencias] == [
+        (2, conteudo.index("alvo")),
+        (13, conteudo.rindex("alvo")),
+    ]
+    assert ocorrencias[1].trecho == "fim alvo"
+
+
+def test_buscar_repassa_erro_da_entrada(tmp_path: Path) -> None:
+    def entradas() -> Iterator[CaminhoModel]:
+        yield from _modelos(tmp_path)
+        raise OSError("falha na listagem")
+
+    with pytest.raises(OSError, match="falha na listagem"):
+        list(buscar_conteudo(entradas(), "alvo"))
+
+
+def test_buscar_com_agendador(tmp_path: Path) -> None:
+    arquivos = []
+    for i in range(3):
+        arquivo = tmp_path / f"{i}.txt"
+        arquivo.write_text("alvo\n" * 200)
+        arquivos.append(arquivo)
+    agendador = AgendadorIO(bytes_por_segundo=2000)
+
+    inicio = time.monotonic()
+    ocorrencias = list(buscar_conteudo(_modelos(*arquivos), "alvo", agendador=agendador))
+
+    assert len(ocorrencias) == 600
+    # 3000 bytes lidos: 2000 na rajada inicial e 1000 à taxa de 2000 B/s.
+    assert time.monotonic() - inicio >= 0.4
@@ -0,0 +1,93 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+import random
+import time
+from typing import Any
+
+import pytest
+
+from controllers.path_sort import (
+    FiltroListagem,
+    MotorOrdenacao,
+    chave_natural,
+    ordenar_modelos,
+)
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathStatus, PathType
+
+
+def _modelo(
+    nome: str, tipo: PathType = PathType.FILE, tamanho: int | None = 0, **extra: Any
+) -> CaminhoModel:
+    return CaminhoModel(nome, tipo, f"/base/{nome}", tamanho=tamanho, **extra)
+
+
+def test_chave_natural() -> None:
+    nomes = ["arquivo10.txt", "Arquivo2.txt", "arquivo1.txt", "b", "a"]
+    assert sorted(nomes, key=chave_natural) == [
+        "a",
+        "arquivo1.txt",
+        "Arquivo2.txt",
+        "arquivo10.txt",
+        "b",
+    ]
+
+
+def test_ordenacao_multicoluna_e_pastas_primeiro() -> None:
+    modelos = [
+        _modelo("c.txt", tamanho=5),
+        _modelo("pasta", PathType.DIRECTORY, None),
+        _modelo("a.txt", tamanho=5),
+        _modelo("b.py", tamanho=9),
+    ]
+    motor = MotorOrdenacao(modelos)
+
+    motor.ordenar(("tamanho", True), "nome")
+    assert [m.nome for m in motor.janela(0, 10)] == ["pasta", "b.py", "a.txt", "c.txt"]
+
+    motor.pastas_primeiro = False
+    motor.ordenar("extensao", ("nome", True))
+    assert [m.nome for m in motor.janela(0, 10)] == ["pasta", "b.py", "c.txt", "a.txt"]
+    assert motor.posicao("/base/a.txt") == 3
+
+    with pytest.raises(ValueError):
+        motor.ordenar("cor")
+
+
+def test_filtros_preservam_ordem() -> None:
+    modelos = [
+        _modelo("a.PY", tamanho=100),
+        _modelo("b.txt", tamanho=10),
+        _modelo("c.py", tamanho=None),
+        _modelo("d.py", tamanho=50, status=PathStatus.ERROR),
+        _modelo("dir", PathType.DIRECTORY),
+    ]
+    motor = MotorOrdenacao(modelos, pastas_primeiro=False)
+    motor.ordenar(("nome", True))
+
+    motor.filtrar(FiltroListagem(extensoes={".py"}, tamanho_minimo=20))
+    assert [m.nome for m in motor.janela(0, 10)] == ["d.py", "a.PY"]
+
+    motor.filtrar(FiltroListagem(tipos={PathType.FILE}, status={PathStatus.UNKNOWN}, texto="B"))
+    assert [m.nome for m in motor.janela(0, 10)] == ["b.txt"]
+
+    motor.filtrar(None)
+    assert len(motor) == 5
+    assert [m.nome for m in motor.janela(3, 10)] == ["b.txt", "a.PY"]
+
+
+def test_reordenacao_reaproveita_chaves() -> None:
+    gerador = random.Random(7)
+    modelos = [
+        _modelo(f"arquivo{gerador.randrange(10**6)}.txt", tamanho=gerador.randrange(10**9))
+        for _ in range(100_000)
+    ]
+    motor = MotorOrdenacao(modelos)
+    motor.ordenar("nome")
+    motor.ordenar(("tamanho", True))
+
+    inicio = time.perf_counter()
+    motor.ordenar("nome")
+    assert time.perf_counter() - inicio < 0.5
+    tamanhos = [m.tamanho or 0 for m in ordenar_modelos(modelos[:1000], ("tamanho", True))]
+    assert tamanhos == sorted(tamanhos, reverse=True)
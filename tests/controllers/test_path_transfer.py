@@ -0,0 +1,172 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+import errno
+import os
+from pathlib import Path
+import time
+
+import pytest
+
+from controllers import path_transfer
+from controllers.io_scheduler import AgendadorIO
+from controllers.path_transfer import (
+    SUFIXO_IDENTIDADE,
+    SUFIXO_PARCIAL,
+    copiar_arquivo,
+    mover_arquivo,
+    processar_lote,
+)
+from tools.path_definitions import PathNotFoundError, PathStatus, PathType
+
+
+def test_copiar_arquivo_preserva_conteudo_e_metadados(tmp_path: Path) -> None:
+    origem = tmp_path / "origem.bin"
+    origem.write_bytes(os.urandom(100_000))
+    os.utime(origem, (1_000_000, 1_000_000))
+    progresso: list[tuple[int, int]] = []
+
+    resultado = copiar_arquivo(
+        origem, tmp_path / "sub" / "destino.bin", progresso=lambda _, c, t: progresso.append((c, t))
+    )
+
+    destino = tmp_path / "sub" / "destino.bin"
+    assert destino.read_bytes() == origem.read_bytes()
+    assert destino.stat().st_mtime == 1_000_000
+    assert resultado.destino.status == PathStatus.CREATED
+    assert resultado.origem.status == PathStatus.EXISTS
+    assert progresso[-1] == (100_000, 100_000)
+    assert not (tmp_path / "sub" / ("destino.bin" + SUFIXO_PARCIAL)).exists()
+
+
+def test_copiar_arquivo_retoma_parcial(tmp_path: Path) -> None:
+    origem = tmp_path / "origem.bin"
+    dados = os.urandom(50_000)
+    origem.write_bytes(dados)
+    parcial = tmp_path / ("destino.bin" + SUFIXO_PARCIAL)
+    parcial.write_bytes(dados[:20_000])
+    # Identidade registrada no início da cópia interrompida.
+    (tmp_path / ("destino.bin" + SUFIXO_PARCIAL + SUFIXO_IDENTIDADE)).write_bytes(
+        path_transfer._identidade(origem)  # pylint: disable=protected-access
+    )
+    progresso: list[int] = []
+
+    copiar_arquivo(origem, tmp_path / "destino.bin", progresso=lambda _, c, t: progresso.append(c))
+
+    assert (tmp_path / "destino.bin").read_bytes() == dados
+    assert progresso[0] == 20_000 and all(c > 20_000 for c in progresso[1:])
+
+
+def test_copiar_arquivo_descarta_parcial_de_origem_alterada(tmp_path: Path) -> None:
+    origem = tmp_path / "origem.bin"
+    origem.write_bytes(b"A" * 100)
+    parcial = tmp_path / ("destino.bin" + SUFIXO_PARCIAL)
+    parcial.write_bytes(b"A" * 50)
+    (tmp_path / ("destino.bin" + SUFIXO_PARCIAL + SUFIXO_IDENTIDADE)).write_bytes(
+        path_transfer._identidade(origem)  # pylint: disable=protected-access
+    )
+    origem.write_bytes(b"B" * 100)
+    os.utime(origem, ns=(1, 1))
+
+    copiar_arquivo(origem, tmp_path / "destino.bin")
+
+    assert (tmp_path / "destino.bin").read_bytes() == b"B" * 100
+    assert not (tmp_path / ("destino.bin" + SUFIXO_PARCIAL + SUFIXO_IDENTIDADE)).exists()
+
+    # Parcial sem identidade registrada também não é reaproveitado.
+    parcial.write_bytes(b"A" * 50)
+    copiar_arquivo(origem, tmp_path / "destino.bin")
+    assert (tmp_path / "destino.bin").read_bytes() == b"B" * 100
+
+
+def test_copiar_arquivo_fallback_em_blocos(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(path_transfer, "_metodos_copia", lambda: [path_transfer._copiar_em_blocos])
+    origem = tmp_path / "origem.txt"
+    origem.write_text("conteúdo")
+    (tmp_path / "destino.txt").write_text("antigo e mais longo")
+
+    resultado = copiar_arquivo(origem, tmp_path / "destino.txt")
+
+    assert (tmp_path / "destino.txt").read_text() == "conteúdo"
+    assert resultado.destino.status == PathStatus.UPDATED
+
+
+def test_copiar_arquivo_inexistente(tmp_path: Path) -> None:
+    with pytest.raises(PathNotFoundError):
+        copiar_arquivo(tmp_path / "nada", tmp_path / "destino")
+
+
+def test_mover_arquivo(tmp_path: Path) -> None:
+    origem = tmp_path / "a.txt"
+    origem.write_text("a")
+
+    resultado = mover_arquivo(origem, tmp_path / "b" / "a.txt")
+
+    assert not origem.exists()
+    assert (tmp_path / "b" / "a.txt").read_text() == "a"
+    assert resultado.origem.status == PathStatus.DELETED
+    assert resultado.destino.status == PathStatus.CREATED
+
+
+def test_processar_lote_com_falha(tmp_path: Path) -> None:
+    pares = []
+    for i in range(20):
+        origem = tmp_path / f"{i}.txt"
+        origem.write_text(str(i))
+        pares.append((origem, tmp_path / "copia" / f"{i}.txt"))
+    pares.append((tmp_path / "inexistente.txt", tmp_path / "copia" / "x.txt"))
+
+    resultados = list(processar_lote(pares, max_workers=3))
+
+    assert len(resultados) == 21
+    assert sum(r.destino.status == PathStatus.CREATED for r in resultados) == 20
+    assert sum(r.destino.status == PathStatus.ERROR for r in resultados) == 1
+    assert (tmp_path / "copia" / "7.txt").read_text() == "7"
+
+
+def test_processar_lote_com_agendador(tmp_path: Path) -> None:
+    pares = []
+    for i in range(3):
+        origem = tmp_path / f"{i}.bin"
+        origem.write_bytes(b"x" * 1000)
+        pares.append((origem, tmp_path / "copia" / f"{i}.bin"))
+    agendador = AgendadorIO(bytes_por_segundo=2000)
+
+    inicio = time.monotonic()
+    resultados = list(processar_lote(pares, max_workers=3, agendador=agendador))
+
+    assert all(r.destino.status == PathStatus.CREATED for r in resultados)
+    # 2000 bytes na rajada inicial e 1000 à taxa de 2000 B/s.
+    assert time.monotonic() - inicio >= 0.4
+
+
+def test_mover_link_simbolico_move_o_link(tmp_path: Path) -> None:
+    alvo = tmp_path / "alvo.txt"
+    alvo.write_text("conteúdo")
+    link = tmp_path / "link.txt"
+    link.symlink_to(alvo)
+    destino = tmp_path / "movido" / "link.txt"
+
+    resultado = mover_arquivo(link, destino)
+
+    assert alvo.read_text() == "conteúdo"
+    assert not os.path.lexists(link)
+    assert destino.is_symlink() and os.readlink(destino) == str(alvo)
+    assert resultado.origem.tipo == PathType.SYMLINK
+    assert resultado.destino.tipo == PathType.SYMLINK
+    assert resultado.destino.caminho == str(destino)
+
+
+def test_copia_recorre_a_blocos_sem_suporte_a_sendfile(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def sem_suporte(*_: object) -> int:
+        raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+
+    monkeypatch.setattr(os, "copy_file_range", sem_suporte, raising=False)
+    monkeypatch.setattr(os, "sendfile", sem_suporte, raising=False)
+    origem = tmp_path / "a.bin"
+    origem.write_bytes(b"x" * 1000)
+
+    copiar_arquivo(origem, tmp_path / "b.bin")
+
+    assert (tmp_path / "b.bin").read_bytes() == b"x" * 1000
@@ -0,0 +1,121 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+import os
+from pathlib import Path
+import socket
+import stat
+import tempfile
+from typing import Iterator
+
+import pytest
+
+from controllers.scan_daemon import ClienteDaemon, ScanDaemon, iniciar_em_thread
+from tools.path_definitions import (
+    PathAlreadyExistsError,
+    PathNotFoundError,
+    PathStatus,
+    PathType,
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Sockets Unix indisponíveis"
+)
+
+
+@pytest.fixture
+def daemon() -> Iterator[ScanDaemon]:
+    # Caminho curto: sockets Unix têm limite de ~100 caracteres.
+    with tempfile.TemporaryDirectory() as diretorio:
+        servidor = iniciar_em_thread(str(Path(diretorio) / "d.sock"))
+        yield servidor
+        servidor.shutdown()
+        servidor.server_close()
+
+
+def test_listar_e_stat(daemon: ScanDaemon, tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("abc")
+    (tmp_path / "sub").mkdir()
+
+    with ClienteDaemon(daemon.caminho_socket) as cliente:
+        modelos = sorted(cliente.listar(tmp_path), key=lambda m: m.nome)
+        info = cliente.stat(tmp_path / "a.txt")
+
+    assert [(m.nome, m.tipo) for m in modelos] == [
+        ("a.txt", PathType.FILE),
+        ("sub", PathType.DIRECTORY),
+    ]
+    assert modelos[0].tamanho == 3
+    assert info.status == PathStatus.EXISTS and info.tamanho == 3
+    assert str(tmp_path / "sub") in daemon.indice_tipo[PathType.DIRECTORY]
+
+
+def test_cache_compartilhado_invalidado_pelo_mtime(daemon: ScanDaemon, tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("")
+
+    with ClienteDaemon(daemon.caminho_socket) as um, ClienteDaemon(daemon.caminho_socket) as dois:
+        assert len(um.listar(tmp_path)) == 1
+        assert len(dois.listar(tmp_path)) == 1
+        (tmp_path / "b.txt").write_text("")
+        assert {m.nome for m in dois.listar(tmp_path)} == {"a.txt", "b.txt"}
+
+
+def test_buscar_e_ler(daemon: ScanDaemon, tmp_path: Path) -> None:
+    arquivo = tmp_path / "sub" / "log.txt"
+    arquivo.parent.mkdir()
+    arquivo.write_text("zero\num alvo\ndois\n")
+
+    with ClienteDaemon(daemon.caminho_socket) as cliente:
+        ocorrencias = cliente.buscar(tmp_path, "alvo")
+        linhas = cliente.ler(arquivo, 1, 5)
+
+    assert [(o["caminho"], o["linha"]) for o in ocorrencias] == [(str(arquivo), 2)]
+    assert linhas == ["um alvo", "dois"]
+
+
+def test_erros_repassados_ao_cliente(daemon: ScanDaemon, tmp_path: Path) -> None:
+    with ClienteDaemon(daemon.caminho_socket) as cliente:
+        with pytest.raises(PathNotFoundError):
+            cliente.listar(tmp_path / "inexistente")
+        # A conexão continua utilizável após um erro.
+        assert cliente.listar(tmp_path) == []
+
+
+def test_listar_atualiza_entradas_alteradas(daemon: ScanDaemon, tmp_path: Path) -> None:
+    arquivo = tmp_path / "a.txt"
+    arquivo.write_text("abc")
+
+    with ClienteDaemon(daemon.caminho_socket) as cliente:
+        assert cliente.listar(tmp_path)[0].tamanho == 3
+        mtime_diretorio = tmp_path.stat().st_mtime_ns
+        arquivo.write_text("abcdef")
+        os.utime(arquivo, ns=(0, 10**9))
+        assert tmp_path.stat().st_mtime_ns == mtime_diretorio
+        modelo = cliente.listar(tmp_path)[0]
+
+    assert modelo.tamanho == 6 and modelo.modificado == 1.0
+    assert daemon.cache[str(arquivo)].tamanho == 6
+
+
+def test_socket_protegido_e_daemon_ativo_preservado(daemon: ScanDaemon) -> None:
+    assert stat.S_IMODE(os.stat(daemon.caminho_socket).st_mode) == 0o600
+
+    with pytest.raises(PathAlreadyExistsError):
+        ScanDaemon(daemon.caminho_socket)
+
+    with ClienteDaemon(daemon.caminho_socket) as cliente:
+        assert cliente.listar(Path(daemon.caminho_socket).parent)
+
+
+def test_socket_orfao_removido() -> None:
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = str(Path(diretorio) / "d.sock")
+        orfao = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        orfao.bind(caminho)
+        orfao.close()
+
+        servidor = ScanDaemon(caminho)
+        servidor.server_close()
+
+        (Path(diretorio) / "outro").write_text("")
+        with pytest.raises(PathAlreadyExistsError):
+            ScanDaemon(str(Path(diretorio) / "outro"))
@@ -0,0 +1,137 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+import csv
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from models import path_columnar
+from models.path_columnar import (
+    EscritorColunar,
+    exportar_csv,
+    exportar_jsonl,
+    gravar_colunar,
+    ScanColunar,
+)
+from models.path_system_model import CaminhoModel
+from tools.path_definitions import PathInvalidError, PathStatus, PathType
+
+
+def _modelos() -> list[CaminhoModel]:
+    return [
+        CaminhoModel("raiz", PathType.DIRECTORY, "/dados/raiz", PathStatus.EXISTS, 4096, 1.5),
+        CaminhoModel(
+            "a.png", PathType.FILE, "/dados/raiz/a.png", PathStatus.CREATED, 10, 2.0, "image/png"
+        ),
+        CaminhoModel("b.txt", PathType.FILE, "/dados/raiz/b.txt", PathStatus.ERROR),
+        CaminhoModel("fila", PathType.FIFO, "/dados/raiz/fila", PathStatus.UNKNOWN, 0, 3.0),
+    ]
+
+
+def test_ida_e_volta(tmp_path: Path) -> None:
+    destino = gravar_colunar(_modelos(), tmp_path / "scan.pcol")
+
+    with ScanColunar(destino) as scan:
+        assert len(scan) == 4
+        assert list(scan) == _modelos()
+        assert scan[-1].tipo == PathType.FIFO
+        assert scan.caminho(1) == "/dados/raiz/a.png"
+        with pytest.raises(IndexError):
+            _ = scan[4]
+
+
+def test_filtros_por_coluna(tmp_path: Path) -> None:
+    modelos = _modelos() * 1000
+    with ScanColunar(gravar_colunar(modelos, tmp_path / "scan.pcol")) as scan:
+        arquivos = list(scan.filtrar_tipo(PathType.FILE))
+        assert len(arquivos) == 2000
+        assert scan.tamanho_total(arquivos) == 10 * 1000
+        assert list(scan.filtrar_tipo(PathType.SOCKET)) == []
+        assert scan.tamanho_total() == (4096 + 10) * 1000
+
+
+def test_exportadores(tmp_path: Path) -> None:
+    with ScanColunar(gravar_colunar(_modelos(), tmp_path / "scan.pcol")) as scan:
+        assert exportar_csv(scan, tmp_path / "scan.csv") == 4
+        assert exportar_jsonl(scan, tmp_path / "scan.jsonl") == 4
+
+    with open(tmp_path / "scan.csv", encoding="utf-8", newline="") as entrada:
+        linhas = list(csv.DictReader(entrada))
+    assert linhas[1]["tipo_conteudo"] == "image/png"
+    assert linhas[2]["tamanho"] == ""
+
+    objetos = [json.loads(linha) for linha in (tmp_path / "scan.jsonl").read_text().splitlines()]
+    assert objetos[0] == {
+        "nome": "raiz",
+        "tipo": "Directory",
+        "caminho": "/dados/raiz",
+        "status": "existe",
+        "tamanho": 4096,
+        "modificado": 1.5,
+        "tipo_conteudo": None,
+    }
+
+
+def test_arquivo_invalido(tmp_path: Path) -> None:
+    invalido = tmp_path / "x.pcol"
+    invalido.write_bytes(b"nao e um scan")
+    with pytest.raises(PathInvalidError):
+        ScanColunar(invalido)
+    vazio = gravar_colunar([], tmp_path / "vazio.pcol")
+    with ScanColunar(vazio) as scan:
+        assert len(scan) == 0 and list(scan) == []
+
+
+def test_nomes_gravados_sem_tabela_de_strings(tmp_path: Path) -> None:
+    modelos = [
+        CaminhoModel(f"arquivo_{i}.txt", PathType.FILE, f"/dados/d{i % 3}/arquivo_{i}.txt")
+        for i in range(100)
+    ]
+    escritor = EscritorColunar(tmp_path / "scan.pcol")
+    with escritor:
+        for modelo in modelos:
+            escritor.adicionar(modelo)
+
+    # Apenas os 3 diretórios entram na tabela deduplicada.
+    assert len(escritor._strings) == 3
+    with ScanColunar(escritor.destino) as scan:
+        assert list(scan) == modelos
+        assert scan.nome(0) == "arquivo_0.txt" and scan.nome(99) == "arquivo_99.txt"
+
+
+def test_escritor_descarta_em_caso_de_erro(tmp_path: Path) -> None:
+    destino = tmp_path / "scan.pcol"
+
+    with pytest.raises(RuntimeError):
+        with EscritorColunar(destino) as escritor:
+            escritor.adicionar(_modelos()[0])
+            raise RuntimeError("varredura interrompida")
+
+    assert not destino.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_exportadores_com_nome_fora_do_utf8(tmp_path: Path) -> None:
+    nome = os.fsdecode(b"relat\xf3rio.txt")  # Latin-1 gravado no disco.
+    modelos = [CaminhoModel(nome, PathType.FILE, f"/dados/{nome}", PathStatus.EXISTS, 1, 1.0)]
+
+    with ScanColunar(gravar_colunar(modelos, tmp_path / "scan.pcol")) as scan:
+        assert scan[0].nome == nome
+        assert exportar_csv(scan, tmp_path / "scan.csv") == 1
+        assert exportar_jsonl(scan, tmp_path / "scan.jsonl") == 1
+
+    assert b"relat\xf3rio.txt" in (tmp_path / "scan.csv").read_bytes()
+    assert b"relat\xf3rio.txt" in (tmp_path / "scan.jsonl").read_bytes()
+
+
+def test_colunas_little_endian_em_qualquer_plataforma(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Simula uma máquina big-endian: gravação e leitura invertem os bytes.
+    monkeypatch.setattr(path_columnar, "_INVERTER_BYTES", True)
+
+    with ScanColunar(gravar_colunar(_modelos(), tmp_path / "scan.pcol")) as scan:
+        assert list(scan) == _modelos()
+        assert scan.tamanho_total() == 4096 + 10
@@ -0,0 +1,75 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+import os
+from pathlib import Path
+
+from models.path_snapshot import (
+    RegistroSnapshot,
+    Snapshot,
+    codificar_registros,
+    comparar_snapshots,
+    decodificar_registros,
+    gravar_snapshot,
+)
+from tools.path_definitions import PathStatus, PathType
+
+
+def _criar_arvore(raiz: Path) -> None:
+    (raiz / "docs" / "antigos").mkdir(parents=True)
+    (raiz / "docs" / "a.txt").write_text("a")
+    (raiz / "docs" / "antigos" / "b.txt").write_text("b")
+    (raiz / "c.txt").write_text("c")
+
+
+def test_codificar_e_decodificar_registros() -> None:
+    registros = [
+        RegistroSnapshot("a/b.txt", 0o100644, 10, 3, 1_000),
+        RegistroSnapshot("ação.txt", 0o040755, 11, 0, 2_000),
+    ]
+    assert list(decodificar_registros(codificar_registros(registros))) == registros
+
+
+def test_snapshot_ordenado_com_varios_lotes(tmp_path: Path) -> None:
+    arvore = tmp_path / "arvore"
+    _criar_arvore(arvore)
+
+    snapshot = Snapshot(gravar_snapshot(arvore, tmp_path / "s.snap", registros_por_lote=2))
+    caminhos = [r.caminho for r in snapshot]
+
+    assert snapshot.raiz == str(arvore.resolve())
+    assert caminhos == sorted(caminhos)
+    assert set(caminhos) == {
+        "c.txt",
+        "docs",
+        os.path.join("docs", "a.txt"),
+        os.path.join("docs", "antigos"),
+        os.path.join("docs", "antigos", "b.txt"),
+    }
+
+
+def test_comparar_snapshots(tmp_path: Path) -> None:
+    arvore = tmp_path / "arvore"
+    _criar_arvore(arvore)
+    antigo = Snapshot(gravar_snapshot(arvore, tmp_path / "antigo.snap"))
+
+    (arvore / "c.txt").unlink()
+    (arvore / "docs" / "a.txt").write_text("conteúdo maior")
+    (arvore / "novo.txt").write_text("n")
+    novo = Snapshot(gravar_snapshot(arvore, tmp_path / "novo.snap"))
+
+    resultado = {m.nome: m for m in comparar_snapshots(antigo, novo)}
+
+    assert resultado["c.txt"].status == PathStatus.DELETED
+    assert resultado["novo.txt"].status == PathStatus.CREATED
+    assert resultado["novo.txt"].tipo == PathType.FILE
+    assert resultado["a.txt"].status == PathStatus.UPDATED
+    assert resultado["a.txt"].tamanho == len("conteúdo maior".encode())
+    assert "b.txt" not in resultado
+
+
+def test_comparar_snapshots_identicos(tmp_path: Path) -> None:
+    arvore = tmp_path / "arvore"
+    _criar_arvore(arvore)
+    snapshot = Snapshot(gravar_snapshot(arvore, tmp_path / "s.snap"))
+
+    assert not list(comparar_snapshots(snapshot, snapshot))
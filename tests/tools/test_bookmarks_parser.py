@@ -0,0 +1,82 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Módulo de testes para a leitura incremental de favoritos (`bookmarks_parser`).
+
+Abrange:
+- Emissão de pastas e links com o caminho de pastas correto.
+- Leitura com blocos pequenos (tags divididas entre blocos).
+- Índice por URL, host e título, e detecção de duplicados.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.tools.bookmarks_parser import (
+    BookmarkType,
+    IndiceBookmarks,
+    ler_bookmarks,
+    normalizar_url,
+)
+from src.tools.path_definitions import PathNotFoundError
+
+BOOKMARKS_HTML = """<!DOCTYPE NETSCAPE-Bookmark-file-1>
+<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
+<TITLE>Bookmarks</TITLE>
+<H1>Bookmarks Menu</H1>
+<DL><p>
+    <DT><H3 ADD_DATE="1700000000">Python</H3>
+    <DL><p>
+        <DT><A HREF="https://docs.python.org/3/" ADD_DATE="1700000001" ICON="data:x">Python Docs</A>
+        <DT><H3>Tkinter</H3>
+        <DL><p>
+            <DT><A HREF="https://docs.python.org/3/library/tkinter.html">Tkinter &amp; Tk</A>
+        </DL><p>
+    </DL><p>
+    <DT><A HREF="https://DOCS.python.org/3">Documentação Python</A>
+    <DT><A HREF="https://github.com/DiasPedroQA">GitHub</A>
+</DL>
+"""
+
+
+@pytest.fixture(name="arquivo")
+def fixture_arquivo(tmp_path: Path) -> Path:
+    caminho = tmp_path / "bookmarks.html"
+    caminho.write_text(BOOKMARKS_HTML, encoding="utf-8")
+    return caminho
+
+
+@pytest.mark.parametrize("tamanho_bloco", [7, 1 << 16])
+def test_ler_bookmarks(arquivo: Path, tamanho_bloco: int) -> None:
+    registros = list(ler_bookmarks(arquivo, tamanho_bloco))
+
+    pastas = [r for r in registros if r.tipo == BookmarkType.FOLDER]
+    links = [r for r in registros if r.tipo == BookmarkType.LINK]
+
+    assert [p.titulo for p in pastas] == ["Python", "Tkinter"]
+    assert pastas[0].adicionado == 1700000000
+    assert pastas[1].pasta == ("Python",)
+    assert len(links) == 4
+    assert links[0].pasta == ("Python",)
+    assert links[1].titulo == "Tkinter & Tk"
+    assert links[1].pasta == ("Python", "Tkinter")
+    assert links[2].pasta == ()
+
+
+def test_ler_bookmarks_inexistente(tmp_path: Path) -> None:
+    with pytest.raises(PathNotFoundError):
+        list(ler_bookmarks(tmp_path / "bookmark.html"))
+
+
+def test_indice_bookmarks(arquivo: Path) -> None:
+    indice = IndiceBookmarks.from_path(arquivo)
+
+    assert len(indice) == 4
+    assert len(indice.por_host("docs.python.org")) == 3
+    assert [r.titulo for r in indice.buscar_titulo("python docs")] == ["Python Docs"]
+    assert indice.por_url("https://github.com/DiasPedroQA/")[0].titulo == "GitHub"
+
+    duplicados = indice.duplicados()
+    assert list(duplicados) == [normalizar_url("https://docs.python.org/3/")]
+    assert len(duplicados[normalizar_url("https://docs.python.org/3")]) == 2
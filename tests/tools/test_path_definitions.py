@@ -10,7 +10,9 @@ Abrange:
 - Simulação de uso real com uma função `main()` de exemplo.
 """
 
+import os
 from pathlib import Path
+import stat
 
 import pytest
 
@@ -38,6 +40,25 @@ def test_path_type_from_str_invalido() -> None:
     assert PathType.from_str("foo") == PathType.UNKNOWN
 
 
+def test_path_type_from_mode() -> None:
+    """Testa a classificação de tipos especiais a partir do st_mode."""
+    assert PathType.from_mode(stat.S_IFREG | 0o644) == PathType.FILE
+    assert PathType.from_mode(stat.S_IFDIR | 0o755) == PathType.DIRECTORY
+    assert PathType.from_mode(stat.S_IFLNK | 0o777) == PathType.SYMLINK
+    assert PathType.from_mode(stat.S_IFIFO | 0o600) == PathType.FIFO
+    assert PathType.from_mode(stat.S_IFSOCK | 0o600) == PathType.SOCKET
+    assert PathType.from_mode(stat.S_IFCHR | 0o600) == PathType.CHAR_DEVICE
+    assert PathType.from_mode(0) == PathType.UNKNOWN
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="mkfifo indisponível")
+def test_pathdata_from_path_fifo(tmp_path: Path) -> None:
+    """Testa que um FIFO deixa de ser classificado como UNKNOWN."""
+    fifo = tmp_path / "canal"
+    os.mkfifo(fifo)
+    assert PathData.from_path(fifo).tipo == PathType.FIFO
+
+
 def test_path_status_from_str_valido() -> None:
     """Testa valores válidos para PathStatus."""
     assert PathStatus.from_str("existe") == PathStatus.EXISTS
@@ -0,0 +1,98 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Módulo de testes para o cache de resolução de caminhos (`PathResolver`).
+
+Abrange:
+- Equivalência com `Path.expanduser().resolve()`.
+- Reaproveitamento do diretório-pai resolvido entre entradas irmãs.
+- Invalidação quando um link simbólico da cadeia muda de destino.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.tools.path_resolver import PathResolver
+
+
+def test_resolver_equivale_a_resolve(tmp_path: Path) -> None:
+    """Testa que o resultado é idêntico ao de Path.resolve()."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "x.txt").write_text("x")
+    resolver = PathResolver()
+
+    for entrada in [
+        tmp_path / "a" / "b" / "x.txt",
+        tmp_path / "a" / "b" / ".." / "b" / "x.txt",
+        tmp_path / "a" / "b" / "inexistente.txt",
+        tmp_path / "nao" / "existe",
+        tmp_path / "a" / "..",
+    ]:
+        assert resolver.resolver(entrada) == entrada.resolve()
+
+
+def test_resolver_reaproveita_pai(tmp_path: Path) -> None:
+    """Testa que irmãos no mesmo diretório compartilham uma única entrada de cache."""
+    for nome in ("um.txt", "dois.txt", "tres.txt"):
+        (tmp_path / nome).write_text(nome)
+    resolver = PathResolver()
+
+    for nome in ("um.txt", "dois.txt", "tres.txt"):
+        resolver.resolver(tmp_path / nome)
+
+    assert len(resolver) == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlink indisponível")
+def test_resolver_invalida_quando_link_muda(tmp_path: Path) -> None:
+    """Testa que a troca do destino de um link simbólico invalida o cache."""
+    (tmp_path / "destino1").mkdir()
+    (tmp_path / "destino2").mkdir()
+    link = tmp_path / "atalho"
+    link.symlink_to(tmp_path / "destino1", target_is_directory=True)
+    resolver = PathResolver()
+
+    assert resolver.resolver(link / "f.txt") == (tmp_path / "destino1" / "f.txt").resolve()
+
+    link.unlink()
+    link.symlink_to(tmp_path / "destino2", target_is_directory=True)
+
+    assert resolver.resolver(link / "f.txt") == (tmp_path / "destino2" / "f.txt").resolve()
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlink indisponível")
+def test_resolver_link_antes_de_pai(tmp_path: Path) -> None:
+    """Testa que ".." após um link simbólico sobe a partir do destino do link."""
+    (tmp_path / "real" / "sub").mkdir(parents=True)
+    (tmp_path / "real" / "x").write_text("x")
+    (tmp_path / "lnk").symlink_to(tmp_path / "real" / "sub", target_is_directory=True)
+    entrada = tmp_path / "lnk" / ".." / "x"
+
+    assert PathResolver().resolver(entrada) == entrada.resolve()
+    assert PathResolver().resolver(entrada) == (tmp_path / "real" / "x").resolve()
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlink indisponível")
+def test_resolver_componente_final_link(tmp_path: Path) -> None:
+    """Testa que um link simbólico no componente final é resolvido."""
+    (tmp_path / "real.txt").write_text("r")
+    (tmp_path / "link.txt").symlink_to(tmp_path / "real.txt")
+
+    assert PathResolver().resolver(tmp_path / "link.txt") == (tmp_path / "real.txt").resolve()
+
+
+def test_invalidar_por_prefixo(tmp_path: Path) -> None:
+    """Testa a invalidação seletiva e total do cache."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    resolver = PathResolver()
+    resolver.resolver(tmp_path / "a" / "x")
+    resolver.resolver(tmp_path / "b" / "y")
+
+    resolver.invalidar(tmp_path / "a")
+    assert len(resolver) == 1
+
+    resolver.invalidar()
+    assert len(resolver) == 0
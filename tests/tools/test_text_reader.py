@@ -0,0 +1,78 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring, useless-suppression
+
+"""
+Módulo de testes para a leitura de texto em streaming (`LeitorTexto`).
+
+Abrange:
+- Detecção de codificação por BOM e por heurística.
+- Decodificação em blocos com modos "replace" e "strict".
+- Acesso aleatório por linha com índice construído sob demanda.
+"""
+
+import codecs
+from pathlib import Path
+
+import pytest
+
+from src.tools.path_definitions import PathNotFoundError, PathOperationError
+from src.tools.text_reader import LeitorTexto, detectar_codificacao
+
+
+@pytest.mark.parametrize(
+    "amostra,esperado",
+    [
+        (codecs.BOM_UTF8 + b"abc", ("utf-8", 3)),
+        (codecs.BOM_UTF16_LE + "abc".encode("utf-16-le"), ("utf-16-le", 2)),
+        (codecs.BOM_UTF32_LE + "abc".encode("utf-32-le"), ("utf-32-le", 4)),
+        ("texto sem bom".encode("utf-16-be"), ("utf-16-be", 0)),
+        ("ação".encode("utf-8"), ("utf-8", 0)),
+        ("ação".encode("cp1252"), ("cp1252", 0)),
+        (b"\x81\x8d", ("latin-1", 0)),
+    ],
+)
+def test_detectar_codificacao(amostra: bytes, esperado: tuple[str, int]) -> None:
+    assert detectar_codificacao(amostra) == esperado
+
+
+@pytest.mark.parametrize("codificacao", ["utf-8", "utf-16", "utf-32", "cp1252"])
+def test_linhas_e_acesso_aleatorio(tmp_path: Path, codificacao: str) -> None:
+    sufixo = "ação" if codificacao == "cp1252" else "– ação"
+    linhas = [f"linha {i} {sufixo}" for i in range(50)]
+    arquivo = tmp_path / "texto.txt"
+    arquivo.write_bytes("\r\n".join(linhas).encode(codificacao))
+
+    leitor = LeitorTexto(arquivo, tamanho_bloco=16)
+
+    assert list(leitor.linhas()) == linhas
+    assert leitor.linha(37) == linhas[37]
+    assert leitor.linha(0) == linhas[0]
+    assert leitor.intervalo(48, 5) == linhas[48:]
+    assert leitor.total_linhas() == 50
+    with pytest.raises(IndexError):
+        leitor.linha(50)
+
+
+def test_linhas_longas_entre_blocos(tmp_path: Path) -> None:
+    linhas = ["a" * 1000, "", "b" * 37 + "\u00e7", "curta"]
+    arquivo = tmp_path / "longas.txt"
+    arquivo.write_text("\r\n".join(linhas) + "\n", encoding="utf-8")
+
+    assert list(LeitorTexto(arquivo, codificacao="utf-8", tamanho_bloco=16).linhas()) == linhas
+
+
+def test_blocos_modo_replace_e_strict(tmp_path: Path) -> None:
+    arquivo = tmp_path / "misto.txt"
+    arquivo.write_bytes("início ".encode() * 20 + b"\xff\xfe inv\xc3")
+
+    leitor = LeitorTexto(arquivo, codificacao="utf-8")
+    assert "".join(leitor.blocos()).endswith("�� inv�")
+
+    with pytest.raises(PathOperationError):
+        "".join(LeitorTexto(arquivo, codificacao="utf-8", erros="strict").blocos())
+
+
+def test_leitor_arquivo_inexistente(tmp_path: Path) -> None:
+    with pytest.raises(PathNotFoundError):
+        LeitorTexto(tmp_path / "nada.txt")
+    with pytest.raises(PathOperationError):
+        LeitorTexto(tmp_path)